@@ -11,28 +11,34 @@ Telegram Webhook Handler — Vercel Serverless Function
      - NEWS  → RSS 수집 → 요약 → Telegram 응답
   4. Telegram에 항상 HTTP 200 반환 (재전송 방지)
 
+WEBHOOK_MODE=queue 이면 1~3단계를 요청 안에서 하지 않고 Redis 큐에 넣은 뒤 바로 200을 반환합니다.
+큐는 worker.py가 처리합니다 (handle_update 공용).
+
 기존 main.py / indicators.py / GitHub Actions 파이프라인과 완전히 독립적입니다.
 """
 
+import hashlib
 import json
 import os
 import sys
-import urllib.parse
+import time
 import urllib.request
 from http.server import BaseHTTPRequestHandler
 
 # Vercel 환경에서 프로젝트 루트(lib/)를 import path에 추가
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from lib import idempotency, upstash
+from lib.cache import TTLCache
 from lib.intent_filter import classify_intent
+from lib.job_queue import JobQueue
 from lib.news_fetcher import fetch_news
-from lib.news_summarizer import summarize_news
+from lib.news_summarizer import is_summary, normalize_query, summarize_news
+from lib.singleflight import SingleFlight
 
 # ── 설정 ──────────────────────────────────────────────────────────────────────
 
 TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
-UPSTASH_REDIS_REST_URL = os.getenv("UPSTASH_REDIS_REST_URL", "").rstrip("/")
-UPSTASH_REDIS_REST_TOKEN = os.getenv("UPSTASH_REDIS_REST_TOKEN", "")
 ADMIN_IDS = {
     int(value.strip())
     for value in os.getenv("TELEGRAM_ADMIN_IDS", "").split(",")
@@ -43,6 +49,22 @@ APPROVED_USERS_KEY = "tg:approved_users"
 PENDING_USERS_KEY = "tg:pending_users"
 SUBSCRIBERS_KEY = "tg:subscribers"
 
+# WEBHOOK_MODE=queue: update를 Redis 큐(UPDATE_QUEUE_NAME)에 넣고 즉시 200 응답,
+# 처리는 별도 worker(python worker.py)가 담당. 큐에 넣지 못하면 inline 처리로 대체.
+WEBHOOK_MODE = os.getenv("WEBHOOK_MODE", "inline").strip().lower()
+UPDATE_QUEUE_NAME = "tg:updates"
+UPDATE_CLAIM_KEY_PREFIX = "tg:update:"
+# 처리 중 선점 유지 시간: 함수 실행 제한(30s)보다 길게. 처리 중 종료되면 이후 재전송은 다시 처리
+UPDATE_CLAIM_PENDING_TTL_SEC = 60
+
+# 승인 상태 캐시 (warm 인스턴스 내)
+#   - 승인 취소 명령이 없으므로 승인(True)은 길게, 미승인(False)은 짧게 유지
+#     (다른 인스턴스에서 /approve 된 사용자가 오래 기다리지 않도록)
+#   - APPROVAL_SNAPSHOT=1 이면 승인 목록 전체(SMEMBERS)를 인스턴스당 한 번 읽어 둠
+APPROVAL_CACHE_TTL_SEC = int(os.getenv("APPROVAL_CACHE_TTL_SEC", "600"))
+APPROVAL_NEGATIVE_TTL_SEC = int(os.getenv("APPROVAL_NEGATIVE_TTL_SEC", "30"))
+APPROVAL_SNAPSHOT = os.getenv("APPROVAL_SNAPSHOT", "0") == "1"
+
 NOT_NEWS_MESSAGE = (
     "이 봇은 최신 뉴스 동향 분석만 제공합니다.\n\n"
     "예시 질문:\n"
@@ -105,7 +127,7 @@ def _send_telegram_message(chat_id: int, text: str) -> None:
 # ── Redis / 승인 관리 ─────────────────────────────────────────────────────────
 
 def _redis_is_configured() -> bool:
-    return bool(UPSTASH_REDIS_REST_URL and UPSTASH_REDIS_REST_TOKEN)
+    return upstash.is_configured()
 
 
 def _redis_request(command: str, *args: object) -> object | None:
@@ -113,38 +135,59 @@ def _redis_request(command: str, *args: object) -> object | None:
         print("[webhook] Upstash Redis 설정이 없습니다.")
         return None
 
-    encoded_parts = [urllib.parse.quote(str(part), safe="") for part in (command, *args)]
-    url = f"{UPSTASH_REDIS_REST_URL}/{'/'.join(encoded_parts)}"
-    req = urllib.request.Request(
-        url,
-        headers={"Authorization": f"Bearer {UPSTASH_REDIS_REST_TOKEN}"},
-        method="POST",
-    )
+    return upstash.request(command, *args)
 
-    try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            payload = json.loads(resp.read().decode("utf-8"))
-    except Exception as e:
-        print(f"[webhook] Redis 요청 실패 ({command}): {e}")
-        return None
 
-    if payload.get("error"):
-        print(f"[webhook] Redis 오류 ({command}): {payload['error']}")
-        return None
+def _is_admin(user_id: int) -> bool:
+    return user_id in ADMIN_IDS
 
-    return payload.get("result")
 
+_approval_cache = TTLCache(maxsize=4096, ttl=APPROVAL_CACHE_TTL_SEC)
+_approved_snapshot: set[str] | None = None
+_approved_snapshot_loaded_at = 0.0
 
-def _is_admin(user_id: int) -> bool:
-    return user_id in ADMIN_IDS
+
+def _load_approved_snapshot() -> set[str] | None:
+    """승인 목록 전체를 APPROVAL_CACHE_TTL_SEC마다 한 번 읽어 둡니다 (실패 시 None)."""
+    global _approved_snapshot, _approved_snapshot_loaded_at
+    now = time.monotonic()
+    if _approved_snapshot is None or now - _approved_snapshot_loaded_at > APPROVAL_CACHE_TTL_SEC:
+        result = _redis_request("SMEMBERS", APPROVED_USERS_KEY)
+        if result is None:
+            return _approved_snapshot
+        _approved_snapshot = {str(member) for member in result}
+        _approved_snapshot_loaded_at = now
+    return _approved_snapshot
 
 
 def _is_approved_user(user_id: int) -> bool:
     if _is_admin(user_id):
         return True
 
+    cached = _approval_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    if APPROVAL_SNAPSHOT:
+        snapshot = _load_approved_snapshot()
+        if snapshot is not None and str(user_id) in snapshot:
+            _approval_cache.set(user_id, True)
+            return True
+
     result = _redis_request("SISMEMBER", APPROVED_USERS_KEY, user_id)
-    return bool(result == 1)
+    if result is None:
+        # Redis 오류는 캐시하지 않음
+        return False
+
+    approved = result == 1
+    _approval_cache.set(user_id, approved, ttl=None if approved else APPROVAL_NEGATIVE_TTL_SEC)
+    return approved
+
+
+def _invalidate_approval(user_id: int) -> None:
+    _approval_cache.delete(user_id)
+    if _approved_snapshot is not None:
+        _approved_snapshot.discard(str(user_id))
 
 
 def _add_pending_user(user_id: int) -> bool:
@@ -152,21 +195,23 @@ def _add_pending_user(user_id: int) -> bool:
     return bool(result == 1)
 
 
-def _remove_pending_user(user_id: int) -> None:
-    _redis_request("SREM", PENDING_USERS_KEY, user_id)
-
-
 def _approve_user(user_id: int) -> bool:
-    added = _redis_request("SADD", APPROVED_USERS_KEY, user_id)
-    if added is None:
+    # 승인 목록 추가 + 대기 목록 제거를 요청 1번으로 (원자적으로) 처리
+    results = upstash.transaction([
+        ["SADD", APPROVED_USERS_KEY, user_id],
+        ["SREM", PENDING_USERS_KEY, user_id],
+    ])
+    _invalidate_approval(user_id)
+    if results is None or results[0] is None:
         return False
 
-    _remove_pending_user(user_id)
+    _approval_cache.set(user_id, True)
     return True
 
 
 def _reject_user(user_id: int) -> bool:
     result = _redis_request("SREM", PENDING_USERS_KEY, user_id)
+    _invalidate_approval(user_id)
     return result is not None
 
 
@@ -360,6 +405,18 @@ def _handle_unapproved_user(
 
 # ── 메시지 처리 파이프라인 ────────────────────────────────────────────────────
 
+_news_flight = SingleFlight("news:query")
+
+
+def _build_news_summary(text: str) -> str:
+    # Stage 2: RSS 뉴스 수집 (relevance scoring + deduplication 포함)
+    articles = fetch_news(text, max_articles=5)
+    print(f"[webhook] 수집된 기사 수: {len(articles)}")
+
+    # Stage 3: LLM 요약
+    return summarize_news(text, articles)
+
+
 def _process_message(text: str, chat_id: int) -> None:
     """
     Intent 분류 → RSS 수집 → LLM 요약 → Telegram 응답 파이프라인.
@@ -372,17 +429,88 @@ def _process_message(text: str, chat_id: int) -> None:
         _send_telegram_message(chat_id, NOT_NEWS_MESSAGE)
         return
 
-    # Stage 2: RSS 뉴스 수집 (relevance scoring + deduplication 포함)
-    articles = fetch_news(text, max_articles=5)
-    print(f"[webhook] 수집된 기사 수: {len(articles)}")
-
-    # Stage 3: LLM 요약
-    summary = summarize_news(text, articles)
+    # Stage 2~3: 같은 질문이 이미 처리 중이면 그 결과를 기다려 재사용 (single-flight)
+    query_key = hashlib.sha1(normalize_query(text).encode("utf-8")).hexdigest()
+    # 안내·오류 메시지(기사 없음, AI 일시 장애)는 다른 인스턴스와 공유하지 않음
+    summary = _news_flight.do(query_key, lambda: _build_news_summary(text), share=is_summary)
 
     # Stage 4: Telegram 응답
     _send_telegram_message(chat_id, summary)
 
 
+# ── Update 처리 (webhook inline 모드 / 큐 worker 공용) ───────────────────────
+
+_update_queue = JobQueue(UPDATE_QUEUE_NAME)
+
+
+def _claim_update(update: dict) -> bool:
+    """
+    update_id를 처리 중으로 선점합니다. 이미 받은 update면 False (update_id가 없으면 항상 True).
+    처리가 끝나면 _complete_update로 재전송 기간(24시간) 동안 유지합니다.
+    """
+    update_id = update.get("update_id")
+    if update_id is None:
+        return True
+    return idempotency.claim(f"{UPDATE_CLAIM_KEY_PREFIX}{update_id}", ttl=UPDATE_CLAIM_PENDING_TTL_SEC)
+
+
+def _complete_update(update: dict) -> None:
+    update_id = update.get("update_id")
+    if update_id is not None:
+        idempotency.complete(f"{UPDATE_CLAIM_KEY_PREFIX}{update_id}")
+
+
+def handle_update(update: dict) -> None:
+    """Telegram Update 1건을 처리합니다. 예외는 내부에서 기록하고 삼킵니다."""
+    try:
+        # Telegram은 message 또는 edited_message를 보냄
+        message = update.get("message") or update.get("edited_message")
+        if not message:
+            return
+
+        text = message.get("text", "").strip()
+        chat_id = message.get("chat", {}).get("id")
+        user = message.get("from") or {}
+        user_id = user.get("id")
+        username = user.get("username", "")
+        first_name = user.get("first_name", "")
+
+        if not text or not chat_id or not user_id:
+            return
+
+        if _handle_admin_command(text, chat_id, user_id):
+            return
+
+        if _handle_subscription_command(text, chat_id, user_id):
+            return
+
+        if _handle_news_command(text, chat_id, user_id, username, first_name):
+            return
+
+        # /start 명령어 처리
+        command, _ = _extract_command_and_args(text)
+        if command == "/start":
+            if _is_approved_user(user_id):
+                _send_telegram_message(chat_id, START_MESSAGE)
+            else:
+                _handle_unapproved_user(chat_id, user_id, username, first_name, text)
+            return
+
+        # 다른 봇 명령어 무시
+        if text.startswith("/"):
+            return
+
+        if not _is_approved_user(user_id):
+            _handle_unapproved_user(chat_id, user_id, username, first_name, text)
+            return
+
+        # 일반 메시지 처리
+        _process_message(text, chat_id)
+
+    except Exception as e:
+        print(f"[webhook] 처리 중 예외: {e}")
+
+
 # ── Vercel Python Serverless Handler ─────────────────────────────────────────
 
 class handler(BaseHTTPRequestHandler):
@@ -396,64 +524,29 @@ class handler(BaseHTTPRequestHandler):
             content_length = int(self.headers.get("Content-Length", 0))
             body = self.rfile.read(content_length)
             update = json.loads(body)
+            if not isinstance(update, dict):
+                raise ValueError(f"update가 JSON 객체가 아닙니다 ({type(update).__name__})")
+        except Exception as e:
+            print(f"[webhook] 요청 파싱 실패: {e}")
+            # Telegram에는 항상 200 반환 (재전송 루프 방지)
+            self._respond(200, {"ok": True})
+            return
 
-            # Telegram은 message 또는 edited_message를 보냄
-            message = update.get("message") or update.get("edited_message")
-            if not message:
-                self._respond(200, {"ok": True})
-                return
-
-            text = message.get("text", "").strip()
-            chat_id = message.get("chat", {}).get("id")
-            user = message.get("from") or {}
-            user_id = user.get("id")
-            username = user.get("username", "")
-            first_name = user.get("first_name", "")
-
-            if not text or not chat_id or not user_id:
-                self._respond(200, {"ok": True})
-                return
-
-            if _handle_admin_command(text, chat_id, user_id):
-                self._respond(200, {"ok": True})
-                return
-
-            if _handle_subscription_command(text, chat_id, user_id):
-                self._respond(200, {"ok": True})
-                return
-
-            if _handle_news_command(text, chat_id, user_id, username, first_name):
-                self._respond(200, {"ok": True})
-                return
-
-            # /start 명령어 처리
-            command, _ = _extract_command_and_args(text)
-            if command == "/start":
-                if _is_approved_user(user_id):
-                    _send_telegram_message(chat_id, START_MESSAGE)
-                else:
-                    _handle_unapproved_user(chat_id, user_id, username, first_name, text)
-                self._respond(200, {"ok": True})
-                return
-
-            # 다른 봇 명령어 무시
-            if text.startswith("/"):
-                self._respond(200, {"ok": True})
-                return
-
-            if not _is_approved_user(user_id):
-                _handle_unapproved_user(chat_id, user_id, username, first_name, text)
-                self._respond(200, {"ok": True})
-                return
-
-            # 일반 메시지 처리
-            _process_message(text, chat_id)
+        # Telegram 재전송(느린 응답 후 같은 update_id)은 처리하지 않음
+        if not _claim_update(update):
+            print(f"[webhook] 중복 update 무시: update_id={update.get('update_id')}")
             self._respond(200, {"ok": True})
+            return
 
-        except Exception as e:
-            print(f"[webhook] 처리 중 예외: {e}")
-            # Telegram에는 항상 200 반환 (재전송 루프 방지)
+        # queue 모드: 큐에 넣고 바로 응답 (처리는 worker.py가 담당)
+        if WEBHOOK_MODE == "queue" and _update_queue.push(update):
+            _complete_update(update)
             self._respond(200, {"ok": True})
+            return
+
+        handle_update(update)
+        _complete_update(update)
+        self._respond(200, {"ok": True})
 
     def do_GET(self) -> None:
         """헬스체크용 GET 엔드포인트."""
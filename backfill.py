@@ -0,0 +1,160 @@
+"""
+Indicator Backfill — docs/reports 전체 리포트의 지표 표를 한 번에 다시 만듭니다.
+
+날짜마다 get_indicators_data를 부르면 (날짜 × 출처)번 30일치를 받아야 하지만,
+여기서는 지표 저장소(lib.series_store)를 한 번 갱신해 출처별 전체 기간을 쓰고
+(평소에는 새 관측값만, 처음에는 출처당 요청 1번),
+모든 리포트 날짜의 표를 lib.analytics로 한 번에 계산한 뒤 파일을 일괄 수정합니다.
+
+모드:
+  - augment (기본) : 리포트에 있던 지표는 당시 표의 기준일(MM/DD) 관측값으로 다시 계산해
+                     값은 유지하고 새 열(1주·1개월·z-score·백분위·임계값 통과)을 채움.
+                     리포트에 없던 지표(새로 추가된 지표 등)는 리포트 전날 기준으로 추가
+  - rewrite        : 모든 지표를 리포트 전날(미국 장 마감) 기준 최신 관측값으로 다시 씀 (수정치 반영)
+
+실행:
+  python backfill.py --dry-run                 # 바뀔 리포트만 출력
+  python backfill.py                           # 모든 리포트 수정
+  python backfill.py --mode rewrite --since 2026-06-01 --until 2026-06-30
+  python backfill.py --offline                 # 출처 요청 없이 저장된 시계열만 사용
+"""
+
+import argparse
+import os
+import re
+import time
+from datetime import date, timedelta
+
+import pandas as pd
+from dotenv import load_dotenv
+from fredapi import Fred
+
+load_dotenv()
+
+import indicators  # noqa: E402
+from lib import analytics, series_store  # noqa: E402
+from lib.report_nav import REPORTS_DIR, ReportIndex  # noqa: E402
+
+# 지표 표: 제목 줄 + 표 줄 (create_and_save_report가 쓴 형식)
+_TABLE_RE = re.compile(r"^### 📊 시장 주요 지표[^\n]*\n(?:\|[^\n]*\n)*", re.MULTILINE)
+_UNAVAILABLE_LINE = "⚠️ 지표 데이터를 불러올 수 없습니다.\n"
+_ROW_RE = re.compile(r"^\| \[[^\]]+\]\((?P<link>[^)]+)\) \((?P<month>\d{2})/(?P<day>\d{2})\)", re.MULTILINE)
+_KEY_BY_LINK = {link: key for key, link in indicators.CHART_LINKS.items()}
+
+
+def _table_span(content: str):
+    match = _TABLE_RE.search(content)
+    if match:
+        return match.start(), match.end()
+    start = content.find(_UNAVAILABLE_LINE)
+    if start >= 0:
+        return start, start + len(_UNAVAILABLE_LINE)
+    return None
+
+
+def _reported_dates(table: str, report_date: date) -> dict:
+    """당시 표의 지표별 기준일 {key: date}. MM/DD가 리포트 날짜보다 뒤면 전년도."""
+    dates = {}
+    for match in _ROW_RE.finditer(table):
+        key = _KEY_BY_LINK.get(match.group("link"))
+        if key is None:
+            continue
+        observed = date(report_date.year, int(match.group("month")), int(match.group("day")))
+        if observed > report_date:
+            observed = observed.replace(year=observed.year - 1)
+        dates[key] = observed
+    return dates
+
+
+def _as_of(report_date: date, reported: dict, mode: str) -> dict:
+    # 아침(KST) 실행 시점에 알 수 있던 마지막 미국 날짜 = 리포트 전날
+    default = report_date - timedelta(days=1)
+    return {
+        key: reported.get(key, default) if mode == "augment" else default
+        for key in indicators.INDICATORS
+    }
+
+
+def _load_history(offline: bool) -> pd.DataFrame:
+    conn = series_store.connect()
+    try:
+        if not offline:
+            fred_key = os.getenv("FRED_API_KEY")
+            if not fred_key:
+                raise SystemExit("⚠️ FRED_API_KEY가 설정되지 않았습니다 (--offline으로 저장된 시계열만 사용 가능).")
+            changed = indicators.update_series_store(conn, Fred(api_key=fred_key))
+            print(f"[backfill] 지표 저장소 갱신: {', '.join(f'{sym} +{n}' for sym, n in changed.items()) or '없음'}")
+        return indicators.load_history(conn)
+    finally:
+        conn.close()
+
+
+def run(mode: str = "augment", since: str = None, until: str = None, dry_run: bool = False,
+        offline: bool = False, reports_dir: str = REPORTS_DIR) -> list:
+    """수정한(dry_run이면 수정할) 리포트 날짜 목록을 반환합니다."""
+    started = time.monotonic()
+    report_dates = [
+        day for day in sorted(ReportIndex(reports_dir).dates())
+        if (since is None or day >= since) and (until is None or day <= until)
+    ]
+
+    # 1. 리포트별 현재 표와 지표별 기준일
+    reports = []
+    for day in report_dates:
+        path = os.path.join(reports_dir, f"{day}.md")
+        with open(path, "r", encoding="utf-8") as f:
+            content = f.read()
+        span = _table_span(content)
+        if span is None:
+            print(f"[backfill] {day}: 지표 표가 없어 건너뜁니다.")
+            continue
+        report_date = date.fromisoformat(day)
+        as_of = _as_of(report_date, _reported_dates(content[span[0]:span[1]], report_date), mode)
+        reports.append((day, path, content, span, as_of))
+    if not reports:
+        print("[backfill] 대상 리포트가 없습니다.")
+        return []
+
+    # 2. 전체 이력 분석 1번 + 필요한 모든 기준일의 표를 한 번에
+    history = _load_history(offline)
+    if history.empty:
+        # 처음 실행·캐시 miss인데 --offline이거나 출처가 모두 실패 → 모든 표가 "불러올 수 없음"이 됨
+        raise SystemExit("⚠️ 저장된 지표 시계열이 없습니다 (--offline 없이 실행해 저장소를 먼저 채우세요).")
+    result = indicators.analyze_history(history)
+    needed = sorted({day for *_, as_of in reports for day in as_of.values()})
+    snaps = analytics.snapshots(result, needed)
+
+    # 3. 리포트별 표 교체
+    changed = []
+    for day, path, content, (start, end), as_of in reports:
+        data = indicators.summarize_table(analytics.pick(snaps, as_of))
+        table = indicators.format_to_markdown(data, today=day)
+        # format_to_markdown 끝의 빈 줄은 기존 리포트의 표 뒤 공백으로 이미 있음
+        if table.endswith("\n\n"):
+            table = table[:-1]
+        updated = content[:start] + table + content[end:]
+        if updated == content:
+            continue
+        changed.append(day)
+        if not dry_run:
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(updated)
+
+    verb = "수정 예정" if dry_run else "수정"
+    print(f"[backfill] 리포트 {len(reports)}개 중 {len(changed)}개 {verb} "
+          f"({mode}, {time.monotonic() - started:.1f}s)")
+    return changed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="리포트 지표 표 일괄 재생성")
+    parser.add_argument("--mode", choices=("augment", "rewrite"), default="augment",
+                        help="augment: 당시 기준일 유지 + 새 열·지표 추가, rewrite: 리포트 전날 기준으로 다시 씀")
+    parser.add_argument("--since", help="이 날짜(YYYY-MM-DD) 이후 리포트만")
+    parser.add_argument("--until", help="이 날짜(YYYY-MM-DD) 이전 리포트만")
+    parser.add_argument("--dry-run", action="store_true", help="파일을 수정하지 않고 대상만 출력")
+    parser.add_argument("--offline", action="store_true", help="출처 요청 없이 저장된 시계열만 사용")
+    args = parser.parse_args()
+    changed = run(args.mode, args.since, args.until, args.dry_run, args.offline)
+    if args.dry_run and changed:
+        print("\n".join(changed))
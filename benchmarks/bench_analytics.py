@@ -0,0 +1,140 @@
+"""
+Analytics benchmark — lib.analytics 벡터화 계산 vs 관측값 단위 Python 루프
+
+측정 항목:
+  - compute   : 전체 기간 변화·z-score·백분위·임계값 통과 계산 시간 (기간 × 지표 수별)
+  - snapshot  : 최신 지표 표 한 개
+  - snapshots : 모든 영업일의 지표 표 (리포트 일괄 재생성 규모)
+  - baseline  : 같은 지표(전일 변화, z-score, 백분위)를 관측값마다 Python 루프로 계산한 시간과
+                최대 오차 (작은 규모에서만, --baseline-cells 이하)
+
+데이터는 seed 고정 random walk이며, 지표마다 관측일 일부를 빼서 휴일이 다른 출처를 흉내냅니다.
+
+실행:
+  python -m benchmarks.bench_analytics
+  python -m benchmarks.bench_analytics --years 1 10 30 --series 4 24 48 --json out.json
+"""
+
+import argparse
+import json
+import statistics
+import time
+
+import numpy as np
+import pandas as pd
+
+from lib import analytics
+
+
+def synthetic_frame(years: int, series: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    index = pd.bdate_range(end="2026-10-16", periods=years * 261)
+    values = 10 + np.cumsum(rng.normal(0, 0.1, size=(len(index), series)), axis=0)
+    # 지표별로 관측일의 3%를 비움 (출처마다 휴일이 다름)
+    values[rng.random(values.shape) < 0.03] = np.nan
+    return pd.DataFrame(values, index=index, columns=[f"S{i:02d}" for i in range(series)])
+
+
+def _thresholds(frame: pd.DataFrame) -> dict:
+    return {symbol: float(frame[symbol].median()) for symbol in frame.columns}
+
+
+def _time(fn, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def _baseline(frame: pd.DataFrame) -> dict:
+    """관측값마다 Python 루프로 계산하는 기준 구현 (전일 변화, 365일 z-score, 전체 이력 백분위)."""
+    out = {"chg_1d": {}, "z": {}, "pct": {}}
+    window = pd.Timedelta(analytics.ZSCORE_WINDOW)
+    for symbol in frame.columns:
+        series = frame[symbol].dropna()
+        dates, values = list(series.index), list(series.to_numpy())
+        chg, z, pct = {}, {}, {}
+        start = 0
+        for i, (day, value) in enumerate(zip(dates, values)):
+            if i:
+                chg[day] = value - values[i - 1]
+            while dates[start] <= day - window:
+                start += 1
+            recent = values[start:i + 1]
+            if len(recent) >= analytics.ZSCORE_MIN_PERIODS:
+                mean = sum(recent) / len(recent)
+                std = (sum((v - mean) ** 2 for v in recent) / (len(recent) - 1)) ** 0.5
+                if std > 0:
+                    z[day] = (value - mean) / std
+            below = sum(1 for v in values[:i + 1] if v < value)
+            equal = sum(1 for v in values[:i + 1] if v == value)
+            pct[day] = (below + (equal + 1) / 2) / (i + 1) * 100
+        out["chg_1d"][symbol], out["z"][symbol], out["pct"][symbol] = chg, z, pct
+    return out
+
+
+def _max_error(result: pd.DataFrame, baseline: dict) -> float:
+    worst = 0.0
+    for metric, by_symbol in baseline.items():
+        for symbol, expected in by_symbol.items():
+            if not expected:
+                continue
+            actual = result[metric][symbol].reindex(list(expected)).to_numpy()
+            worst = max(worst, float(np.nanmax(np.abs(actual - np.array(list(expected.values()))))))
+    return worst
+
+
+def run(years_list: list, series_list: list, repeat: int, baseline_cells: int) -> dict:
+    report = {"rows": []}
+    for years in years_list:
+        for series in series_list:
+            frame = synthetic_frame(years, series)
+            thresholds = _thresholds(frame)
+            result = analytics.compute(frame, thresholds)
+            dates = frame.index
+
+            row = {
+                "years": years,
+                "series": series,
+                "observations": int(frame.notna().to_numpy().sum()),
+                "compute_ms": round(_time(lambda: analytics.compute(frame, thresholds), repeat) * 1000, 2),
+                "snapshot_ms": round(_time(lambda: analytics.snapshot(result), repeat) * 1000, 2),
+                "snapshots_ms": round(_time(lambda: analytics.snapshots(result, dates), repeat) * 1000, 2),
+                "snapshots_dates": len(dates),
+            }
+            if frame.size <= baseline_cells:
+                start = time.perf_counter()
+                baseline = _baseline(frame)
+                row["baseline_ms"] = round((time.perf_counter() - start) * 1000, 2)
+                row["baseline_max_error"] = _max_error(result, baseline)
+            report["rows"].append(row)
+    return report
+
+
+def _print_report(report: dict) -> None:
+    print(f"{'years':>6} {'series':>7} {'obs':>10} {'compute ms':>11} {'snapshot ms':>12} "
+          f"{'all days ms':>12} {'loop ms':>10} {'max err':>9}")
+    for row in report["rows"]:
+        loop = f"{row['baseline_ms']:>10.1f}" if "baseline_ms" in row else f"{'-':>10}"
+        error = f"{row['baseline_max_error']:>9.1e}" if "baseline_max_error" in row else f"{'-':>9}"
+        print(f"{row['years']:>6} {row['series']:>7} {row['observations']:>10} {row['compute_ms']:>11.1f} "
+              f"{row['snapshot_ms']:>12.2f} {row['snapshots_ms']:>12.1f} {loop} {error}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="lib.analytics 지표 분석 벤치마크")
+    parser.add_argument("--years", type=int, nargs="+", default=[1, 10, 30], help="일별 이력 기간 (년)")
+    parser.add_argument("--series", type=int, nargs="+", default=[4, 24, 48], help="지표 수")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--baseline-cells", type=int, default=3000,
+                        help="Python 루프 기준 구현을 실행할 최대 (날짜 × 지표) 크기")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON으로 저장")
+    args = parser.parse_args()
+
+    result = run(args.years, args.series, args.repeat, args.baseline_cells)
+    _print_report(result)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
@@ -0,0 +1,440 @@
+"""
+Pipeline benchmark — 일일 파이프라인(main.py) 전체를 로컬 대역(benchmarks.standins)으로 실행
+
+측정 항목:
+  - 단계별 시작 시각·소요 시간 (news, indicators, subscribers, analysis, report, nav, deploy, telegram)
+  - 전체 소요 시간 (run_stages) 과 main import 시간
+  - 단계 제한 시간 초과 : Stage timeout보다 오래 걸린 단계 (over_budget)
+  - 최대 메모리 : 프로세스 최대 RSS, --tracemalloc이면 Python 할당 최대치도
+  - 대역 요청 수 : 피드 요청, 모델별 LLM 호출, 텔레그램 전송·차단, FRED 요청, 사이트 빌드 방식
+
+시나리오:
+  - baseline        : 피드 0.05s, LLM 0.5s, 텔레그램 0.02s, FRED·Yahoo 0.1s 지연, 구독자 100명
+  - slow_feeds      : 피드 응답마다 2s
+  - model_failover  : MODEL_PRIORITY 앞 2개 모델 실패
+  - llm_outage      : 모든 모델 실패 (제목 기반 요약으로 대체)
+  - subscribers_10k : 구독자 10,000명. 전송 속도 제한(30/s)은 그대로 두고 broadcaster의 시계만
+                      4배 빠르게 실행 (ScaledClock). telegram 단계 시간은 실제 시계 기준으로 환산해 기록
+  - cold_store      : 지표 저장소 없이 시작 (출처별 전체 기간 수집)
+
+시나리오마다 별도 프로세스에서 실행하므로 모듈 상태(LLM health, 피드 캐시, Redis)와 최대 RSS가
+섞이지 않습니다. 사이트는 임시 디렉터리에 복사한 docs/로 빌드하며, 전날 리포트까지 미리 빌드해 두어
+실제 실행처럼 증분 빌드가 됩니다 (gh-pages 배포는 하지 않음).
+
+실행:
+  python -m benchmarks.bench_pipeline
+  python -m benchmarks.bench_pipeline --scenarios baseline slow_feeds --json out.json
+  python -m benchmarks.bench_pipeline --repeat 3 --compare baseline.json --tolerance 0.2   # 회귀 시 종료 코드 1
+"""
+
+import argparse
+import asyncio
+import contextlib
+import functools
+import inspect
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from unittest import mock
+
+from benchmarks.feeds import DEFAULT_FEEDS_DIR
+from benchmarks.standins import FakeFred, FakeGenAI, FeedServer, ScaledClock, TelegramServer, fake_yf_download
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+STAGES = ("news", "indicators", "subscribers", "analysis", "report", "nav", "deploy", "telegram")
+SUBSCRIBERS_KEY = "tg:subscribers"
+TELEGRAM_RATE_PER_SEC = 30.0
+
+DEFAULTS = {
+    "feed_latency": 0.05,
+    "llm_latency": 0.5,
+    "telegram_latency": 0.02,
+    "fred_latency": 0.1,
+    "subscribers": 100,
+    "blocked_ratio": 0.02,
+    "failing_models": 0,
+    "clock_scale": 1,
+    "warm_store": True,
+}
+SCENARIOS = {
+    "baseline": {},
+    "slow_feeds": {"feed_latency": 2.0},
+    "model_failover": {"failing_models": 2},
+    "llm_outage": {"failing_models": -1},
+    # 로컬 대역의 전송 처리량(약 150/s)보다 30/s × scale이 작아야 rate limit이 병목으로 남음
+    "subscribers_10k": {"subscribers": 10_000, "clock_scale": 4},
+    "cold_store": {"warm_store": False},
+}
+
+# 회귀 판정에서 무시하는 절대 차이 (짧은 단계의 측정 잡음)
+_MIN_DELTA_SEC = 0.25
+_MIN_DELTA_MB = 5.0
+
+
+def _scenario_params(name: str) -> dict:
+    return {**DEFAULTS, **SCENARIOS[name]}
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux는 KB, macOS는 byte 단위
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+# ── 준비 (부모 프로세스) ──────────────────────────────────────────────────────
+
+def _prepare(root: str, site: bool, feeds_dir: str) -> str:
+    """
+    시나리오마다 복사해 쓸 작업 디렉터리 원본을 만듭니다.
+    docs/ + mkdocs.yml + hook, 최근 사흘 리포트, 그제까지 채운 지표 저장소, (site면) 미리 빌드한 사이트.
+    """
+    from indicators import update_series_store
+    from lib import series_store, site_publisher
+    from lib.report_nav import ReportIndex
+
+    template = os.path.join(root, "template")
+    os.makedirs(os.path.join(template, "lib"))
+    shutil.copytree(os.path.join(REPO_ROOT, "docs"), os.path.join(template, "docs"))
+    shutil.copy(os.path.join(REPO_ROOT, "mkdocs.yml"), template)
+    for hook in ("report_nav.py", "search_shards.py"):
+        shutil.copy(os.path.join(REPO_ROOT, "lib", hook), os.path.join(template, "lib"))
+
+    # 오늘 실행 직전 상태: 최근 사흘 리포트까지 있음 (최신 리포트 내용을 복사)
+    # 이번 달 리포트가 1건뿐이면 nav 항목 간격을 알 수 없어 증분 빌드가 전체 빌드로 대체됨
+    reports_dir = os.path.join(template, "docs", "reports")
+    today = datetime.now()
+    dates = ReportIndex(reports_dir).dates()
+    for days in (3, 2, 1):
+        day = (today - timedelta(days=days)).strftime("%Y-%m-%d")
+        if dates and day not in dates:
+            shutil.copy(os.path.join(reports_dir, f"{dates[0]}.md"), os.path.join(reports_dir, f"{day}.md"))
+
+    end = (today - timedelta(days=2)).strftime("%Y-%m-%d")
+    conn = series_store.connect(os.path.join(template, ".cache", "series.sqlite3"))
+    try:
+        with mock.patch("indicators.yf.download", fake_yf_download(end=end)):
+            update_series_store(conn, FakeFred(end=end))
+    finally:
+        conn.close()
+
+    if site:
+        with contextlib.redirect_stdout(sys.stderr):
+            site_publisher.build(os.path.join(template, "mkdocs.yml"), full=True)
+    print(f"[bench_pipeline] 준비 완료: 리포트 {len(ReportIndex(reports_dir))}건, "
+          f"피드 {'recorded' if os.path.isdir(feeds_dir) else 'synthetic'}", file=sys.stderr)
+    return template
+
+
+def _run_once(name: str, template: str, workdir: str, args) -> dict:
+    shutil.copytree(template, workdir)
+    params = _scenario_params(name)
+    if not params["warm_store"]:
+        os.remove(os.path.join(workdir, ".cache", "series.sqlite3"))
+
+    out = workdir + ".json"
+    cmd = [sys.executable, "-m", "benchmarks.bench_pipeline", "--child", name, "--out", out,
+           "--feeds", args.feeds]
+    if not args.site:
+        cmd.append("--no-site")
+    if args.tracemalloc:
+        cmd.append("--tracemalloc")
+
+    env = dict(os.environ)
+    env.update({
+        "PYTHONPATH": os.pathsep.join(filter(None, [REPO_ROOT, env.get("PYTHONPATH")])),
+        "GEMINI_API_KEY": "bench",
+        "FRED_API_KEY": "bench",
+        "UPSTASH_BACKEND": "local",
+        "FEED_CACHE_BACKEND": "memory",
+        "SERIES_STORE_PATH": os.path.join(workdir, ".cache", "series.sqlite3"),
+    })
+    for key in ("SITE_FULL_BUILD", "SITE_VERIFY_BUILD", "GEMINI_COMBINED_GENERATION"):
+        env.pop(key, None)
+
+    output = None if args.verbose else subprocess.DEVNULL
+    proc = subprocess.run(cmd, cwd=workdir, env=env, stdout=output, stderr=output)
+    if not os.path.exists(out):
+        return {"ok": False, "error": f"벤치마크 프로세스 종료 코드 {proc.returncode}", "params": params}
+    with open(out, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _median_runs(runs: list) -> dict:
+    """반복 실행 결과를 항목별 중앙값으로 합칩니다 (횟수·카운터는 첫 실행 기준)."""
+    merged = json.loads(json.dumps(runs[0]))
+    merged["runs"] = [run.get("total_s") for run in runs]
+    if not all("stages" in run for run in runs):
+        return merged
+    for key in ("import_s", "total_s", "peak_rss_mb", "tracemalloc_peak_mb"):
+        if key in merged:
+            merged[key] = statistics.median(run[key] for run in runs)
+    for stage, timing in merged["stages"].items():
+        samples = [run["stages"][stage]["seconds"] for run in runs if run["stages"][stage]["seconds"] is not None]
+        if samples:
+            timing["seconds"] = statistics.median(samples)
+    merged["ok"] = all(run["ok"] for run in runs)
+    return merged
+
+
+def _run_scenario(name: str, template: str, root: str, args) -> dict:
+    runs = []
+    for i in range(args.repeat):
+        print(f"[bench_pipeline] {name} 실행 중 ({i + 1}/{args.repeat})...", file=sys.stderr)
+        runs.append(_run_once(name, template, os.path.join(root, f"{name}-{i}"), args))
+    return _median_runs(runs)
+
+
+def run(names: list, args) -> dict:
+    report = {
+        "meta": {
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "site": args.site,
+            "tracemalloc": args.tracemalloc,
+            "repeat": args.repeat,
+        },
+        "scenarios": {},
+    }
+    with tempfile.TemporaryDirectory(prefix="bench_pipeline_") as root:
+        template = _prepare(root, args.site, args.feeds)
+        for name in names:
+            report["scenarios"][name] = _run_scenario(name, template, root, args)
+    return report
+
+
+# ── 시나리오 실행 (자식 프로세스, cwd = 작업 디렉터리) ─────────────────────────
+
+def _timed(stage, timings: dict, origin: float, scale: float = 1) -> None:
+    """
+    stage.func를 감싸 시도 횟수, 첫 시작 시각, 마지막 종료까지의 시간을 기록합니다.
+    scale: 이 단계가 ScaledClock으로 실행되면 그 배율 (시간을 실제 시계 기준으로 환산)
+    run_stages의 timeout은 빨라지지 않은 시계로 동작하므로, 환산 시간이 Stage timeout을 넘으면
+    실패 대신 over_budget으로 표시합니다 (실제 실행이었다면 timeout).
+    """
+    func = stage.func
+    record = timings.setdefault(stage.name, {
+        "start_s": None, "seconds": None, "attempts": 0, "ok": False,
+        "timeout": stage.timeout, "over_budget": False, "clock_scale": scale,
+    })
+
+    def begin():
+        record["attempts"] += 1
+        if record["start_s"] is None:
+            record["start_s"] = round(time.perf_counter() - origin, 4)
+
+    def end(ok: bool):
+        record["seconds"] = round((time.perf_counter() - origin - record["start_s"]) * scale, 4)
+        record["ok"] = ok
+        record["over_budget"] = stage.timeout is not None and record["seconds"] > stage.timeout
+
+    if inspect.iscoroutinefunction(func):
+        async def wrapped(**kwargs):
+            begin()
+            try:
+                result = await func(**kwargs)
+            except BaseException:
+                end(False)
+                raise
+            end(True)
+            return result
+    else:
+        def wrapped(**kwargs):
+            begin()
+            try:
+                result = func(**kwargs)
+            except BaseException:
+                end(False)
+                raise
+            end(True)
+            return result
+
+    stage.func = wrapped
+
+
+def _child(name: str, out: str, site: bool, feeds_dir: str, trace: bool) -> None:
+    params = _scenario_params(name)
+    if trace:
+        tracemalloc.start()
+
+    started = time.perf_counter()
+    from telegram import Bot
+
+    import indicators
+    import main
+    from lib import broadcaster, llm_client, site_publisher, upstash
+    from lib.pipeline import StageError, run_stages
+    import_s = time.perf_counter() - started
+
+    failing = params["failing_models"]
+    failing_models = llm_client.MODEL_PRIORITY if failing < 0 else llm_client.MODEL_PRIORITY[:failing]
+    chat_ids = [str(10_000_000 + i) for i in range(params["subscribers"])]
+    blocked = chat_ids[:int(len(chat_ids) * params["blocked_ratio"])]
+
+    genai = FakeGenAI(latency=params["llm_latency"], failing=failing_models)
+    fred = FakeFred(latency=params["fred_latency"])
+    builds = []
+    result = {"ok": True, "error": None, "params": params, "import_s": round(import_s, 4)}
+
+    def build(*build_args, **kwargs):
+        mode = original_build(*build_args, **kwargs)
+        builds.append(mode)
+        return mode
+
+    original_build = site_publisher.build
+
+    with contextlib.ExitStack() as stack:
+        feeds = stack.enter_context(FeedServer(feeds_dir, latency=params["feed_latency"]))
+        scale = params["clock_scale"]
+        telegram = stack.enter_context(TelegramServer(latency=params["telegram_latency"] / scale, blocked=blocked))
+        if scale != 1:
+            stack.enter_context(ScaledClock(scale).patch(broadcaster))
+
+        stack.enter_context(mock.patch.object(llm_client, "_configure", lambda: genai))
+        stack.enter_context(mock.patch.object(main, "DAILY_RSS_SOURCES", feeds.sources()))
+        stack.enter_context(mock.patch.object(main, "GEMINI_API_KEY", "bench"))
+        stack.enter_context(mock.patch.object(main, "TELEGRAM_TOKEN", "123:bench"))
+        stack.enter_context(mock.patch.object(main, "CHAT_ID", None))
+        stack.enter_context(mock.patch.object(main, "Bot", functools.partial(Bot, base_url=telegram.base_url)))
+        stack.enter_context(mock.patch.object(indicators, "Fred", lambda api_key=None: fred))
+        stack.enter_context(mock.patch.object(indicators.yf, "download", fake_yf_download(params["fred_latency"])))
+        if site:
+            stack.enter_context(mock.patch.object(site_publisher, "build", build))
+            stack.enter_context(mock.patch.object(site_publisher, "deploy", lambda *a, **kw: None))
+        else:
+            stack.enter_context(mock.patch.object(site_publisher, "publish", lambda *a, **kw: "skipped"))
+
+        if chat_ids:
+            upstash.request("SADD", SUBSCRIBERS_KEY, *chat_ids)
+
+        stages = main.build_daily_stages()
+        timings = {}
+        origin = time.perf_counter()
+        for stage in stages:
+            # broadcaster 시계를 빠르게 돌리면 영향을 받는 단계는 telegram뿐
+            _timed(stage, timings, origin, scale if stage.name == "telegram" else 1)
+        try:
+            outputs = asyncio.run(run_stages(stages))
+        except StageError as e:
+            outputs = {}
+            result.update(ok=False, error=str(e))
+        # telegram은 마지막 단계이므로 빨라진 만큼을 더하면 실제 시계 기준 전체 시간
+        saved = sum(t["seconds"] * (1 - 1 / t["clock_scale"]) for t in timings.values() if t["seconds"])
+        result["total_s"] = round(time.perf_counter() - origin + saved, 4)
+
+    sent = outputs.get("telegram") or {}
+    result["stages"] = timings
+    result["peak_rss_mb"] = round(_peak_rss_mb(), 1)
+    if trace:
+        result["tracemalloc_peak_mb"] = round(tracemalloc.get_traced_memory()[1] / (1024 * 1024), 1)
+    result["counters"] = {
+        "feed_requests": feeds.requests,
+        "feeds": feeds.kind,
+        "llm_calls": {model: genai.calls.count(model) for model in dict.fromkeys(genai.calls)},
+        "fred_requests": fred.requests,
+        "telegram_requests": telegram.requests,
+        "delivered": sent.get("delivered"),
+        "blocked": sent.get("blocked"),
+        "failed": sent.get("failed"),
+        "site_build": builds[-1] if builds else ("skipped" if not site else None),
+    }
+    result["telegram_floor_s"] = round(len(chat_ids) / TELEGRAM_RATE_PER_SEC, 1)
+
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(result, f, ensure_ascii=False, indent=2)
+
+
+# ── 결과 출력·비교 ────────────────────────────────────────────────────────────
+
+def _print_report(report: dict) -> None:
+    header = f"{'scenario':<16} {'total s':>8} " + " ".join(f"{stage[:9]:>9}" for stage in STAGES)
+    print(header + f" {'RSS MB':>7}  note")
+    for name, row in report["scenarios"].items():
+        if "stages" not in row:
+            print(f"{name:<16} {'-':>8}  ❌ {row['error']}")
+            continue
+        cells = []
+        for stage in STAGES:
+            seconds = row["stages"].get(stage, {}).get("seconds")
+            cells.append(f"{seconds:>9.2f}" if seconds is not None else f"{'-':>9}")
+        counters = row["counters"]
+        note = (f"llm {sum(counters['llm_calls'].values())}회, 전송 {counters['delivered']}"
+                f"/차단 {counters['blocked']}/실패 {counters['failed']}, 빌드 {counters['site_build']}")
+        over = [stage for stage, timing in row["stages"].items() if timing.get("over_budget")]
+        if over:
+            note += f", ⚠️ 제한 시간 초과: {', '.join(over)}"
+        if not row["ok"]:
+            note = f"❌ {row['error']}"
+        print(f"{name:<16} {row['total_s']:>8.2f} {' '.join(cells)} {row['peak_rss_mb']:>7.1f}  {note}")
+
+
+def _metrics(row: dict) -> dict:
+    metrics = {"total_s": row.get("total_s"), "peak_rss_mb": row.get("peak_rss_mb")}
+    for stage, timing in row.get("stages", {}).items():
+        metrics[f"{stage}_s"] = timing["seconds"]
+    return metrics
+
+
+def compare(report: dict, baseline: dict, tolerance: float) -> list:
+    """baseline 대비 tolerance(비율) 넘게 느려지거나 메모리가 늘어난 항목 목록."""
+    regressions = []
+    for name, row in report["scenarios"].items():
+        before = baseline.get("scenarios", {}).get(name)
+        if before is None:
+            continue
+        if before.get("ok") and not row.get("ok"):
+            regressions.append(f"{name}: 실패 ({row.get('error')})")
+        old, new = _metrics(before), _metrics(row)
+        for metric, value in new.items():
+            previous = old.get(metric)
+            if value is None or previous is None:
+                continue
+            floor = _MIN_DELTA_MB if metric == "peak_rss_mb" else _MIN_DELTA_SEC
+            if value > previous * (1 + tolerance) and value - previous > floor:
+                regressions.append(f"{name}.{metric}: {previous} → {value} (+{(value / previous - 1) * 100:.0f}%)"
+                                   if previous else f"{name}.{metric}: {previous} → {value}")
+    return regressions
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="일일 파이프라인 오프라인 벤치마크")
+    parser.add_argument("--scenarios", nargs="+", choices=list(SCENARIOS), default=list(SCENARIOS))
+    parser.add_argument("--feeds", default=DEFAULT_FEEDS_DIR, help="녹화 피드 디렉터리 (없으면 synthetic 피드)")
+    parser.add_argument("--no-site", dest="site", action="store_false", help="사이트 빌드 단계 생략")
+    parser.add_argument("--tracemalloc", action="store_true", help="Python 할당 최대치 측정 (실행이 느려짐)")
+    parser.add_argument("--repeat", type=int, default=1, help="시나리오별 반복 횟수 (결과는 중앙값)")
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON으로 저장")
+    parser.add_argument("--compare", metavar="PATH", help="이전 --json 결과와 비교")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="회귀로 판정할 증가 비율")
+    parser.add_argument("--verbose", action="store_true", help="파이프라인 출력 표시")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    parser.add_argument("--out", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(args.child, args.out, args.site, args.feeds, args.tracemalloc)
+        sys.exit(0)
+
+    result = run(args.scenarios, args)
+    _print_report(result)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            regressions = compare(result, json.load(f), args.tolerance)
+        if regressions:
+            print("\n성능 회귀:")
+            print("\n".join(f"  - {line}" for line in regressions))
+            sys.exit(1)
+        print(f"\n회귀 없음 (tolerance {args.tolerance:.0%})")
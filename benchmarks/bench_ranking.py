@@ -0,0 +1,129 @@
+"""
+Ranking benchmark — legacy 스코어러(전체 정렬) vs BM25(heap top-k)
+
+측정 항목:
+  - 속도   : 질문당 스코어링 + 상위 k개 선택 시간 (corpus 크기별)
+  - 안정성 : 두 스코어러의 최종 결과(중복 제거 후 top-k) overlap@k,
+             피드 순서를 섞었을 때 BM25 결과가 그대로인지
+
+실행:
+  python -m benchmarks.bench_ranking
+  python -m benchmarks.bench_ranking --feeds benchmarks/recorded_feeds --scales 1 10 50 --json out.json
+"""
+
+import argparse
+import itertools
+import json
+import random
+import statistics
+import time
+
+from benchmarks.feeds import DEFAULT_FEEDS_DIR, load_corpus
+from lib.news_fetcher import _extract_keywords, _select_articles
+from lib.ranking import iter_ranked, rank_articles
+
+QUERIES = [
+    "엔비디아 최신 뉴스",
+    "미국 금리 동향",
+    "Nvidia earnings",
+    "oil price",
+    "Tesla stock",
+    "반도체 수요",
+    "Fed rate cut",
+    "bitcoin",
+    "China tariff",
+    "코스피 전망",
+]
+
+
+def _keywords(query: str) -> list:
+    return _extract_keywords(query) or query.split()[:3]
+
+
+def _legacy_top(articles: list, keywords: list, k: int) -> list:
+    rank_articles(articles, keywords, "legacy")
+    return sorted(articles, key=lambda a: a["score"], reverse=True)[:k]
+
+
+def _bm25_top(articles: list, keywords: list, k: int) -> list:
+    rank_articles(articles, keywords, "bm25")
+    return list(itertools.islice(iter_ranked(articles), k))
+
+
+def _time_per_query(fn, articles: list, k: int, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for query in QUERIES:
+            fn(articles, _keywords(query), k)
+        samples.append((time.perf_counter() - start) / len(QUERIES))
+    return statistics.median(samples)
+
+
+def _links(articles: list) -> set:
+    return {a["link"] for a in articles}
+
+
+def run(feeds_dir: str, scales: list, k: int, repeat: int) -> dict:
+    report = {"k": k, "speed": [], "stability": {}}
+
+    base, kind = load_corpus(feeds_dir)
+    report["corpus"] = kind
+    now = time.time()
+
+    for scale in scales:
+        articles, _ = load_corpus(feeds_dir, copies=scale)
+        legacy_ms = _time_per_query(_legacy_top, articles, k, repeat) * 1000
+        bm25_ms = _time_per_query(_bm25_top, articles, k, repeat) * 1000
+        report["speed"].append(
+            {"articles": len(articles), "legacy_ms": round(legacy_ms, 3), "bm25_ms": round(bm25_ms, 3)}
+        )
+
+    overlaps = []
+    shuffle_stable = 0
+    for query in QUERIES:
+        keywords = _keywords(query)
+        legacy = _select_articles([dict(a) for a in base], keywords, k, "legacy")
+        bm25 = _select_articles([dict(a) for a in base], keywords, k, "bm25")
+        overlaps.append(len(_links(legacy) & _links(bm25)) / k)
+
+        shuffled = [dict(a) for a in base]
+        random.Random(query).shuffle(shuffled)
+        rank_articles(shuffled, keywords, "bm25", now)
+        ordered = [dict(a) for a in base]
+        rank_articles(ordered, keywords, "bm25", now)
+        top_shuffled = {a["link"] for a in itertools.islice(iter_ranked(shuffled), k)}
+        top_ordered = {a["link"] for a in itertools.islice(iter_ranked(ordered), k)}
+        shuffle_stable += top_shuffled == top_ordered
+
+    report["stability"] = {
+        "mean_overlap_at_k": round(statistics.mean(overlaps), 3),
+        "min_overlap_at_k": round(min(overlaps), 3),
+        "bm25_shuffle_stable_queries": f"{shuffle_stable}/{len(QUERIES)}",
+    }
+    return report
+
+
+def _print_report(report: dict) -> None:
+    print(f"corpus: {report['corpus']}, k={report['k']}")
+    print(f"{'articles':>10} {'legacy ms/q':>12} {'bm25 ms/q':>12}")
+    for row in report["speed"]:
+        print(f"{row['articles']:>10} {row['legacy_ms']:>12.3f} {row['bm25_ms']:>12.3f}")
+    for key, value in report["stability"].items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="news_fetcher ranking 벤치마크")
+    parser.add_argument("--feeds", default=DEFAULT_FEEDS_DIR, help="녹화된 피드 디렉터리")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 10, 50], help="피드 복제 배수")
+    parser.add_argument("-k", type=int, default=5)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--json", metavar="PATH", help="결과를 JSON으로 저장")
+    args = parser.parse_args()
+
+    result = run(args.feeds, args.scales, args.k, args.repeat)
+    _print_report(result)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(result, f, ensure_ascii=False, indent=2)
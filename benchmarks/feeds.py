@@ -0,0 +1,147 @@
+"""
+Benchmark feeds — 벤치마크용 RSS 피드 녹화/로드 유틸리티
+
+  - record_feeds : 실제 RSS 소스 응답을 그대로 XML 파일로 저장
+  - load_feeds   : 녹화된 XML을 읽어 {파일명: bytes} 반환
+  - synthetic_feed: 녹화본이 없을 때 쓰는 결정적(seed 고정) 가짜 RSS 피드
+  - load_corpus  : 피드를 lib.feed_parser로 파싱해 news_fetcher와 같은 기사 dict 목록 생성
+
+녹화:
+  python -m benchmarks.feeds --record benchmarks/recorded_feeds
+"""
+
+import argparse
+import io
+import os
+import random
+import re
+import time
+import urllib.request
+from email.utils import format_datetime
+from datetime import datetime, timezone
+from xml.sax.saxutils import escape
+
+from lib.feed_parser import parse_feed_stream
+from lib.rss_config import RSS_SOURCES
+
+DEFAULT_FEEDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "recorded_feeds")
+
+_SUBJECTS = [
+    "Nvidia", "Tesla", "Apple", "Microsoft", "Amazon", "Meta", "Alphabet", "TSMC",
+    "Samsung", "Intel", "the Fed", "Treasury yields", "Oil", "Gold", "Bitcoin",
+    "The dollar", "China", "Europe", "Japan", "Wall Street", "Nasdaq", "S&P 500",
+    "엔비디아", "삼성전자", "하이닉스", "코스피", "원달러 환율", "한국은행", "기준금리",
+]
+_VERBS = [
+    "rallies", "slides", "jumps", "falls", "surges", "tumbles", "steadies", "rebounds",
+    "beats estimates", "misses forecasts", "warns on outlook", "raises guidance",
+    "상승", "하락", "급등", "급락", "반등", "사상 최고치",
+]
+_CONTEXTS = [
+    "as inflation cools", "after earnings", "on tariff fears", "ahead of CPI data",
+    "as rate cut bets grow", "on AI chip demand", "amid recession worries",
+    "after Fed minutes", "as bond yields climb", "on strong jobs report",
+    "반도체 수요 기대", "금리 인하 기대감", "관세 우려", "실적 발표 앞두고",
+]
+
+
+def _slug(name: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+
+
+def record_feeds(directory: str, sources: list = None) -> list:
+    """sources(기본값 RSS_SOURCES) 응답 본문을 <directory>/<slug>.xml로 저장."""
+    os.makedirs(directory, exist_ok=True)
+    saved = []
+    for source in sources or RSS_SOURCES:
+        path = os.path.join(directory, f"{_slug(source['name'])}.xml")
+        try:
+            req = urllib.request.Request(source["url"], headers={"User-Agent": "Mozilla/5.0"})
+            with urllib.request.urlopen(req, timeout=20) as resp:
+                content = resp.read()
+        except Exception as e:
+            print(f"[benchmarks] {source['name']} 녹화 실패: {e}")
+            continue
+        with open(path, "wb") as f:
+            f.write(content)
+        saved.append(path)
+        print(f"[benchmarks] {source['name']} → {path} ({len(content):,} bytes)")
+    return saved
+
+
+def load_feeds(directory: str = DEFAULT_FEEDS_DIR) -> dict:
+    """녹화된 XML 파일을 {이름: bytes}로 반환. 디렉터리가 없으면 빈 dict."""
+    if not os.path.isdir(directory):
+        return {}
+    feeds = {}
+    for filename in sorted(os.listdir(directory)):
+        if filename.endswith(".xml"):
+            with open(os.path.join(directory, filename), "rb") as f:
+                feeds[filename[:-4]] = f.read()
+    return feeds
+
+
+def synthetic_feed(name: str, n_items: int = 30, seed: int = 0, now: float = None) -> bytes:
+    """금융 뉴스 제목 형태의 결정적 RSS 2.0 피드를 생성합니다."""
+    rng = random.Random(f"{name}:{seed}")
+    now = now or time.time()
+    items = []
+    for i in range(n_items):
+        title = f"{rng.choice(_SUBJECTS)} {rng.choice(_VERBS)} {rng.choice(_CONTEXTS)}"
+        description = " ".join(
+            f"{rng.choice(_SUBJECTS)} {rng.choice(_VERBS)} {rng.choice(_CONTEXTS)}."
+            for _ in range(rng.randint(1, 3))
+        )
+        pub = datetime.fromtimestamp(now - rng.uniform(0, 48 * 3600), tz=timezone.utc)
+        items.append(
+            "<item>"
+            f"<title>{escape(title)}</title>"
+            f"<link>https://example.com/{_slug(name)}/{seed}/{i}?utm=rss</link>"
+            f"<description>{escape(description)}</description>"
+            f"<pubDate>{format_datetime(pub)}</pubDate>"
+            "</item>"
+        )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f'<rss version="2.0"><channel><title>{escape(name)}</title>'
+        + "".join(items)
+        + "</channel></rss>"
+    ).encode("utf-8")
+
+
+def load_corpus(directory: str = DEFAULT_FEEDS_DIR, copies: int = 1, limit: int = 15) -> tuple:
+    """
+    news_fetcher.fetch_news와 같은 형태의 기사 dict 목록을 만듭니다.
+
+    - 녹화본이 있으면 사용하고, 없으면 RSS_SOURCES 이름으로 synthetic_feed 생성
+    - copies: 피드 수를 copies배로 늘려 소스가 많아진 상황을 흉내 냄 (링크는 복사본마다 다름)
+    - 반환값: (articles, "recorded" | "synthetic")
+    """
+    feeds = load_feeds(directory)
+    kind = "recorded" if feeds else "synthetic"
+
+    articles = []
+    for copy in range(copies):
+        if kind == "recorded":
+            sources = feeds
+        else:
+            sources = {s["name"]: synthetic_feed(s["name"], seed=copy) for s in RSS_SOURCES}
+        for name, content in sources.items():
+            for entry in parse_feed_stream(io.BytesIO(content), limit=limit):
+                articles.append(
+                    {
+                        "title": entry["title"],
+                        "link": f"{entry['link']}#copy{copy}" if kind == "recorded" else entry["link"],
+                        "description": re.sub(r"<[^>]+>", "", entry["summary"]).strip()[:400],
+                        "source": f"{name}#{copy}",
+                        "pub_ts": entry["pub_ts"],
+                    }
+                )
+    return articles, kind
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="벤치마크용 RSS 피드 녹화")
+    parser.add_argument("--record", metavar="DIR", default=DEFAULT_FEEDS_DIR, help="저장할 디렉터리")
+    args = parser.parse_args()
+    record_feeds(args.record)
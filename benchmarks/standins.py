@@ -0,0 +1,285 @@
+"""
+Benchmark stand-ins — 일일 파이프라인(main.py)을 외부 서비스 없이 실행하기 위한 로컬 대역
+
+  - FeedServer     : 녹화된(또는 synthetic) RSS XML을 제공하는 로컬 HTTP 서버 (지연 시간, ETag/304)
+  - TelegramServer : Bot API sendMessage를 흉내 내는 로컬 HTTP 서버 (지연 시간, 차단 사용자 403)
+  - FakeGenAI      : google.generativeai 대역 (모델별 실패, 응답 지연)
+  - FakeFred / fake_yf_download : FRED·Yahoo 대역 (seed 고정 random walk, 요청 지연)
+  - ScaledClock    : 모듈의 time.monotonic·asyncio.sleep을 scale배 빠르게 (실제 rate limit 그대로 긴 전송 측정)
+
+Redis는 lib.upstash.LocalBackend(프로세스 내 구현)를 그대로 사용합니다.
+"""
+
+import asyncio
+import contextlib
+import hashlib
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+from urllib.parse import parse_qs
+
+import numpy as np
+import pandas as pd
+
+from benchmarks.feeds import DEFAULT_FEEDS_DIR, load_feeds, synthetic_feed
+from lib.rss_config import DAILY_RSS_SOURCES
+
+
+class _Server:
+    """ThreadingHTTPServer를 백그라운드 스레드에서 실행합니다 (with 문 지원)."""
+
+    def __init__(self):
+        self.requests = 0
+        self._lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                server._count()
+                server.handle(self)
+
+            do_POST = do_GET
+
+            def log_message(self, *args):
+                pass
+
+        self._httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+
+    def _count(self):
+        with self._lock:
+            self.requests += 1
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self._httpd.server_port}"
+
+    def handle(self, request: BaseHTTPRequestHandler) -> None:
+        raise NotImplementedError
+
+    @staticmethod
+    def reply(request: BaseHTTPRequestHandler, status: int, body: bytes = b"",
+              content_type: str = "application/json", headers: dict = None) -> None:
+        request.send_response(status)
+        request.send_header("Content-Type", content_type)
+        request.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            request.send_header(name, value)
+        request.end_headers()
+        if body:
+            request.wfile.write(body)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+
+# ── RSS ───────────────────────────────────────────────────────────────────────
+
+class FeedServer(_Server):
+    """
+    DAILY_RSS_SOURCES마다 /feeds/<n>.xml 을 제공합니다.
+    녹화본(benchmarks.feeds.load_feeds)이 있으면 순서대로 배정하고, 없으면 synthetic_feed.
+    """
+
+    def __init__(self, feeds_dir: str = DEFAULT_FEEDS_DIR, latency: float = 0.0, items: int = 30):
+        super().__init__()
+        self.latency = latency
+        recorded = list(load_feeds(feeds_dir).values())
+        self.kind = "recorded" if recorded else "synthetic"
+        self._bodies = {}
+        for i, source in enumerate(DAILY_RSS_SOURCES):
+            if recorded:
+                body = recorded[i % len(recorded)]
+            else:
+                body = synthetic_feed(source["name"], n_items=items, seed=i)
+            self._bodies[f"/feeds/{i}.xml"] = (body, f'"{hashlib.sha1(body).hexdigest()}"')
+
+    def sources(self) -> list:
+        """main.DAILY_RSS_SOURCES 대신 쓸 소스 목록 (이름·카테고리는 그대로, URL만 로컬)."""
+        return [dict(source, url=f"{self.url}/feeds/{i}.xml") for i, source in enumerate(DAILY_RSS_SOURCES)]
+
+    def handle(self, request):
+        time.sleep(self.latency)
+        found = self._bodies.get(request.path)
+        if found is None:
+            self.reply(request, 404)
+            return
+        body, etag = found
+        if request.headers.get("If-None-Match") == etag:
+            self.reply(request, 304, headers={"ETag": etag})
+            return
+        self.reply(request, 200, body, "application/rss+xml; charset=utf-8", {"ETag": etag})
+
+
+# ── Telegram Bot API ─────────────────────────────────────────────────────────
+
+class TelegramServer(_Server):
+    """
+    sendMessage만 구현한 Bot API 대역. Bot(token, base_url=server.base_url)로 연결합니다.
+    blocked에 든 chat_id는 403 Forbidden (봇 차단 사용자).
+    """
+
+    def __init__(self, latency: float = 0.0, blocked=()):
+        super().__init__()
+        self.latency = latency
+        self.blocked = {str(chat_id) for chat_id in blocked}
+        self.delivered = 0
+
+    @property
+    def base_url(self) -> str:
+        return f"{self.url}/bot"
+
+    def handle(self, request):
+        length = int(request.headers.get("Content-Length") or 0)
+        form = parse_qs(request.rfile.read(length).decode("utf-8"))
+        time.sleep(self.latency)
+        if not request.path.endswith("/sendMessage"):
+            self.reply(request, 404, json.dumps({"ok": False, "error_code": 404, "description": "Not Found"}).encode())
+            return
+
+        chat_id = form.get("chat_id", ["0"])[0]
+        if chat_id in self.blocked:
+            body = {"ok": False, "error_code": 403, "description": "Forbidden: bot was blocked by the user"}
+            self.reply(request, 403, json.dumps(body).encode())
+            return
+
+        with self._lock:
+            self.delivered += 1
+            message_id = self.delivered
+        body = {
+            "ok": True,
+            "result": {
+                "message_id": message_id,
+                "date": int(time.time()),
+                "chat": {"id": int(chat_id), "type": "private"},
+                "text": form.get("text", [""])[0],
+            },
+        }
+        self.reply(request, 200, json.dumps(body).encode())
+
+
+# ── Gemini ────────────────────────────────────────────────────────────────────
+
+class FakeGenAI:
+    """
+    lib.llm_client가 쓰는 google.generativeai 인터페이스 대역.
+    failing 모델은 예외, 나머지는 latency초 후 응답합니다 (JSON 설정이면 analysis/brief JSON).
+    """
+
+    def __init__(self, latency: float = 0.0, failing=()):
+        self.latency = latency
+        self.failing = set(failing)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def configure(self, api_key=None):
+        pass
+
+    def GenerativeModel(self, model_name):  # noqa: N802 (genai와 같은 이름)
+        return _FakeModel(self, model_name)
+
+
+class _FakeResponse:
+    def __init__(self, text: str):
+        self.text = text
+
+
+class _FakeModel:
+    def __init__(self, genai: FakeGenAI, name: str):
+        self._genai = genai
+        self.name = name
+
+    def generate_content(self, prompt, generation_config=None):
+        with self._genai._lock:
+            self._genai.calls.append(self.name)
+        time.sleep(self._genai.latency)
+        if self.name in self._genai.failing:
+            raise RuntimeError(f"503 {self.name} unavailable (benchmark)")
+
+        analysis = "## 🎯 핵심 키워드\n1. 금리\n2. 환율\n3. 반도체\n\n" + "시장 분석 본문. " * 200
+        brief = "1. 📈 금리 동결\n2. 💵 환율 안정\n3. 🔋 반도체 수출 증가"
+        if generation_config and generation_config.get("response_mime_type") == "application/json":
+            return _FakeResponse(json.dumps({"analysis": analysis, "brief": brief}, ensure_ascii=False))
+        return _FakeResponse(brief if "3가지" in prompt and "보고서" not in prompt else analysis)
+
+
+# ── FRED / Yahoo ─────────────────────────────────────────────────────────────
+
+def _walk(symbol: str, start, end: str) -> pd.Series:
+    """심볼별로 항상 같은 값을 내는 영업일 random walk (2000-01-03 ~ end)."""
+    index = pd.bdate_range("2000-01-03", end)
+    rng = np.random.default_rng(int(hashlib.sha1(symbol.encode()).hexdigest()[:8], 16))
+    series = pd.Series(10 + np.cumsum(rng.normal(0, 0.05, len(index))), index=index)
+    return series[series.index >= pd.Timestamp(start)] if start else series
+
+
+class FakeFred:
+    """fredapi.Fred 대역 (get_series만)."""
+
+    def __init__(self, latency: float = 0.0, end: str = None):
+        self.latency = latency
+        self.end = end or (pd.Timestamp.now().normalize() - pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+        self.requests = 0
+
+    def get_series(self, series_id, observation_start=None, **kwargs):
+        self.requests += 1
+        time.sleep(self.latency)
+        return _walk(series_id, observation_start, self.end)
+
+
+def fake_yf_download(latency: float = 0.0, end: str = None):
+    """yfinance.download 대역을 만듭니다 (Close 열 DataFrame)."""
+    end = end or (pd.Timestamp.now().normalize() - pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+
+    def download(ticker, start=None, period=None, **kwargs):
+        time.sleep(latency)
+        return pd.DataFrame({"Close": _walk(ticker, start, end)})
+
+    return download
+
+
+# ── 시계 ──────────────────────────────────────────────────────────────────────
+
+class _ModuleProxy:
+    """module의 일부 속성만 바꿔 보이게 하는 대역 (나머지는 원래 module로)."""
+
+    def __init__(self, module, **overrides):
+        self._module = module
+        self.__dict__.update(overrides)
+
+    def __getattr__(self, name):
+        return getattr(self._module, name)
+
+
+class ScaledClock:
+    """
+    scale배 빠르게 흐르는 시계. patch(module)하면 그 모듈의 time.monotonic과 asyncio.sleep이
+    이 시계를 따르므로, 초당 전송량 제한 같은 코드를 설정값 그대로 두고 실행 시간만 1/scale로 줄입니다.
+    측정한 실제 시간 × scale = 실제 시계에서 걸렸을 시간.
+    """
+
+    def __init__(self, scale: float):
+        self.scale = scale
+        self._origin = time.monotonic()
+
+    def monotonic(self) -> float:
+        return self._origin + (time.monotonic() - self._origin) * self.scale
+
+    async def sleep(self, delay, result=None):
+        return await asyncio.sleep(delay / self.scale, result)
+
+    @contextlib.contextmanager
+    def patch(self, module):
+        with mock.patch.object(module, "time", _ModuleProxy(time, monotonic=self.monotonic)), \
+                mock.patch.object(module, "asyncio", _ModuleProxy(asyncio, sleep=self.sleep)):
+            yield
@@ -0,0 +1,202 @@
+/*
+ * 리포트 검색 — lib/search_shards.py가 만든 월별 shard를 최신 월부터 필요한 만큼만 불러옵니다.
+ *
+ *   1. manifest.json (shard 목록)만 먼저 받음
+ *   2. 검색어 토큰으로 shard의 토큰 index(.idx.json)에서 후보 문서를 고름
+ *   3. 후보가 있는 shard만 문서 파일을 받아 검색어 포함 여부를 확인하고 미리보기를 보여줌
+ *   4. 결과가 RESULT_LIMIT개 모이면 멈추고, "더 찾기"를 누르면 이전 월부터 이어서 검색
+ *
+ * tokenize()는 lib/search_shards.py의 tokenize()와 같아야 합니다.
+ *
+ * material search plugin을 끈 대신(mkdocs.yml plugins: []) 모든 페이지 헤더에 검색 페이지 링크를 추가합니다.
+ */
+(function () {
+  "use strict";
+
+  var RESULT_LIMIT = 20;
+  var SNIPPET_RADIUS = 60;
+  var TOKEN_RE = /[가-힣]+|[a-z0-9]+/g;
+  // material/magnify 아이콘 (material 헤더 검색 버튼과 같은 모양)
+  var SEARCH_ICON = '<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24"><path d="M9.5 3A6.5 6.5 0 0 1 16 9.5c0 1.61-.59 3.09-1.56 4.23l.27.27h.79l5 5-1.5 1.5-5-5v-.79l-.27-.27A6.52 6.52 0 0 1 9.5 16 6.5 6.5 0 0 1 3 9.5 6.5 6.5 0 0 1 9.5 3m0 2C7 5 5 7 5 9.5S7 14 9.5 14 14 12 14 9.5 12 5 9.5 5"/></svg>';
+
+  function addHeaderLink() {
+    var header = document.querySelector(".md-header__inner");
+    var config = document.getElementById("__config");
+    if (!header || !config) return;
+    var link = document.createElement("a");
+    link.href = new URL(JSON.parse(config.textContent).base + "/search/", window.location.href).href;
+    link.className = "md-header__button md-icon";
+    link.title = "리포트 검색";
+    link.setAttribute("aria-label", "리포트 검색");
+    link.innerHTML = SEARCH_ICON;
+    // 저장소 링크가 있으면 그 앞, 없으면 헤더 끝
+    header.insertBefore(link, header.querySelector(".md-header__source"));
+  }
+
+  addHeaderLink();
+
+  var root = document.getElementById("report-search");
+  if (!root) return;
+
+  var form = root.querySelector(".report-search__form");
+  var input = form.querySelector("input[name=q]");
+  var status = root.querySelector(".report-search__status");
+  var list = root.querySelector(".report-search__results");
+  var more = root.querySelector(".report-search__more");
+
+  var manifestUrl = new URL(root.dataset.manifest, window.location.href);
+  var siteRoot = new URL("../../", manifestUrl);
+  var cache = {};
+  var manifest = null;
+  var search = null;
+
+  function normalize(text) {
+    return text.normalize("NFKC").toLowerCase();
+  }
+
+  function tokenize(text) {
+    var tokens = {};
+    (normalize(text).match(TOKEN_RE) || []).forEach(function (run) {
+      if (run.length > 1 && run[0] >= "가" && run[0] <= "힣") {
+        for (var i = 0; i < run.length - 1; i++) tokens[run.slice(i, i + 2)] = true;
+      } else {
+        tokens[run] = true;
+      }
+    });
+    return Object.keys(tokens);
+  }
+
+  function fetchJSON(name) {
+    if (!cache[name]) {
+      cache[name] = fetch(new URL(name, manifestUrl)).then(function (response) {
+        if (!response.ok) throw new Error(response.status + " " + name);
+        return response.json();
+      });
+    }
+    return cache[name];
+  }
+
+  function loadManifest() {
+    if (manifest) return Promise.resolve(manifest);
+    return fetchJSON("manifest.json").then(function (data) {
+      manifest = data;
+      return data;
+    });
+  }
+
+  // 모든 토큰을 가진 문서 번호 (posting 교집합)
+  function candidates(index, tokens) {
+    var result = null;
+    for (var i = 0; i < tokens.length; i++) {
+      var postings = index.tokens[tokens[i]];
+      if (!postings) return [];
+      if (result === null) {
+        result = postings.slice();
+      } else {
+        var allowed = {};
+        postings.forEach(function (n) { allowed[n] = true; });
+        result = result.filter(function (n) { return allowed[n]; });
+      }
+      if (!result.length) return [];
+    }
+    return result || [];
+  }
+
+  function escapeHTML(text) {
+    return text.replace(/[&<>"']/g, function (c) {
+      return { "&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#39;" }[c];
+    });
+  }
+
+  function snippet(text, at) {
+    var start = Math.max(0, at - SNIPPET_RADIUS);
+    var end = Math.min(text.length, at + SNIPPET_RADIUS * 2);
+    return (start > 0 ? "… " : "") + text.slice(start, end) + (end < text.length ? " …" : "");
+  }
+
+  function render(doc, at) {
+    var item = document.createElement("li");
+    item.innerHTML =
+      '<a href="' + escapeHTML(new URL(doc.location, siteRoot).href) + '">' + escapeHTML(doc.title) + "</a>" +
+      "<p>" + escapeHTML(snippet(doc.text, at)) + "</p>";
+    list.appendChild(item);
+  }
+
+  function Search(query) {
+    this.terms = normalize(query).split(/\s+/).filter(Boolean);
+    this.tokens = tokenize(query);
+    this.next = 0;
+    this.found = 0;
+  }
+
+  // shard를 하나씩 확인하며 limit개를 더 찾을 때까지 진행
+  Search.prototype.run = function (limit) {
+    var self = this;
+    var target = self.found + limit;
+    var shards = manifest.shards;
+
+    function step() {
+      if (search !== self) return Promise.resolve();
+      if (self.next >= shards.length || self.found >= target) return Promise.resolve();
+      var shard = shards[self.next++];
+      status.textContent = "검색 중… (" + shard.key + ")";
+      return fetchJSON(shard.index).then(function (index) {
+        var numbers = candidates(index, self.tokens);
+        if (!numbers.length) return step();
+        return fetchJSON(shard.text).then(function (data) {
+          numbers.forEach(function (n) {
+            var doc = data.docs[n];
+            var haystack = normalize(doc.title + " " + doc.text);
+            var textHaystack = normalize(doc.text);
+            var matched = self.terms.every(function (term) { return haystack.indexOf(term) !== -1; });
+            if (matched && search === self) {
+              render(doc, Math.max(0, textHaystack.indexOf(self.terms[0])));
+              self.found++;
+            }
+          });
+          return step();
+        });
+      });
+    }
+
+    return step().then(function () {
+      if (search !== self) return;
+      var done = self.next >= shards.length;
+      status.textContent = self.found ? "검색 결과 " + self.found + "건" + (done ? "" : " (최근 리포트 기준)") : "검색 결과가 없습니다.";
+      more.hidden = done;
+    });
+  };
+
+  function start() {
+    var query = input.value.trim();
+    list.innerHTML = "";
+    more.hidden = true;
+    if (!tokenize(query).length) {
+      search = null;
+      status.textContent = "";
+      return;
+    }
+    loadManifest()
+      .then(function () {
+        search = new Search(query);
+        return search.run(RESULT_LIMIT);
+      })
+      .catch(function (error) {
+        status.textContent = "검색 index를 불러오지 못했습니다. (" + error.message + ")";
+      });
+  }
+
+  var timer = null;
+  form.addEventListener("submit", function (event) {
+    event.preventDefault();
+    clearTimeout(timer);
+    start();
+  });
+  input.addEventListener("input", function () {
+    clearTimeout(timer);
+    timer = setTimeout(start, 300);
+  });
+  more.addEventListener("click", function () {
+    if (search) search.run(RESULT_LIMIT);
+  });
+})();
@@ -1,10 +1,13 @@
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import pandas as pd
 import yfinance as yf
 from fredapi import Fred
-from datetime import datetime, timedelta
 from dotenv import load_dotenv
 
+from lib import analytics, series_store
+
 load_dotenv()
 
 # 임계값 설정
@@ -15,6 +18,9 @@ THRESHOLDS = {
     "HY_SPREAD": 4.0  
 }
 
+# 임계값 이하가 위험인 지표 (장단기 금리차 역전)
+INVERTED = ("T10Y2Y",)
+
 # 차트 링크
 CHART_LINKS = {
     "T10Y2Y": "https://fred.stlouisfed.org/series/T10Y2Y",
@@ -23,6 +29,97 @@ CHART_LINKS = {
     "HY_SPREAD": "https://fred.stlouisfed.org/series/BAMLH0A0HYM2"
 }
 
+# 지표 정의: 결과 key → (출처, 원본 심볼, 표시 이름, 소수 자릿수)
+INDICATORS = {
+    "T10Y2Y": ("fred", "T10Y2Y", "장단기 금리차", 3),
+    "DTWEXBGS": ("fred", "DTWEXBGS", "달러 인덱스", 3),
+    "HY_SPREAD": ("fred", "BAMLH0A0HYM2", "High Yield 스프레드", 3),
+    "VIX": ("yahoo", "^VIX", "공포 지수 (VIX)", 2),
+}
+
+def _fetch(source, symbol, start, fred):
+    """start("YYYY-MM-DD") 이후 관측값. start가 None이면 출처의 전체 기간."""
+    if source == "fred":
+        return fred.get_series(symbol, observation_start=start)
+
+    if start:
+        df = yf.download(symbol, start=start, progress=False, threads=False)
+    else:
+        df = yf.download(symbol, period="max", progress=False, threads=False)
+    close = df['Close']
+    # Multi-Index 컬럼이면 DataFrame으로 반환됨
+    if isinstance(close, pd.DataFrame):
+        close = close.iloc[:, 0]
+    return close
+
+def update_series_store(conn, fred):
+    """
+    모든 지표를 동시에 받아 로컬 저장소(lib.series_store)에 반영합니다.
+    저장된 마지막 날짜부터만 요청하므로 평소에는 지표당 관측값 몇 개만 받습니다.
+    반환값: {심볼: 추가·변경된 행 수} (실패한 심볼 제외)
+    """
+    jobs = {
+        symbol: (source, series_store.last_date(conn, symbol))
+        for source, symbol, _, _ in INDICATORS.values()
+    }
+    changed = {}
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = {
+            pool.submit(_fetch, source, symbol, start, fred): (source, symbol)
+            for symbol, (source, start) in jobs.items()
+        }
+        for future in as_completed(futures):
+            source, symbol = futures[future]
+            try:
+                series = future.result()
+            except Exception as e:
+                print(f"❌ {source.upper()} {symbol} 로드 실패 (저장된 값 사용): {e}")
+                continue
+            # SQLite 쓰기는 이 스레드에서만
+            changed[symbol] = series_store.upsert(conn, symbol, series)
+    return changed
+
+def load_history(conn):
+    """저장된 전체 이력 (날짜 × 지표 key)."""
+    frame = series_store.load_frame(conn, [symbol for _, symbol, _, _ in INDICATORS.values()])
+    frame.columns = list(INDICATORS)
+    return frame
+
+def analyze_history(frame):
+    """전체 이력의 변화·z-score·백분위·임계값 통과 (lib.analytics, 모든 지표·날짜를 한 번에)."""
+    return analytics.compute(frame, THRESHOLDS, inverted=INVERTED)
+
+def _number(value, digits):
+    return None if pd.isna(value) else round(float(value), digits)
+
+def summarize_table(table):
+    """analytics.snapshot/pick 형식의 표에서 지표 dict를 만듭니다 (format_to_markdown 입력)."""
+    data = {}
+    for key, (_, _, name, digits) in INDICATORS.items():
+        if key not in table.index or pd.isna(table.at[key, "prev"]):
+            continue
+        row = table.loc[key]
+        data[key] = {
+            "name": name,
+            "current": _number(row["value"], digits),
+            "date": row["date"].strftime('%m/%d'),
+            "diff": _number(row["chg_1d"], digits),
+            "chg_1w": _number(row["chg_1w"], digits),
+            "chg_1m": _number(row["chg_1m"], digits),
+            "z": _number(row["z"], 2),
+            "pct": _number(row["pct"], 0),
+            "breach": bool(row["breach"] == 1),
+            "last_cross": None if pd.isna(row["last_cross"]) else row["last_cross"].strftime('%Y-%m-%d'),
+            "last_dir": _number(row["last_dir"], 0),
+            "threshold": THRESHOLDS[key],
+            "link": CHART_LINKS[key]
+        }
+    return data
+
+def summarize(result, as_of=None):
+    """analyze_history 결과에서 기준일(기본: 최신) 지표 dict를 만듭니다."""
+    return summarize_table(analytics.snapshot(result, as_of))
+
 def get_indicators_data():
     fred_key = os.getenv("FRED_API_KEY")
     if not fred_key:
@@ -30,83 +127,69 @@ def get_indicators_data():
         return None
     
     fred = Fred(api_key=fred_key)
-    end = datetime.now()
-    start = end - timedelta(days=30)
-    
-    results = {}
+    conn = series_store.connect()
+    try:
+        changed = update_series_store(conn, fred)
+        print(f"📈 지표 저장소 갱신: {', '.join(f'{sym} +{n}' for sym, n in changed.items()) or '없음'}")
+        frame = load_history(conn)
+    finally:
+        conn.close()
 
-    # 1. FRED 지표 (T10Y2Y, DTWEXBGS, BAMLH0A0HYM2)
-    fred_symbols = {
-        "T10Y2Y": "장단기 금리차",
-        "DTWEXBGS": "달러 인덱스",
-        "BAMLH0A0HYM2": "High Yield 스프레드"
-    }
+    # 저장소가 비어 있으면 (첫 실행·캐시 miss에 출처도 모두 실패) 지표 없이 진행
+    data = summarize(analyze_history(frame))
+    if not data:
+        print("⚠️ 저장된 지표 데이터가 없습니다.")
+        return None
+    return data
 
-    for sym, name in fred_symbols.items():
-        try:
-            series = fred.get_series(sym, observation_start=start, observation_end=end).dropna()
-            if len(series) < 2: continue
-            
-            # 최신값(iloc[-1])과 바로 전날값(iloc[-2]) 추출
-            curr_val = float(series.iloc[-1])
-            prev_val = float(series.iloc[-2])
-            curr_date = series.index[-1].strftime('%m/%d')
-            
-            ref_key = "HY_SPREAD" if sym == "BAMLH0A0HYM2" else sym
-            results[ref_key] = {
-                "name": name,
-                "current": round(curr_val, 3),
-                "date": curr_date,
-                "diff": round(curr_val - prev_val, 3),
-                "threshold": THRESHOLDS[ref_key],
-                "link": CHART_LINKS[ref_key]
-            }
-        except Exception as e:
-            print(f"❌ FRED {sym} 로드 실패: {e}")
-
-    # 2. Yahoo Finance (VIX) 
-    try:
-        # yfinance는 데이터프레임을 반환하므로 명확하게 인덱싱 필요
-        vix_df = yf.download("^VIX", start=start, end=end, progress=False).dropna()
-        if len(vix_df) >= 2:
-            # Multi-Index 대응을 위해 values.flatten() 혹은 iloc 사용
-            close_prices = vix_df['Close'].values.flatten()
-            curr_vix = float(close_prices[-1])
-            prev_vix = float(close_prices[-2])
-            curr_vix_date = vix_df.index[-1].strftime('%m/%d')
-            
-            results["VIX"] = {
-                "name": "공포 지수 (VIX)",
-                "current": round(curr_vix, 2),
-                "date": curr_vix_date,
-                "diff": round(curr_vix - prev_vix, 2),
-                "threshold": THRESHOLDS["VIX"],
-                "link": CHART_LINKS["VIX"]
-            }
-    except Exception as e:
-        print(f"❌ VIX 로드 실패: {e}")
-
-    return results
-
-def format_to_markdown(data):
+def _signed(value):
+    if value is None: return "-"
+    return f"+{value}" if value > 0 else f"{value}"
+
+def _status(val, today=None):
+    """임계값 위험 여부 + 최근 30일 안에 임계값을 통과했으면 그 날짜."""
+    status = "⚠️" if val['breach'] else "✅"
+    if val.get('last_cross'):
+        crossed = pd.Timestamp(val['last_cross'])
+        if (pd.Timestamp(today) if today else pd.Timestamp.now()) - crossed <= pd.Timedelta(days=30):
+            status += f" ({crossed.strftime('%m/%d')} {'진입' if val['last_dir'] > 0 else '해제'})"
+    return status
+
+def format_to_markdown(data, today=None):
     if not data: return "⚠️ 지표 데이터를 불러올 수 없습니다."
     
-    md = "### 📊 시장 주요 지표 (전일 대비)\n"
-    md += "| 지표명 (기준일) | 현재값 | 전일대비 | 임계값 | 상태 |\n"
-    md += "| :--- | :---: | :---: | :---: | :---: |\n"
+    md = "### 📊 시장 주요 지표\n"
+    md += "| 지표명 (기준일) | 현재값 | 전일대비 | 1주 | 1개월 | 1년 Z | 백분위 | 임계값 | 상태 |\n"
+    md += "| :--- | :---: | :---: | :---: | :---: | :---: | :---: | :---: | :---: |\n"
     
     for key, val in data.items():
-        # 변동폭 부호 처리
-        diff_val = val['diff']
-        diff_str = f"+{diff_val}" if diff_val > 0 else f"{diff_val}"
-        
-        # 상태 판별 로직
-        status = "✅"
-        # 장단기 금리차는 역전(0이하) 시 위험
-        if key == "T10Y2Y" and val['current'] <= val['threshold']: status = "⚠️"
-        # 나머지는 임계값 이상 시 위험
-        elif key != "T10Y2Y" and val['current'] >= val['threshold']: status = "⚠️"
-        
-        md += f"| [{val['name']}]({val['link']}) ({val['date']}) | {val['current']} | {diff_str} | {val['threshold']} | {status} |\n"
-
-    return md + "\n"
\ No newline at end of file
+        z = "-" if val['z'] is None else f"{val['z']:+.2f}"
+        pct = "-" if val['pct'] is None else f"{val['pct']:.0f}%"
+        md += (
+            f"| [{val['name']}]({val['link']}) ({val['date']}) | {val['current']} | {_signed(val['diff'])} "
+            f"| {_signed(val['chg_1w'])} | {_signed(val['chg_1m'])} | {z} | {pct} "
+            f"| {val['threshold']} | {_status(val, today)} |\n"
+        )
+
+    return md + "\n"
+
+def format_for_prompt(data):
+    """Gemini 프롬프트용 지표 요약 (한 줄에 지표 하나)."""
+    if not data: return ""
+
+    lines = []
+    for key, val in data.items():
+        direction = "이하" if key in INVERTED else "이상"
+        line = (
+            f"- {val['name']} ({val['date']}): {val['current']} "
+            f"(전일 {_signed(val['diff'])}, 1주 {_signed(val['chg_1w'])}, 1개월 {_signed(val['chg_1m'])}"
+        )
+        if val['z'] is not None:
+            line += f", 1년 평균 대비 z-score {val['z']:+.2f}"
+        if val['pct'] is not None:
+            line += f", 전체 이력 백분위 {val['pct']:.0f}%"
+        line += f"), 위험 기준 {val['threshold']} {direction}: {'위험 구간' if val['breach'] else '정상'}"
+        if val['last_cross']:
+            line += f", 마지막 기준 통과 {val['last_cross']} ({'진입' if val['last_dir'] > 0 else '해제'})"
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,167 @@
+"""
+Indicator Analytics — 지표 시계열 벡터화 분석
+
+lib.series_store의 시계열을 날짜 × 심볼 DataFrame으로 받아, 모든 지표·모든 날짜의 통계를
+pandas/NumPy 배열 연산으로 한 번에 계산합니다 (관측값 단위 Python 루프 없음).
+심볼마다 관측일이 달라도 (FRED 영업일, 미국 증시 거래일) 각 값은 그 심볼의 관측값 기준입니다.
+
+  - prev / chg_1d        : 직전 관측값과 그 대비 변화
+  - chg_1w / chg_1m      : 7일 전, 1개월 전 시점(그 이전 마지막 관측값) 대비 변화
+  - mean / z             : 최근 1년(365일) rolling 평균과 z-score
+  - pct                  : 그날까지 전체 이력 중 백분위 (0~100)
+  - breach / crossed     : 임계값 위험 구간 여부(1/0), 진입(+1)·해제(-1) 이벤트
+  - last_cross / last_dir: 마지막 임계값 통과 날짜와 방향
+
+  compute   : 전체 기간 결과 (날짜 × (지표, 심볼))
+  snapshots : 여러 기준일의 심볼별 마지막 관측 행 (일일 리포트 표 일괄 생성용)
+  snapshot  : 기준일 하나의 표 (index=심볼, columns=지표 + date)
+  pick      : snapshots 결과에서 심볼별로 다른 기준일의 행을 골라 snapshot과 같은 표로
+"""
+
+import numpy as np
+import pandas as pd
+
+ZSCORE_WINDOW = "365D"
+ZSCORE_MIN_PERIODS = 60
+HORIZONS = {
+    "chg_1w": pd.Timedelta(days=7),
+    "chg_1m": pd.DateOffset(months=1),
+}
+
+
+def _asof(filled: pd.DataFrame, offset) -> pd.DataFrame:
+    """각 날짜에서 offset 이전 시점의 값 (그 시점 이전 마지막 관측값)."""
+    past = filled.reindex(filled.index - offset, method="ffill")
+    past.index = filled.index
+    return past
+
+
+def _thresholds(frame: pd.DataFrame, observed: pd.DataFrame, thresholds: dict, inverted) -> dict:
+    """
+    임계값 위험 구간 판정. inverted 심볼은 임계값 이하가 위험 (예: 장단기 금리차 역전),
+    나머지는 임계값 이상이 위험입니다.
+    """
+    limit = pd.Series(thresholds, dtype="float64").reindex(frame.columns).to_numpy()
+    sign = np.where(frame.columns.isin(list(inverted)), -1.0, 1.0)
+    with np.errstate(invalid="ignore"):
+        danger = (frame.to_numpy() - limit) * sign >= 0
+    known = observed.to_numpy() & ~np.isnan(limit)
+
+    # 관측일에만 상태가 있고, 그 사이에는 직전 상태 유지
+    state = pd.DataFrame(np.where(known, danger, np.nan), index=frame.index, columns=frame.columns).ffill()
+    crossed = (state - state.shift(1)).where(observed)
+
+    hit = crossed.fillna(0).to_numpy() != 0
+    stamps = np.where(hit, frame.index.to_numpy()[:, None], np.datetime64("NaT"))
+    return {
+        "breach": state.where(observed),
+        "crossed": crossed,
+        "last_cross": pd.DataFrame(stamps, index=frame.index, columns=frame.columns).ffill(),
+        "last_dir": crossed.where(crossed != 0).ffill(),
+    }
+
+
+def compute(
+    frame: pd.DataFrame,
+    thresholds: dict = None,
+    inverted=(),
+    window: str = ZSCORE_WINDOW,
+    min_periods: int = ZSCORE_MIN_PERIODS,
+) -> pd.DataFrame:
+    """
+    frame: 날짜 × 심볼 관측값 (관측이 없는 날은 NaN, 예: series_store.load_frame)
+    반환값: 날짜 × (지표, 심볼) MultiIndex 컬럼. 지표 값은 그 심볼의 관측일에만 있습니다.
+    """
+    frame = frame.sort_index().astype("float64")
+    observed = frame.notna()
+    filled = frame.ffill()
+    # 각 날짜 직전까지의 마지막 관측값
+    prev = filled.shift(1)
+
+    rolling = frame.rolling(window, min_periods=min_periods)
+    mean = rolling.mean()
+    std = rolling.std()
+
+    parts = {
+        "value": frame,
+        "prev": prev.where(observed),
+        "chg_1d": frame - prev,
+    }
+    for name, offset in HORIZONS.items():
+        parts[name] = frame - _asof(filled, offset)
+    parts["mean"] = mean.where(observed)
+    parts["z"] = (frame - mean) / std.where(std > 0)
+    parts["pct"] = frame.expanding().rank(pct=True) * 100
+    if thresholds:
+        parts.update(_thresholds(frame, observed, thresholds, inverted))
+
+    return pd.concat(parts, axis=1)
+
+
+def _pad(values: np.ndarray) -> np.ndarray:
+    """행 번호 -1(관측 없음)이 빈 값을 가리키도록 마지막에 빈 행 추가."""
+    blank = np.datetime64("NaT") if values.dtype.kind == "M" else np.nan
+    return np.concatenate([values, np.full((1, values.shape[1]), blank, dtype=values.dtype)])
+
+
+def snapshots(result: pd.DataFrame, dates) -> pd.DataFrame:
+    """
+    각 기준일(포함) 이전 심볼별 마지막 관측 행을 한 번에 모읍니다.
+    반환값: 기준일 × (지표, 심볼), 지표에 관측일 "date" 추가.
+    result가 비어 있으면 모든 값이 빈(NaN/NaT) 표를 반환합니다.
+    """
+    dates = pd.DatetimeIndex(dates)
+    observed = result["value"].notna().to_numpy()
+    symbols = result["value"].columns
+    columns = np.arange(len(symbols))
+
+    # 날짜별·심볼별 마지막 관측 행 번호 (없으면 -1)
+    if len(result):
+        rows = np.arange(len(result))[:, None]
+        last = np.maximum.accumulate(np.where(observed, rows, -1), axis=0)
+        at = result.index.searchsorted(dates, side="right") - 1
+        picked = last[np.maximum(at, 0)]
+        picked[at < 0] = -1
+    else:
+        picked = np.full((len(dates), len(symbols)), -1)
+
+    stamps = np.append(result.index.to_numpy(), np.datetime64("NaT"))
+    parts = {"date": pd.DataFrame(stamps[picked], index=dates, columns=symbols)}
+    for metric in result.columns.get_level_values(0).unique():
+        values = _pad(result[metric].to_numpy())
+        parts[metric] = pd.DataFrame(values[picked, columns], index=dates, columns=symbols)
+    return pd.concat(parts, axis=1)
+
+
+def snapshot(result: pd.DataFrame, as_of=None) -> pd.DataFrame:
+    """
+    기준일(기본: 마지막 날짜)의 지표 표. index=심볼, columns=지표. 관측이 없는 심볼은 제외.
+    result가 비어 있으면 (저장된 관측값이 없음) 빈 표를 반환합니다.
+    """
+    if result.empty:
+        return pd.DataFrame(columns=["date", *result.columns.get_level_values(0).unique()])
+    if as_of is None:
+        as_of = result.index[-1]
+    row = snapshots(result, [as_of])
+    table = pd.DataFrame({
+        metric: row[metric].iloc[0]
+        for metric in row.columns.get_level_values(0).unique()
+    })
+    return table[table["date"].notna()]
+
+
+def pick(snaps: pd.DataFrame, as_of: dict) -> pd.DataFrame:
+    """
+    snapshots 결과에서 심볼별 기준일({심볼: 날짜}, 날짜는 snaps index에 있어야 함)의 행을 골라
+    snapshot과 같은 형식의 표를 만듭니다. 관측이 없는 심볼은 제외.
+    """
+    symbols = [symbol for symbol in as_of if symbol in snaps["value"].columns]
+    rows = snaps.index.get_indexer(pd.DatetimeIndex([as_of[symbol] for symbol in symbols]))
+    table = pd.DataFrame({
+        metric: pd.Series(
+            snaps[metric].to_numpy()[rows, snaps[metric].columns.get_indexer(symbols)],
+            index=symbols,
+        )
+        for metric in snaps.columns.get_level_values(0).unique()
+    })
+    return table[table["date"].notna()]
@@ -0,0 +1,216 @@
+"""
+Article Index — SQLite FTS5 로컬 기사 색인
+
+lib.ingest가 RSS 소스를 주기적으로 수집해 이 색인에 upsert하고,
+lib.news_fetcher.fetch_news는 색인이 최신이면 RSS를 직접 호출하지 않고
+색인에서 후보 기사를 바로 가져옵니다 (수 ms, 며칠 전 기사까지 검색 가능).
+
+테이블:
+  - articles     : 기사 원본 (fingerprint UNIQUE, pub_ts / source 포함)
+  - articles_fts : title·description FTS5 색인 (external content, trigger로 동기화)
+  - meta         : 마지막 수집 시각 등
+
+색인 파일 경로는 ARTICLE_INDEX_PATH 환경 변수로 지정합니다.
+"""
+
+import hashlib
+import os
+import re
+import sqlite3
+import time
+
+# 마지막 수집 후 이 시간이 지나면 색인이 오래된 것으로 보고 live 수집으로 대체
+INDEX_MAX_STALENESS_SEC = 30 * 60
+# 색인에 보관하는 기간
+_RETENTION_DAYS = 30
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id          INTEGER PRIMARY KEY,
+    fingerprint TEXT NOT NULL UNIQUE,
+    title       TEXT NOT NULL,
+    link        TEXT NOT NULL,
+    description TEXT NOT NULL,
+    source      TEXT NOT NULL,
+    pub_ts      REAL NOT NULL,
+    ingested_ts REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_pub_ts ON articles(pub_ts);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, description, content='articles', content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS articles_ai AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts(rowid, title, description)
+    VALUES (new.id, new.title, new.description);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_ad AFTER DELETE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+END;
+CREATE TRIGGER IF NOT EXISTS articles_au AFTER UPDATE ON articles BEGIN
+    INSERT INTO articles_fts(articles_fts, rowid, title, description)
+    VALUES ('delete', old.id, old.title, old.description);
+    INSERT INTO articles_fts(rowid, title, description)
+    VALUES (new.id, new.title, new.description);
+END;
+
+CREATE TABLE IF NOT EXISTS meta (
+    key   TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+_UPSERT_SQL = """
+INSERT INTO articles (fingerprint, title, link, description, source, pub_ts, ingested_ts)
+VALUES (?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(fingerprint) DO UPDATE SET
+    title = excluded.title,
+    description = excluded.description,
+    pub_ts = excluded.pub_ts
+WHERE articles.title != excluded.title OR articles.description != excluded.description
+"""
+
+
+def index_path() -> str:
+    """ARTICLE_INDEX_PATH 환경 변수. 비어 있으면 색인 모드를 사용하지 않습니다."""
+    return os.getenv("ARTICLE_INDEX_PATH", "").strip()
+
+
+def fingerprint(article: dict) -> str:
+    """
+    기사 dedup fingerprint.
+    URL(query string 제거)이 있으면 URL 기준, 없으면 source + 소문자 제목 기준.
+    """
+    url = article.get("link", "").split("?")[0].strip()
+    basis = url or f"{article.get('source', '')}\n{article.get('title', '').strip().lower()}"
+    return hashlib.sha1(basis.encode("utf-8")).hexdigest()
+
+
+def connect(path: str, create: bool = False) -> sqlite3.Connection:
+    """
+    색인 연결을 엽니다.
+    create=True(수집기)일 때만 WAL 설정과 스키마 생성을 실행하고,
+    읽기 경로(웹훅)는 이미 만들어진 색인을 그대로 엽니다 (요청마다 DDL 실행 안 함).
+    """
+    if create:
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=10)
+    conn.row_factory = sqlite3.Row
+    if create:
+        # 수집기가 쓰는 동안에도 웹훅이 읽을 수 있도록 WAL 사용 (DB 파일에 유지됨)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.executescript(_SCHEMA)
+    return conn
+
+
+def upsert_articles(conn: sqlite3.Connection, articles: list, now: float = None) -> int:
+    """기사를 upsert하고 새로 추가·변경된 행 수를 반환합니다."""
+    now = now or time.time()
+    with conn:
+        cursor = conn.executemany(
+            _UPSERT_SQL,
+            [
+                (
+                    fingerprint(a),
+                    a["title"],
+                    a["link"],
+                    a["description"],
+                    a["source"],
+                    a["pub_ts"],
+                    now,
+                )
+                for a in articles
+            ],
+        )
+        conn.execute(
+            "INSERT INTO meta (key, value) VALUES ('last_ingest_ts', ?) "
+            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+            (str(now),),
+        )
+    return cursor.rowcount
+
+
+def prune(conn: sqlite3.Connection, retention_days: float = _RETENTION_DAYS) -> int:
+    """보관 기간이 지난 기사를 삭제합니다."""
+    cutoff = time.time() - retention_days * 86400
+    with conn:
+        return conn.execute("DELETE FROM articles WHERE pub_ts < ?", (cutoff,)).rowcount
+
+
+def last_ingest_ts(conn: sqlite3.Connection) -> float:
+    row = conn.execute("SELECT value FROM meta WHERE key = 'last_ingest_ts'").fetchone()
+    return float(row["value"]) if row else 0.0
+
+
+def is_fresh(conn: sqlite3.Connection, max_staleness_sec: float = INDEX_MAX_STALENESS_SEC) -> bool:
+    return time.time() - last_ingest_ts(conn) <= max_staleness_sec
+
+
+def _match_expression(keywords: list) -> str:
+    """키워드별 prefix query를 OR로 연결 ("엔비디아"* → '엔비디아가' 등 조사 붙은 형태도 매치)."""
+    terms = []
+    for kw in keywords:
+        # FTS5 구문 문자 제거 후 phrase로 감쌈
+        cleaned = re.sub(r'["*^:()]', " ", kw).strip()
+        if cleaned:
+            terms.append(f'"{cleaned}"*')
+    return " OR ".join(terms)
+
+
+def search(
+    conn: sqlite3.Connection,
+    keywords: list,
+    since_ts: float,
+    match_limit: int = 200,
+    recent_limit: int = 50,
+    sources: list = None,
+) -> list:
+    """
+    랭킹 후보 기사를 반환합니다.
+
+    - 키워드 FTS 매치 상위 match_limit개 (FTS5 bm25 순)
+    - 키워드와 무관한 최신 기사 recent_limit개 (live 모드처럼 recency만으로도 후보가 되도록)
+    - sources(소스 이름 목록)를 주면 그 소스의 기사만 반환
+    반환값: [{"title", "link", "description", "source", "pub_ts"}, ...]
+    """
+    columns = "a.id, a.title, a.link, a.description, a.source, a.pub_ts"
+    source_filter, source_params = "", ()
+    if sources is not None:
+        source_filter = f" AND a.source IN ({', '.join('?' * len(sources))})"
+        source_params = tuple(sources)
+    rows = {}
+
+    expression = _match_expression(keywords)
+    if expression:
+        try:
+            for row in conn.execute(
+                f"SELECT {columns} FROM articles_fts JOIN articles a ON a.id = articles_fts.rowid "
+                f"WHERE articles_fts MATCH ? AND a.pub_ts >= ?{source_filter} "
+                "ORDER BY bm25(articles_fts) LIMIT ?",
+                (expression, since_ts, *source_params, match_limit),
+            ):
+                rows[row["id"]] = row
+        except sqlite3.OperationalError as e:
+            print(f"[article_index] FTS 검색 실패 ({expression!r}): {e}")
+
+    for row in conn.execute(
+        f"SELECT {columns} FROM articles a WHERE a.pub_ts >= ?{source_filter} "
+        "ORDER BY a.pub_ts DESC LIMIT ?",
+        (since_ts, *source_params, recent_limit),
+    ):
+        rows.setdefault(row["id"], row)
+
+    return [
+        {
+            "title": row["title"],
+            "link": row["link"],
+            "description": row["description"],
+            "source": row["source"],
+            "pub_ts": row["pub_ts"],
+        }
+        for row in rows.values()
+    ]
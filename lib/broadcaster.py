@@ -0,0 +1,160 @@
+"""
+Broadcaster — 텔레그램 rate limit을 지키는 동시 메시지 발송
+
+  - 동시 전송 수 제한 (asyncio.Semaphore)
+  - token bucket: 전체(global) 초당 전송량 + 채팅별 초당 전송량
+  - 429 RetryAfter: retry_after만큼 전체 발송을 멈췄다가 재시도
+                   (global bucket을 멈춰 이미 token을 기다리던 전송도 함께 대기)
+  - Forbidden(봇 차단·탈퇴한 사용자)은 재시도하지 않고 blocked로 집계
+  - BadRequest(chat not found, 잘못된 markup 등 400)는 재시도하지 않고 failed로 집계
+  - 네트워크 오류(TimedOut/NetworkError)는 지수 backoff로 재시도
+
+텔레그램 권장 한도: 전체 약 30 msg/s, 같은 채팅 1 msg/s.
+"""
+
+import asyncio
+import time
+from datetime import timedelta
+
+from telegram.error import BadRequest, Forbidden, NetworkError, RetryAfter
+
+# 기본 발송 정책
+_MAX_CONCURRENCY = 20
+_GLOBAL_RATE_PER_SEC = 30.0
+_PER_CHAT_RATE_PER_SEC = 1.0
+_MAX_RETRIES = 3
+_NETWORK_RETRY_DELAY_SEC = 1.0
+
+
+class TokenBucket:
+    """초당 rate개씩 채워지고 최대 capacity개까지 쌓이는 token bucket (asyncio용)."""
+
+    def __init__(self, rate: float, capacity: float = None):
+        self.rate = rate
+        self.capacity = capacity if capacity is not None else max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def pause(self, until: float) -> None:
+        """until(monotonic)까지 token을 내주지 않고, 그 뒤에는 빈 bucket에서 다시 채웁니다."""
+        self._tokens = 0.0
+        self._updated = max(self._updated, until)
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._updated:
+                    # pause 중 (429 flood control)
+                    await asyncio.sleep(self._updated - now)
+                    continue
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+def _retry_after_seconds(error: RetryAfter) -> float:
+    retry_after = error.retry_after
+    if isinstance(retry_after, timedelta):
+        return retry_after.total_seconds()
+    return float(retry_after)
+
+
+class Broadcaster:
+    """
+    bot.send_message를 여러 채팅에 동시에 보내고 결과를 집계합니다.
+
+        result = await Broadcaster(bot).broadcast(chat_ids, text, parse_mode="HTML")
+        result  →  {"delivered": int, "failed": int, "blocked": int, "blocked_chat_ids": [...]}
+    """
+
+    def __init__(
+        self,
+        bot,
+        max_concurrency: int = _MAX_CONCURRENCY,
+        global_rate: float = _GLOBAL_RATE_PER_SEC,
+        per_chat_rate: float = _PER_CHAT_RATE_PER_SEC,
+        max_retries: int = _MAX_RETRIES,
+    ):
+        self.bot = bot
+        self.max_concurrency = max_concurrency
+        self.per_chat_rate = per_chat_rate
+        self.max_retries = max_retries
+        self._global_bucket = TokenBucket(global_rate)
+        self._chat_buckets = {}
+        self._resume_at = 0.0  # 429 이후 전체 발송 재개 시각 (monotonic)
+
+    def _chat_bucket(self, chat_id) -> TokenBucket:
+        bucket = self._chat_buckets.get(chat_id)
+        if bucket is None:
+            bucket = self._chat_buckets[chat_id] = TokenBucket(self.per_chat_rate, capacity=1)
+        return bucket
+
+    async def _wait_turn(self, chat_id):
+        pause = self._resume_at - time.monotonic()
+        if pause > 0:
+            await asyncio.sleep(pause)
+        await self._chat_bucket(chat_id).acquire()
+        await self._global_bucket.acquire()
+
+    async def send(self, chat_id, text: str, **kwargs) -> str:
+        """한 채팅에 전송. 반환값: "delivered" | "blocked" | "failed" """
+        network_delay = _NETWORK_RETRY_DELAY_SEC
+        for attempt in range(self.max_retries + 1):
+            await self._wait_turn(chat_id)
+            try:
+                await self.bot.send_message(chat_id=chat_id, text=text, **kwargs)
+                return "delivered"
+            except RetryAfter as e:
+                wait_sec = _retry_after_seconds(e)
+                # flood control은 봇 단위이므로 다른 전송도 함께 멈춤
+                self._resume_at = max(self._resume_at, time.monotonic() + wait_sec)
+                self._global_bucket.pause(self._resume_at)
+                print(f"[broadcaster] 429 chat_id={chat_id}, {wait_sec:.0f}s 후 재시도")
+            except Forbidden as e:
+                print(f"[broadcaster] chat_id={chat_id} 차단됨: {e}")
+                return "blocked"
+            except BadRequest as e:
+                # NetworkError의 하위 클래스지만 영구 오류이므로 재시도하지 않음
+                print(f"[broadcaster] chat_id={chat_id} 잘못된 요청: {e}")
+                return "failed"
+            except NetworkError as e:
+                # TimedOut 포함 (BadRequest는 위에서 처리)
+                print(f"[broadcaster] chat_id={chat_id} 네트워크 오류: {e}")
+                if attempt < self.max_retries:
+                    await asyncio.sleep(network_delay)
+                    network_delay *= 2
+            except Exception as e:
+                print(f"[broadcaster] chat_id={chat_id} 전송 실패: {e}")
+                return "failed"
+
+        print(f"[broadcaster] chat_id={chat_id} 재시도 {self.max_retries}회 초과")
+        return "failed"
+
+    async def broadcast(self, chat_ids, text: str, **kwargs) -> dict:
+        """중복을 제거한 chat_ids 전체에 전송하고 delivered/failed/blocked 수를 반환합니다."""
+        chat_ids = list(dict.fromkeys(str(chat_id) for chat_id in chat_ids))
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def send_one(chat_id):
+            async with semaphore:
+                return chat_id, await self.send(chat_id, text, **kwargs)
+
+        started = time.monotonic()
+        outcomes = await asyncio.gather(*(send_one(chat_id) for chat_id in chat_ids))
+
+        result = {"delivered": 0, "failed": 0, "blocked": 0, "blocked_chat_ids": []}
+        for chat_id, outcome in outcomes:
+            result[outcome] += 1
+            if outcome == "blocked":
+                result["blocked_chat_ids"].append(chat_id)
+
+        print(
+            f"[broadcaster] {len(chat_ids)}명 전송 ({time.monotonic() - started:.1f}s): "
+            f"delivered={result['delivered']} failed={result['failed']} blocked={result['blocked']}"
+        )
+        return result
@@ -0,0 +1,115 @@
+"""
+Cache — 프로세스 내 TTL/LRU 캐시와 Upstash Redis 2단계 캐시
+
+  - TTLCache    : OrderedDict 기반 LRU + 항목별 만료 시각 (thread-safe)
+  - TieredCache : TTLCache(L1, warm 인스턴스) + Upstash Redis(L2, 인스턴스 간 공유)
+                  L2 hit은 L1에 다시 채워 넣습니다. 값은 JSON 직렬화 가능해야 합니다.
+
+Redis가 설정되지 않았거나 요청이 실패하면 L1만으로 동작합니다.
+"""
+
+import json
+import threading
+import time
+from collections import OrderedDict
+
+from lib import upstash
+
+_MISSING = object()
+
+
+class TTLCache:
+    """최대 maxsize개, 항목별 ttl초 동안 유지되는 LRU 캐시."""
+
+    def __init__(self, maxsize: int = 256, ttl: float = 300):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data = OrderedDict()  # key → (만료 시각, 값)
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+            if item is _MISSING:
+                return default
+            expires_at, value = item
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, ttl: float = None) -> None:
+        expires_at = time.monotonic() + (self.ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class TieredCache:
+    """L1(TTLCache) + L2(Upstash Redis) 캐시. namespace는 Redis key 접두어입니다."""
+
+    def __init__(self, namespace: str, maxsize: int = 256, ttl: float = 300, use_redis: bool = None):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.local = TTLCache(maxsize, ttl)
+        self._use_redis = use_redis
+
+    @property
+    def use_redis(self) -> bool:
+        if self._use_redis is None:
+            return upstash.is_configured()
+        return self._use_redis and upstash.is_configured()
+
+    def _redis_key(self, key: str) -> str:
+        return f"{self.namespace}:{key}"
+
+    def get(self, key: str, default=None):
+        value = self.local.get(key, _MISSING)
+        if value is not _MISSING:
+            return value
+        if not self.use_redis:
+            return default
+
+        raw = upstash.request("GET", self._redis_key(key))
+        if raw is None:
+            return default
+        try:
+            value = json.loads(raw)
+        except ValueError:
+            return default
+        self.local.set(key, value)
+        return value
+
+    def set(self, key: str, value, ttl: float = None) -> None:
+        ttl = self.ttl if ttl is None else ttl
+        self.local.set(key, value, ttl)
+        if self.use_redis:
+            upstash.request(
+                "SET",
+                self._redis_key(key),
+                json.dumps(value, ensure_ascii=False),
+                "EX",
+                max(1, int(ttl)),
+            )
+
+    def delete(self, key: str) -> None:
+        self.local.delete(key)
+        if self.use_redis:
+            upstash.request("DEL", self._redis_key(key))
@@ -0,0 +1,126 @@
+"""
+Dedup Index — 수집 기사 near-duplicate 판별용 inverted index
+
+lib.news_fetcher의 기존 중복 판단 규칙을 그대로 유지합니다.
+  1. URL 완전 일치 (query string 제거 후 비교)
+  2. 제목 substring 포함 관계
+  3. 제목 단어 겹침 비율 ≥ threshold (겹친 단어 수 / 더 짧은 제목의 단어 수)
+
+선택된 기사마다 제목 shingle을 한 번만 계산해 색인해 두고,
+새 후보는 색인에서 겹치는 기사만 찾아 확인합니다.
+  - 단어 inverted index      : 단어 → 기사 id (규칙 3의 겹침 수 집계)
+  - 문자 3-gram inverted index: 3-gram → 기사 id (규칙 2 후보 축소)
+후보마다 선택된 모든 기사를 다시 훑던 O(n²) 비교가 거의 선형 비용으로 줄어듭니다.
+"""
+
+from collections import Counter
+
+# 제목 substring 후보 축소에 쓰는 문자 shingle 길이
+_GRAM_SIZE = 3
+
+
+def _grams(text: str) -> set:
+    return {text[i:i + _GRAM_SIZE] for i in range(len(text) - _GRAM_SIZE + 1)}
+
+
+class DedupIndex:
+    """이미 선택된 기사 집합. is_duplicate()로 판별하고 add()로 추가합니다."""
+
+    def __init__(self, overlap_threshold: float = 0.6):
+        self._overlap_threshold = overlap_threshold
+        self._urls = set()
+        self._titles = []           # 기사 id → 소문자 제목
+        self._word_counts = []      # 기사 id → 제목 단어 집합 크기
+        self._word_postings = {}    # 단어 → [기사 id]
+        self._gram_postings = {}    # 제목에 포함된 3-gram → {기사 id}
+        self._head_postings = {}    # 제목의 첫 3-gram → [기사 id]
+        self._short_ids = []        # 3자 미만 제목 (3-gram 색인 불가)
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def is_duplicate(self, article: dict) -> bool:
+        url = article.get("link", "").split("?")[0]
+        if url and url in self._urls:
+            return True
+
+        title = article.get("title", "").lower()
+        if not title:
+            return False
+
+        return self._contains_match(title) or self._overlap_match(title)
+
+    def add(self, article: dict) -> None:
+        url = article.get("link", "").split("?")[0]
+        if url:
+            self._urls.add(url)
+
+        title = article.get("title", "").lower()
+        if not title:
+            return
+
+        article_id = len(self._titles)
+        self._titles.append(title)
+
+        words = set(title.split())
+        self._word_counts.append(len(words))
+        for word in words:
+            self._word_postings.setdefault(word, []).append(article_id)
+
+        if len(title) < _GRAM_SIZE:
+            self._short_ids.append(article_id)
+            return
+
+        for gram in _grams(title):
+            self._gram_postings.setdefault(gram, set()).add(article_id)
+        self._head_postings.setdefault(title[:_GRAM_SIZE], []).append(article_id)
+
+    def add_if_unique(self, article: dict) -> bool:
+        """중복이 아니면 추가하고 True, 중복이면 False를 반환합니다."""
+        if self.is_duplicate(article):
+            return False
+        self.add(article)
+        return True
+
+    # ── 규칙 2: 제목 substring 포함 ───────────────────────────────────────────
+
+    def _contains_match(self, title: str) -> bool:
+        # (a) title ⊂ 기존 제목: 기존 제목은 title의 모든 3-gram을 포함해야 함
+        if len(title) < _GRAM_SIZE:
+            candidates = range(len(self._titles))
+        else:
+            postings = [self._gram_postings.get(gram) for gram in _grams(title)]
+            if all(postings):
+                candidates = min(postings, key=len)
+            else:
+                candidates = ()
+        if any(title in self._titles[i] for i in candidates):
+            return True
+
+        # (b) 기존 제목 ⊂ title: 기존 제목의 첫 3-gram이 title 어딘가에 있어야 함
+        if any(self._titles[i] in title for i in self._short_ids):
+            return True
+        for gram in _grams(title):
+            for i in self._head_postings.get(gram, ()):
+                if self._titles[i] in title:
+                    return True
+
+        return False
+
+    # ── 규칙 3: 단어 겹침 비율 ────────────────────────────────────────────────
+
+    def _overlap_match(self, title: str) -> bool:
+        words = set(title.split())
+        if not words:
+            return False
+
+        shared = Counter()
+        for word in words:
+            shared.update(self._word_postings.get(word, ()))
+
+        for article_id, count in shared.items():
+            smaller = min(len(words), self._word_counts[article_id])
+            if smaller and count / smaller >= self._overlap_threshold:
+                return True
+
+        return False
@@ -0,0 +1,176 @@
+"""
+Feed Cache — RSS/Atom 피드 조건부 GET(ETag / Last-Modified) 캐시
+
+URL별로 validator(ETag, Last-Modified)와 파싱된 entry 목록을 저장해 두고,
+다음 요청에 If-None-Match / If-Modified-Since 헤더를 보냅니다.
+서버가 304 Not Modified를 반환하면 본문 전송과 XML 파싱 없이
+캐시된 entry를 그대로 재사용합니다.
+
+저장소 (FEED_CACHE_BACKEND 환경 변수):
+  - memory : 프로세스 내 dict (기본값, warm Vercel 인스턴스에서 재사용)
+  - redis  : Upstash Redis (인스턴스 간 공유)
+  - disk   : 로컬 JSON 파일 (FEED_CACHE_DIR, 기본값 .cache/feeds)
+
+웹훅(lib.news_fetcher)과 일일 배치(main.get_news_content)가 함께 사용합니다.
+"""
+
+import hashlib
+import json
+import os
+import time
+import urllib.error
+import urllib.request
+
+from lib import upstash
+
+_REDIS_KEY_PREFIX = "feed:cache:"
+# Redis에 남겨둘 최대 기간 (오래된 validator는 어차피 200으로 갱신됨)
+_REDIS_TTL_SEC = 7 * 24 * 3600
+_DEFAULT_DISK_DIR = os.path.join(".cache", "feeds")
+
+
+# ── 저장소 구현 ───────────────────────────────────────────────────────────────
+
+class MemoryFeedStore:
+    """프로세스 내 저장소. warm 인스턴스가 살아 있는 동안만 유지됩니다."""
+
+    def __init__(self):
+        self._records = {}
+
+    def get(self, key: str):
+        return self._records.get(key)
+
+    def set(self, key: str, record: dict) -> None:
+        self._records[key] = record
+
+
+class DiskFeedStore:
+    """로컬 디스크 저장소. 같은 머신에서 실행되는 프로세스 간에 공유됩니다."""
+
+    def __init__(self, directory: str = _DEFAULT_DISK_DIR):
+        self._directory = directory
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self._directory, f"{digest}.json")
+
+    def get(self, key: str):
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, record: dict) -> None:
+        path = self._path(key)
+        tmp_path = f"{path}.tmp"
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(record, f, ensure_ascii=False)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            print(f"[feed_cache] 디스크 캐시 저장 실패 ({path}): {e}")
+
+
+class RedisFeedStore:
+    """Upstash Redis 저장소. cold 인스턴스와 GitHub Actions 실행 간에 공유됩니다."""
+
+    def _redis_key(self, key: str) -> str:
+        return _REDIS_KEY_PREFIX + hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def get(self, key: str):
+        raw = upstash.request("GET", self._redis_key(key))
+        if not raw:
+            return None
+        try:
+            return json.loads(raw)
+        except ValueError:
+            return None
+
+    def set(self, key: str, record: dict) -> None:
+        upstash.request(
+            "SET",
+            self._redis_key(key),
+            json.dumps(record, ensure_ascii=False),
+            "EX",
+            _REDIS_TTL_SEC,
+        )
+
+
+_store = None
+
+
+def get_store():
+    """FEED_CACHE_BACKEND 설정에 맞는 저장소를 반환합니다 (프로세스당 1회 생성)."""
+    global _store
+    if _store is None:
+        backend = os.getenv("FEED_CACHE_BACKEND", "memory").strip().lower()
+        if backend == "redis" and upstash.is_configured():
+            _store = RedisFeedStore()
+        elif backend == "disk":
+            _store = DiskFeedStore(os.getenv("FEED_CACHE_DIR", _DEFAULT_DISK_DIR))
+        else:
+            if backend not in ("memory", ""):
+                print(f"[feed_cache] {backend} 저장소를 사용할 수 없어 memory로 대체합니다.")
+            _store = MemoryFeedStore()
+    return _store
+
+
+def set_store(store) -> None:
+    """저장소를 직접 지정합니다 (테스트·벤치마크용)."""
+    global _store
+    _store = store
+
+
+# ── Public API ────────────────────────────────────────────────────────────────
+
+def fetch_feed(
+    url: str,
+    parse,
+    headers: dict = None,
+    timeout: float = 10,
+    namespace: str = "",
+) -> list:
+    """
+    조건부 GET으로 피드를 가져와 parse(resp) 결과(entry 목록)를 반환합니다.
+
+    - parse: HTTP 응답 객체(file-like)를 받아 JSON 직렬화 가능한 entry 목록을 반환하는 함수
+    - namespace: 같은 URL을 서로 다른 parse 함수로 읽는 호출자를 구분하는 키 접두어
+    - 304 Not Modified이면 캐시된 entry 반환 (본문 전송·파싱 생략)
+    - 네트워크/파싱 오류는 호출 측으로 그대로 전달
+    """
+    store = get_store()
+    key = f"{namespace}:{url}"
+    cached = store.get(key)
+
+    req_headers = dict(headers or {})
+    if cached:
+        if cached.get("etag"):
+            req_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            req_headers["If-Modified-Since"] = cached["last_modified"]
+
+    req = urllib.request.Request(url, headers=req_headers)
+    try:
+        with urllib.request.urlopen(req, timeout=timeout) as resp:
+            entries = parse(resp)
+            etag = resp.headers.get("ETag")
+            last_modified = resp.headers.get("Last-Modified")
+    except urllib.error.HTTPError as e:
+        if e.code == 304 and cached:
+            return cached.get("entries", [])
+        raise
+
+    if etag or last_modified:
+        store.set(
+            key,
+            {
+                "etag": etag,
+                "last_modified": last_modified,
+                "entries": entries,
+                "fetched_at": time.time(),
+            },
+        )
+
+    return entries
@@ -0,0 +1,119 @@
+"""
+Feed Parser — xml.etree.ElementTree.iterparse 기반 스트리밍 RSS/Atom 파서
+
+응답 본문 전체를 읽어 트리를 만드는 대신, 스트림을 조금씩 읽으면서
+<item>/<entry>가 닫히는 즉시 entry dict로 변환합니다.
+
+  - 처리가 끝난 element는 트리에서 제거 → 메모리에는 item 1개 분량만 유지
+  - limit개를 채우면 더 이상 읽지 않고 종료 → 수백 KB 피드도 앞부분만 파싱
+  - namespace와 무관하게 local name으로 판별 (RSS 2.0 / RSS 1.0 / Atom)
+
+lib.news_fetcher(웹훅)와 main.py(일일 배치 XML fallback)가 함께 사용합니다.
+"""
+
+import time
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# entry로 취급할 element (local name)
+_ENTRY_TAGS = {"item", "entry"}
+# 필드별 후보 element (앞에 있을수록 우선)
+_SUMMARY_TAGS = ("description", "summary", "content")
+_DATE_TAGS = ("pubDate", "updated", "published", "date")
+
+
+def _parse_date(date_str: str) -> float:
+    """RFC 2822(RSS) 또는 ISO 8601(Atom) 날짜 문자열을 UNIX timestamp로 변환."""
+    if not date_str:
+        return time.time()
+    try:
+        return parsedate_to_datetime(date_str.strip()).timestamp()
+    except Exception:
+        pass
+    try:
+        s = date_str.strip().rstrip("Z")
+        if "+" in s:
+            s = s.split("+")[0]
+        return datetime.fromisoformat(s).replace(tzinfo=timezone.utc).timestamp()
+    except Exception:
+        return time.time()
+
+
+def _local_name(tag: str) -> str:
+    """'{namespace}name' 형태의 tag에서 name만 반환."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _text(el) -> str:
+    return (el.text or "").strip() if el is not None else ""
+
+
+def _entry_link(children: list) -> str:
+    """RSS <link>text</link>와 Atom <link href="..."/>를 모두 처리."""
+    fallback = ""
+    for child in children:
+        if _local_name(child.tag) != "link":
+            continue
+        href = child.get("href", "").strip()
+        if href:
+            if child.get("rel", "alternate") == "alternate":
+                return href
+            fallback = fallback or href
+        elif _text(child):
+            return _text(child)
+    return fallback
+
+
+def _build_entry(item) -> dict:
+    children = {}
+    for child in item:
+        children.setdefault(_local_name(child.tag), child)
+
+    summary_el = next((children[t] for t in _SUMMARY_TAGS if t in children), None)
+    date_el = next((children[t] for t in _DATE_TAGS if t in children), None)
+
+    return {
+        "title": _text(children.get("title")),
+        "link": _entry_link(list(item)),
+        "summary": _text(summary_el),
+        "pub_ts": _parse_date(_text(date_el)),
+    }
+
+
+def parse_feed_stream(fp, limit: int = None) -> list:
+    """
+    file-like 객체(HTTP 응답 등)에서 RSS/Atom entry를 스트리밍으로 파싱합니다.
+
+    - limit: 최대 entry 수. 채우는 즉시 읽기를 멈춥니다 (None이면 끝까지)
+    - 반환값: [{"title", "link", "summary", "pub_ts"}, ...]
+    - XML 오류는 ET.ParseError로 그대로 전달
+    """
+    entries = []
+    if limit is not None and limit <= 0:
+        return entries
+
+    stack = []      # 현재 열려 있는 element 경로 (parent 추적용)
+    item_depth = 0  # 열려 있는 <item>/<entry> 수
+
+    for event, el in ET.iterparse(fp, events=("start", "end")):
+        if event == "start":
+            stack.append(el)
+            if _local_name(el.tag) in _ENTRY_TAGS:
+                item_depth += 1
+            continue
+
+        stack.pop()
+        is_entry = _local_name(el.tag) in _ENTRY_TAGS
+        if is_entry:
+            item_depth -= 1
+            entries.append(_build_entry(el))
+            if limit is not None and len(entries) >= limit:
+                break
+
+        # item 내부 element는 item이 닫힐 때까지 유지, 그 밖의 element는 즉시 제거
+        if item_depth == 0 and stack:
+            el.clear()
+            stack[-1].remove(el)
+
+    return entries
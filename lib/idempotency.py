@@ -0,0 +1,56 @@
+"""
+Idempotency — 같은 작업(예: Telegram update_id)을 한 번만 처리하도록 선점(claim)합니다.
+
+  - claim    : SET <key> 1 NX EX <ttl>  (인스턴스 간 원자적 선점)
+  - complete : 처리가 끝난 key의 만료를 늘림 (SET <key> 1 EX <ttl>)
+  - Redis 미설정/실패 시: 프로세스 내 bounded LRU (TTLCache)로 대체
+
+Redis 요청이나 명령 자체가 실패하면 처리를 막지 않도록 로컬 LRU 기준으로 판단합니다 (fail-open).
+
+처리 전에 선점하므로, 처리 도중 함수가 종료되면(예: Vercel 30s 제한) 재전송도 무시됩니다.
+이를 줄이려면 처리 중에는 짧은 ttl로 선점하고, 끝난 뒤 complete로 만료를 늘립니다.
+그러면 짧은 ttl이 지난 뒤의 재전송은 다시 처리됩니다.
+"""
+
+import threading
+
+from lib import upstash
+from lib.cache import TTLCache
+
+_DEFAULT_TTL_SEC = 86400  # Telegram은 미처리 update를 최대 24시간 재전송
+_LOCAL_MAXSIZE = 10000
+
+_local_claims = TTLCache(maxsize=_LOCAL_MAXSIZE, ttl=_DEFAULT_TTL_SEC)
+_local_lock = threading.Lock()
+_COMMAND_ERROR = object()
+
+
+def _claim_local(key: str, ttl: float) -> bool:
+    with _local_lock:
+        if key in _local_claims:
+            return False
+        _local_claims.set(key, True, ttl=ttl)
+        return True
+
+
+def claim(key: str, ttl: float = _DEFAULT_TTL_SEC) -> bool:
+    """key를 처음 선점했으면 True, 이미 처리(중)인 key면 False."""
+    if upstash.is_configured():
+        # 요청 실패(None), 명령 오류(_COMMAND_ERROR), NX 미설정(nil)을 구분
+        results = upstash.pipeline([["SET", key, 1, "NX", "EX", int(ttl)]], error_value=_COMMAND_ERROR)
+        if results is not None and results[0] is not _COMMAND_ERROR:
+            claimed = results[0] == "OK"
+            if claimed:
+                _claim_local(key, ttl)
+            return claimed
+
+    return _claim_local(key, ttl)
+
+
+def complete(key: str, ttl: float = _DEFAULT_TTL_SEC) -> None:
+    """처리를 마친 key의 선점을 ttl 동안 유지합니다 (claim을 짧은 ttl로 한 경우)."""
+    with _local_lock:
+        _local_claims.set(key, True, ttl=ttl)
+    if upstash.is_configured():
+        upstash.request("SET", key, 1, "EX", int(ttl))
+
@@ -0,0 +1,78 @@
+"""
+Ingest — RSS 소스를 주기적으로 수집해 lib.article_index 색인에 upsert합니다.
+
+대상: RSS_SOURCES(웹훅 검색용) + DAILY_RSS_SOURCES(한국경제)
+웹훅 검색(lib.news_fetcher)은 live 모드와 같게 RSS_SOURCES 기사만 사용합니다.
+조건부 GET(lib.feed_cache)을 사용하므로 바뀌지 않은 피드는 본문을 받지 않습니다.
+
+실행:
+  ARTICLE_INDEX_PATH=.cache/articles.db python -m lib.ingest            # 5분마다 반복
+  ARTICLE_INDEX_PATH=.cache/articles.db python -m lib.ingest --once     # 1회 수집
+"""
+
+import argparse
+import time
+
+from lib import article_index
+from lib.news_fetcher import fetch_feeds, strip_html
+from lib.rss_config import DAILY_RSS_SOURCES, RSS_SOURCES
+
+_DEFAULT_INTERVAL_SEC = 300
+# 수집기는 사용자 응답 경로가 아니므로 느린 소스도 넉넉히 기다림
+_INGEST_DEADLINE_SEC = 60.0
+
+
+def ingest_once(path: str) -> int:
+    """모든 소스를 1회 수집해 색인에 반영하고, 추가·변경된 기사 수를 반환합니다."""
+    sources = RSS_SOURCES + DAILY_RSS_SOURCES
+    # limit=None: 피드에 있는 기사를 모두 색인
+    entries_by_source, dropped = fetch_feeds(sources, _INGEST_DEADLINE_SEC, limit=None)
+
+    articles = []
+    for source in sources:
+        for entry in entries_by_source.get(source["name"], []):
+            title = entry.get("title", "").strip()
+            if not title:
+                continue
+            articles.append(
+                {
+                    "title": title,
+                    "link": entry.get("link", "").strip(),
+                    "description": strip_html(entry.get("summary", ""))[:400],
+                    "source": source["name"],
+                    "pub_ts": entry.get("pub_ts", time.time()),
+                }
+            )
+
+    conn = article_index.connect(path, create=True)
+    try:
+        changed = article_index.upsert_articles(conn, articles)
+        pruned = article_index.prune(conn)
+    finally:
+        conn.close()
+
+    print(
+        f"[ingest] 수집 {len(articles)}건, 추가/변경 {changed}건, 만료 삭제 {pruned}건"
+        + (f", 제외된 소스: {', '.join(dropped)}" if dropped else "")
+    )
+    return changed
+
+
+def run(path: str, interval_sec: float = _DEFAULT_INTERVAL_SEC, once: bool = False) -> None:
+    while True:
+        try:
+            ingest_once(path)
+        except Exception as e:
+            print(f"[ingest] 수집 실패: {e}")
+        if once:
+            return
+        time.sleep(interval_sec)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="RSS 기사 색인 수집기")
+    parser.add_argument("--path", default=article_index.index_path() or ".cache/articles.db")
+    parser.add_argument("--interval", type=float, default=_DEFAULT_INTERVAL_SEC, help="수집 주기(초)")
+    parser.add_argument("--once", action="store_true", help="1회만 수집하고 종료")
+    args = parser.parse_args()
+    run(args.path, args.interval, args.once)
@@ -2,9 +2,9 @@
 Intent Filter — 사용자 메시지가 뉴스/시장 동향 질문인지 판단합니다.
 
 처리 순서:
-  Stage 1: Keyword pre-filter  (빠름, LLM 호출 없음)
+  Stage 1: Keyword pre-filter  (빠름, LLM 호출 없음, Aho–Corasick 단일 패스)
   Stage 2: Pattern-based OTHER 조기 거절 (LLM 호출 없음)
-  Stage 3: LLM classifier       (Stage 1·2에서 판단 불가한 경우에만)
+  Stage 3: LLM classifier       (Stage 1·2에서 판단 불가한 경우에만, 판정은 캐시)
 
 반환값: 'NEWS' | 'OTHER'
 """
@@ -12,6 +12,10 @@ Intent Filter — 사용자 메시지가 뉴스/시장 동향 질문인지 판
 import os
 import re
 
+from lib import llm_client
+from lib.cache import TieredCache
+from lib.keyword_matcher import KeywordAutomaton
+
 # ── Stage 1: 뉴스 관련 키워드 목록 ────────────────────────────────────────────
 NEWS_KEYWORDS = [
     # 한국어
@@ -46,18 +50,23 @@ _NON_NEWS_PATTERNS = [
 
 _non_news_re = [re.compile(p, re.IGNORECASE) for p in _NON_NEWS_PATTERNS]
 
-_MODEL_PRIORITY = [
-    "gemini-2.5-flash",
-    "gemini-3-flash-preview",
-    "gemini-2.0-flash",
-    "gemini-2.5-pro",
-    "gemini-2.5-flash-lite",
-]
+# NEWS_KEYWORDS 전체를 한 번에 찾는 Aho–Corasick 오토마톤 (import 시 1회 생성)
+_news_keyword_matcher = KeywordAutomaton(NEWS_KEYWORDS)
+
+# Stage 3 판정 캐시: 정규화된 메시지 → 'NEWS' | 'OTHER'
+#   프로세스 내 LRU + (설정 시) Upstash Redis. INTENT_CACHE_REDIS=0 으로 Redis 사용 해제.
+_INTENT_CACHE_TTL_SEC = 24 * 3600
+_INTENT_CACHE_MAXSIZE = 1024
+_intent_cache = TieredCache(
+    "intent:verdict",
+    maxsize=_INTENT_CACHE_MAXSIZE,
+    ttl=_INTENT_CACHE_TTL_SEC,
+    use_redis=os.getenv("INTENT_CACHE_REDIS", "1") != "0",
+)
 
 
 def _keyword_match(text: str) -> bool:
-    text_lower = text.lower()
-    return any(kw.lower() in text_lower for kw in NEWS_KEYWORDS)
+    return _news_keyword_matcher.search(text)
 
 
 def _is_obvious_non_news(text: str) -> bool:
@@ -67,46 +76,59 @@ def _is_obvious_non_news(text: str) -> bool:
     return False
 
 
+def _normalize_text(text: str) -> str:
+    """캐시 key용 메시지 정규화: 소문자, 문장부호 제거, 공백 정리."""
+    return " ".join(re.findall(r"[가-힣A-Za-z0-9&]+", text.lower()))
+
+
 def _llm_classify(text: str) -> str:
     """
     불명확한 경우에만 호출되는 경량 LLM 분류기.
+    같은(정규화 기준) 메시지의 판정은 캐시에서 재사용합니다 (NEWS·OTHER 모두).
     반환값: 'NEWS' | 'OTHER'
     """
-    try:
-        import google.generativeai as genai
-
-        api_key = os.getenv("GEMINI_API_KEY")
-        if not api_key:
-            return "NEWS"  # API 키 없으면 NEWS로 허용 (false negative 방지)
-
-        genai.configure(api_key=api_key)
-
-        prompt = (
-            "Classify the following user message as NEWS or OTHER.\n\n"
-            "NEWS: questions about financial news, market trends, stock prices, "
-            "economic indicators, company performance, crypto, commodities, "
-            "interest rates, or any request for recent market/financial information.\n"
-            "OTHER: greetings, personal questions, general knowledge, jokes, "
-            "cooking, weather, programming help, or anything unrelated to "
-            "financial/economic news.\n\n"
-            "Respond with ONLY one word: NEWS or OTHER.\n\n"
-            f"Message: {text}"
-        )
-
-        for model_name in _MODEL_PRIORITY:
-            try:
-                model = genai.GenerativeModel(model_name)
-                response = model.generate_content(prompt)
-                result = response.text.strip().upper()
-                return "NEWS" if "NEWS" in result else "OTHER"
-            except Exception as e:
-                print(f"[intent_filter] {model_name} 분류 실패, 다음 모델 시도: {e}")
-                continue
+    cache_key = _normalize_text(text)
+    if cache_key:
+        cached = _intent_cache.get(cache_key)
+        if cached in ("NEWS", "OTHER"):
+            return cached
+
+    verdict = _llm_classify_uncached(text)
+    if verdict is None:
+        return "NEWS"  # 분류 실패 시 NEWS로 허용 (서비스 가용성 우선, 캐시하지 않음)
 
+    if cache_key:
+        _intent_cache.set(cache_key, verdict)
+    return verdict
+
+
+def _llm_classify_uncached(text: str):
+    """
+    Gemini로 분류합니다 (lib.llm_client).
+    반환값: 'NEWS' | 'OTHER', API 키가 없거나 모든 모델이 실패하면 None
+    """
+    if not llm_client.is_configured():
+        return None  # API 키 없으면 NEWS로 허용 (false negative 방지)
+
+    prompt = (
+        "Classify the following user message as NEWS or OTHER.\n\n"
+        "NEWS: questions about financial news, market trends, stock prices, "
+        "economic indicators, company performance, crypto, commodities, "
+        "interest rates, or any request for recent market/financial information.\n"
+        "OTHER: greetings, personal questions, general knowledge, jokes, "
+        "cooking, weather, programming help, or anything unrelated to "
+        "financial/economic news.\n\n"
+        "Respond with ONLY one word: NEWS or OTHER.\n\n"
+        f"Message: {text}"
+    )
+
+    try:
+        result = llm_client.generate(prompt, caller="intent_filter").strip().upper()
     except Exception as e:
         print(f"[intent_filter] LLM 분류 실패, NEWS로 기본처리: {e}")
+        return None
 
-    return "NEWS"  # 분류 실패 시 NEWS로 허용 (서비스 가용성 우선)
+    return "NEWS" if "NEWS" in result else "OTHER"
 
 
 def classify_intent(text: str) -> str:
@@ -0,0 +1,63 @@
+"""
+Job Queue — Upstash Redis 리스트 기반의 내구성 있는 작업 큐
+
+  - push    : LPUSH <name>:pending (JSON 직렬화)
+  - claim   : LMOVE pending → processing (꺼낸 작업은 ack 전까지 processing에 남음)
+  - ack     : LREM processing (처리 완료)
+  - requeue_processing : 처리 중 죽은 작업을 pending 앞쪽으로 되돌림
+
+pending은 FIFO (왼쪽에 넣고 오른쪽에서 꺼냄)입니다.
+UPSTASH_BACKEND=local 이면 lib.upstash의 메모리 저장소를 사용합니다 (같은 프로세스 안에서만 공유).
+"""
+
+import json
+
+from lib import upstash
+
+
+class JobQueue:
+    """name 접두사를 쓰는 pending/processing 리스트 한 쌍."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.pending_key = f"{name}:pending"
+        self.processing_key = f"{name}:processing"
+
+    def is_available(self) -> bool:
+        return upstash.is_configured()
+
+    def push(self, payload: dict) -> bool:
+        """작업을 큐에 넣습니다. Redis를 쓸 수 없으면 False."""
+        raw = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        return upstash.request("LPUSH", self.pending_key, raw) is not None
+
+    def claim(self):
+        """
+        가장 오래된 작업 1개를 processing으로 옮기고 (raw, payload)를 반환합니다.
+        큐가 비었거나 실패하면 None. raw는 ack에 그대로 넘겨야 합니다.
+        """
+        raw = upstash.request("LMOVE", self.pending_key, self.processing_key, "RIGHT", "LEFT")
+        if raw is None:
+            return None
+        try:
+            return raw, json.loads(raw)
+        except ValueError:
+            print(f"[job_queue] 잘못된 작업을 버립니다: {raw[:200]!r}")
+            self.ack(raw)
+            return None
+
+    def ack(self, raw: str) -> None:
+        upstash.request("LREM", self.processing_key, 1, raw)
+
+    def requeue_processing(self) -> int:
+        """
+        processing에 남은 작업을 모두 pending 앞쪽(다음 claim 대상)으로 되돌립니다.
+        다른 worker가 처리 중인 작업도 옮기므로 실행 중인 worker가 없을 때만 사용하세요.
+        """
+        moved = 0
+        while upstash.request("LMOVE", self.processing_key, self.pending_key, "LEFT", "RIGHT") is not None:
+            moved += 1
+        return moved
+
+    def __len__(self) -> int:
+        return int(upstash.request("LLEN", self.pending_key) or 0)
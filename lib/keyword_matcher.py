@@ -0,0 +1,112 @@
+"""
+Keyword Matcher — Aho–Corasick 다중 패턴 키워드 매칭
+
+키워드 목록으로 오토마톤을 한 번 만들어 두면, 텍스트를 한 번만 훑어서
+모든 키워드 등장 위치와 횟수를 찾습니다.
+키워드마다 `kw in text`를 반복하던 O(키워드 수 × 텍스트 길이) 비용이
+O(텍스트 길이 + 매치 수)로 줄어, 키워드·기업명 목록이 수천 개로 늘어도
+메시지 처리 시간은 거의 변하지 않습니다.
+
+매칭은 대소문자를 구분하지 않습니다 (키워드와 텍스트 모두 str.lower() 적용).
+반환되는 위치는 소문자로 변환한 텍스트 기준입니다.
+"""
+
+import re
+from collections import Counter, deque
+
+
+class KeywordAutomaton:
+    """키워드 목록으로 만든 Aho–Corasick 오토마톤."""
+
+    def __init__(self, keywords):
+        # 소문자 기준으로 중복 제거, 빈 문자열은 제외
+        self.keywords = list(dict.fromkeys(kw.lower() for kw in keywords if kw))
+
+        self._goto = [{}]   # 상태 → {문자: 다음 상태}
+        self._fail = [0]    # 상태 → 실패 링크
+        self._output = [()]  # 상태 → 이 상태에서 끝나는 키워드 index 목록
+
+        for index, keyword in enumerate(self.keywords):
+            self._insert(keyword, index)
+        self._build_fail_links()
+
+        # 키워드 첫 글자 문자 클래스 (매치가 시작될 수 없는 구간을 건너뛰는 용도)
+        first_chars = "".join(sorted(self._goto[0]))
+        self._start_re = re.compile(f"[{re.escape(first_chars)}]" if first_chars else r"(?!)")
+
+    def _insert(self, keyword: str, index: int) -> None:
+        state = 0
+        for ch in keyword:
+            next_state = self._goto[state].get(ch)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+                self._goto[state][ch] = next_state
+            state = next_state
+        self._output[state] = self._output[state] + (index,)
+
+    def _build_fail_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                fail_target = self._goto[fail].get(ch, 0)
+                self._fail[next_state] = fail_target if fail_target != next_state else 0
+                # 접미사 관계인 키워드 출력을 미리 합쳐 둠 (매칭 시 링크 추적 불필요)
+                self._output[next_state] = self._output[next_state] + self._output[self._fail[next_state]]
+
+    def _scan(self, text: str):
+        """(끝 위치, 키워드 index)를 등장 순서대로 생성."""
+        goto, fail, output = self._goto, self._fail, self._output
+        skip_to_start = self._start_re.search
+        text = text.lower()
+        length = len(text)
+        state = 0
+        pos = 0
+        while pos < length:
+            if not state:
+                # root 상태에서는 키워드 첫 글자가 나올 때까지 C 레벨 정규식으로 건너뜀
+                match = skip_to_start(text, pos)
+                if match is None:
+                    return
+                pos = match.start()
+            ch = text[pos]
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in output[state]:
+                yield pos, index
+            pos += 1
+
+    def find_all(self, text: str) -> list:
+        """모든 매치를 [(시작 위치, 키워드), ...] 형태로 반환 (겹치는 매치 포함)."""
+        return [
+            (end - len(self.keywords[index]) + 1, self.keywords[index])
+            for end, index in self._scan(text)
+        ]
+
+    def iter_keywords(self, text: str):
+        """매치된 키워드를 등장 순서대로 생성 (같은 키워드가 여러 번 나오면 여러 번)."""
+        keywords = self.keywords
+        for _, index in self._scan(text):
+            yield keywords[index]
+
+    def counts(self, text: str) -> Counter:
+        """키워드별 등장 횟수."""
+        return Counter(self.keywords[index] for _, index in self._scan(text))
+
+    def matched(self, text: str) -> set:
+        """텍스트에 한 번 이상 등장한 키워드 집합."""
+        return {self.keywords[index] for _, index in self._scan(text)}
+
+    def search(self, text: str) -> bool:
+        """키워드가 하나라도 있으면 True (첫 매치에서 바로 종료)."""
+        for _ in self._scan(text):
+            return True
+        return False
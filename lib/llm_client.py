@@ -0,0 +1,268 @@
+"""
+LLM Client — Gemini 공용 클라이언트 (main.py, intent_filter, news_summarizer 공통)
+
+  - 모델 우선순위(MODEL_PRIORITY)를 한 곳에서 관리
+  - genai.configure는 API 키당 1회만 호출
+  - 모델별 health 추적: 최근 _WINDOW_SEC 동안(최대 _WINDOW_SIZE회) 결과 오류율 + latency EWMA
+  - circuit breaker: 연속 실패 / 높은 오류율이면 open → _COOLDOWN_SEC 후 half-open(시험 호출 1회)
+                     시험 호출은 probe_at을 먼저 기록한 호출 하나만 하고, 나머지는 결과가 날 때까지 건너뜀
+  - 호출 순서: open 상태가 아닌 모델을 health 순(오류율 → latency → 기본 우선순위)으로 정렬
+  - health 상태는 Upstash Redis hash에 모델별 field로 저장해 serverless 호출 간 공유
+    (LLM_HEALTH_REDIS=0 이면 프로세스 내만). 이 인스턴스에서 바뀐 모델만 HSET하므로
+    다른 인스턴스가 바꾼 모델의 circuit·시험 호출 상태를 오래된 값으로 덮어쓰지 않음
+    circuit 상태가 바뀔 때는 바로, 그 외(오류율·latency)는 최대 _HEALTH_SYNC_INTERVAL_SEC마다 저장
+
+장애 중인 모델을 매 요청마다 먼저 호출하고 실패를 기다리는 비용을 없앱니다.
+"""
+
+import json
+import os
+import threading
+import time
+
+from lib import upstash
+
+MODEL_PRIORITY = (
+    "gemini-2.5-flash",
+    "gemini-3-flash-preview",
+    "gemini-2.0-flash",
+    "gemini-2.5-pro",
+    "gemini-2.5-flash-lite",
+)
+
+# health / circuit breaker 설정
+_WINDOW_SIZE = 20                 # 오류율 계산에 쓰는 최근 호출 수
+_WINDOW_SEC = 10 * 60             # 이보다 오래된 결과는 버림 (강등된 모델이 다시 우선순위를 회복)
+_MIN_CALLS_FOR_RATE = 5           # 오류율로 circuit을 열기 위한 최소 호출 수
+_ERROR_RATE_THRESHOLD = 0.5
+_CONSECUTIVE_FAILURE_THRESHOLD = 3
+_COOLDOWN_SEC = 60.0
+_PROBE_TIMEOUT_SEC = 60.0         # 시험 호출 결과가 이 시간 안에 없으면 (호출 측 종료 등) 다른 호출이 다시 시험
+_LATENCY_EWMA_ALPHA = 0.3
+_LATENCY_BUCKET_SEC = 5.0         # 이 단위 이상 차이 날 때만 latency로 순서를 바꿈
+
+_HEALTH_REDIS_KEY = "llm:health:models"  # hash: model → health JSON
+_HEALTH_REDIS_TTL_SEC = 24 * 3600
+_HEALTH_SYNC_INTERVAL_SEC = 30.0
+
+
+class LLMUnavailableError(RuntimeError):
+    """API 키가 없거나 모든 모델 호출이 실패한 경우."""
+
+
+_lock = threading.Lock()
+_health = {}  # model → {"outcomes": [[ts, 1|0], ...], "latency": float|None, "failures": int,
+#                        "opened_at": float, "probe_at": float}
+_last_sync = 0.0
+_last_save = 0.0
+_circuit_changed = False  # 마지막 저장 이후 circuit 상태(open·half-open 시험·연속 실패) 변경 여부
+_unsaved = set()  # 마지막 저장 이후 상태가 바뀐 모델
+_configured_key = None
+
+
+def is_configured() -> bool:
+    return bool(os.getenv("GEMINI_API_KEY"))
+
+
+def _configure():
+    """genai 모듈을 반환합니다. configure는 API 키가 바뀔 때만 호출."""
+    global _configured_key
+    import google.generativeai as genai
+
+    api_key = os.getenv("GEMINI_API_KEY")
+    if not api_key:
+        raise LLMUnavailableError("GEMINI_API_KEY가 설정되지 않았습니다.")
+    if api_key != _configured_key:
+        genai.configure(api_key=api_key)
+        _configured_key = api_key
+    return genai
+
+
+# ── health 상태 ───────────────────────────────────────────────────────────────
+
+def _use_redis() -> bool:
+    return os.getenv("LLM_HEALTH_REDIS", "1") != "0" and upstash.is_configured()
+
+
+def _model_health(model: str) -> dict:
+    state = _health.setdefault(model, {"outcomes": [], "latency": None, "failures": 0, "opened_at": 0.0})
+    state.setdefault("probe_at", 0.0)  # 이전 형식으로 저장된 상태
+    return state
+
+
+def _load_health() -> None:
+    """Redis의 health 상태를 최대 _HEALTH_SYNC_INTERVAL_SEC마다 한 번 불러옵니다."""
+    global _last_sync
+    now = time.time()
+    if not _use_redis() or now - _last_sync < _HEALTH_SYNC_INTERVAL_SEC:
+        return
+    _last_sync = now
+
+    fields = upstash.request("HGETALL", _HEALTH_REDIS_KEY)
+    if not fields:
+        return
+    with _lock:
+        for model, raw in zip(fields[::2], fields[1::2]):
+            # 아직 저장하지 않은 이 인스턴스의 변경이 더 최신
+            if model not in MODEL_PRIORITY or model in _unsaved:
+                continue
+            try:
+                _health[model] = json.loads(raw)
+            except ValueError:
+                continue
+
+
+def _save_health() -> None:
+    """
+    바뀐 모델의 상태만 저장합니다 (circuit 상태가 바뀌었으면 바로,
+    그 외에는 마지막 저장 후 _HEALTH_SYNC_INTERVAL_SEC가 지났을 때).
+    """
+    global _last_save, _circuit_changed
+    if not _use_redis():
+        return
+    now = time.time()
+    with _lock:
+        if not _unsaved or (not _circuit_changed and now - _last_save < _HEALTH_SYNC_INTERVAL_SEC):
+            return
+        fields = []
+        for model in sorted(_unsaved):
+            fields += [model, json.dumps(_health[model])]
+        _unsaved.clear()
+        _last_save = now
+        _circuit_changed = False
+    upstash.pipeline([
+        ["HSET", _HEALTH_REDIS_KEY, *fields],
+        ["EXPIRE", _HEALTH_REDIS_KEY, _HEALTH_REDIS_TTL_SEC],
+    ])
+
+
+def _recent_outcomes(state: dict, now: float) -> list:
+    return [ok for ts, ok in state["outcomes"] if now - ts <= _WINDOW_SEC]
+
+
+def _record(model: str, ok: bool, latency: float) -> None:
+    global _circuit_changed
+    now = time.time()
+    with _lock:
+        state = _model_health(model)
+        _unsaved.add(model)
+        before = (state["failures"], state["opened_at"], state["probe_at"])
+        state["probe_at"] = 0.0
+        state["outcomes"] = [
+            outcome for outcome in state["outcomes"] if now - outcome[0] <= _WINDOW_SEC
+        ][-(_WINDOW_SIZE - 1):] + [[now, 1 if ok else 0]]
+        if ok:
+            previous = state["latency"]
+            state["latency"] = latency if previous is None else (
+                _LATENCY_EWMA_ALPHA * latency + (1 - _LATENCY_EWMA_ALPHA) * previous
+            )
+            state["failures"] = 0
+            state["opened_at"] = 0.0
+            _circuit_changed |= before != (0, 0.0, 0.0)
+            return
+
+        state["failures"] += 1
+        outcomes = _recent_outcomes(state, now)
+        error_rate = 1 - sum(outcomes) / len(outcomes)
+        if (
+            state["failures"] >= _CONSECUTIVE_FAILURE_THRESHOLD
+            or (len(outcomes) >= _MIN_CALLS_FOR_RATE and error_rate >= _ERROR_RATE_THRESHOLD)
+            or state["opened_at"]  # half-open 시험 호출 실패 → 다시 open
+        ):
+            state["opened_at"] = now
+        _circuit_changed = True  # 연속 실패 수는 항상 바뀜
+
+
+def _error_rate(state: dict, now: float) -> float:
+    outcomes = _recent_outcomes(state, now)
+    return 1 - sum(outcomes) / len(outcomes) if outcomes else 0.0
+
+
+def model_order() -> list:
+    """
+    이번 호출에서 시도할 모델 순서.
+    open circuit 모델은 제외하고(cooldown이 지나면 half-open으로 포함),
+    모두 open이면 기본 우선순위 그대로 시도합니다.
+    """
+    now = time.time()
+    with _lock:
+        candidates = []
+        for priority, model in enumerate(MODEL_PRIORITY):
+            state = _model_health(model)
+            if state["opened_at"] and now - state["opened_at"] < _COOLDOWN_SEC:
+                continue
+            latency_bucket = int((state["latency"] or 0.0) // _LATENCY_BUCKET_SEC)
+            candidates.append((round(_error_rate(state, now), 1), latency_bucket, priority, model))
+
+    if not candidates:
+        return list(MODEL_PRIORITY)
+    return [model for *_, model in sorted(candidates)]
+
+
+def _begin_attempt(model: str) -> bool:
+    """
+    model을 이번에 호출해도 되는지. half-open(cooldown이 지난 open) 모델은
+    시험 호출 자격(probe_at)을 먼저 잡은 호출 하나만 True, 결과가 기록될 때까지 나머지는 False.
+    """
+    global _circuit_changed
+    now = time.time()
+    with _lock:
+        state = _model_health(model)
+        if not state["opened_at"] or now - state["opened_at"] < _COOLDOWN_SEC:
+            return True  # closed, 또는 모두 open이라 기본 순서로 시도하는 경우
+        if state["probe_at"] and now - state["probe_at"] < _PROBE_TIMEOUT_SEC:
+            return False
+        state["probe_at"] = now
+        _unsaved.add(model)
+        _circuit_changed = True
+        return True
+
+
+def health_snapshot() -> dict:
+    """모델별 오류율·latency·circuit 상태 (로그·벤치마크용)."""
+    now = time.time()
+    with _lock:
+        return {
+            model: {
+                "error_rate": round(_error_rate(_model_health(model), now), 3),
+                "latency": _model_health(model)["latency"],
+                "open": bool(_model_health(model)["opened_at"])
+                and now - _model_health(model)["opened_at"] < _COOLDOWN_SEC,
+            }
+            for model in MODEL_PRIORITY
+        }
+
+
+# ── Public API ────────────────────────────────────────────────────────────────
+
+def generate(prompt: str, generation_config: dict = None, caller: str = "llm_client") -> str:
+    """
+    health 순서대로 모델을 시도해 첫 성공 응답의 text를 반환합니다.
+    모든 모델이 실패하면 LLMUnavailableError.
+    """
+    genai = _configure()
+    _load_health()
+
+    try:
+        for model_name in model_order():
+            if not _begin_attempt(model_name):
+                continue  # 다른 호출이 half-open 시험 중
+            start = time.monotonic()
+            try:
+                model = genai.GenerativeModel(model_name)
+                if generation_config:
+                    response = model.generate_content(prompt, generation_config=generation_config)
+                else:
+                    response = model.generate_content(prompt)
+                text = response.text
+            except Exception as e:
+                _record(model_name, False, time.monotonic() - start)
+                print(f"[{caller}] {model_name} 실패, 다음 모델 시도: {e}")
+                continue
+
+            _record(model_name, True, time.monotonic() - start)
+            return text
+    finally:
+        _save_health()
+
+    raise LLMUnavailableError("모든 가용 모델의 호출에 실패했습니다.")
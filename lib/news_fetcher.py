@@ -2,30 +2,41 @@
 News Fetcher — RSS 피드 수집, relevance 스코어링, 중복 제거
 
 처리 흐름:
-  1. 각 RSS_SOURCES에서 최근 기사 수집 (stdlib: urllib + xml.etree.ElementTree)
-  2. 사용자 질문 키워드 기반 relevance score 계산
-  3. score 내림차순 정렬
-  4. URL·제목 유사도 기반 중복 제거
+  1. 각 RSS_SOURCES에서 최근 기사 동시 수집 (stdlib: urllib + lib.feed_parser 스트리밍 파서)
+     - 전체 수집 시간 예산(deadline) 안에 끝난 소스만 사용, 나머지는 제외 기록
+     - lib.feed_cache 조건부 GET: 변경 없는 피드(304)는 캐시된 entry 재사용
+     - ARTICLE_INDEX_PATH 색인이 최신이면 RSS 대신 lib.article_index(FTS5)에서 후보 조회
+  2. 사용자 질문 키워드 기반 relevance score 계산 (lib.ranking: BM25 + recency decay)
+  3. score 내림차순으로 heap에서 필요한 만큼만 선택
+  4. URL·제목 유사도 기반 중복 제거 (lib.dedup inverted index)
   5. 상위 max_articles개 반환
 """
 
+import os
 import re
 import time
-import urllib.request
-import xml.etree.ElementTree as ET
-from datetime import datetime, timezone
-from email.utils import parsedate_to_datetime
-
+from concurrent.futures import ThreadPoolExecutor, wait
+from datetime import datetime
+
+from lib import article_index
+from lib.dedup import DedupIndex
+from lib.feed_cache import fetch_feed
+from lib.feed_parser import parse_feed_stream
+from lib.ranking import iter_ranked, rank_articles
 from lib.rss_config import RSS_SOURCES
 
 # 각 소스에서 가져올 최대 기사 수
 _FEED_FETCH_LIMIT = 15
 
-# relevance score 가중치
-_TITLE_MATCH_WEIGHT = 3.0
-_DESC_MATCH_WEIGHT = 1.0
-_RECENCY_6H_BONUS = 2.0
-_RECENCY_24H_BONUS = 1.0
+# 피드 수집 시간 제한
+#   - 소스별 urlopen timeout과 별개로, 전체 수집에 쓰는 시간 예산을 둡니다.
+#   - vercel.json maxDuration(30s) 안에 요약·응답까지 끝나도록 여유를 남깁니다.
+_FEED_TIMEOUT_SEC = 10
+_FETCH_DEADLINE_SEC = 12.0
+_FETCH_MAX_WORKERS = 8
+
+# 색인 모드에서 검색할 기간 (live 모드는 피드별 최근 _FEED_FETCH_LIMIT건만 볼 수 있음)
+_INDEX_LOOKBACK_DAYS = 3
 
 # 중복 제거: 제목 단어 겹침 임계값
 _DEDUP_WORD_OVERLAP_THRESHOLD = 0.6
@@ -42,75 +53,26 @@ _STOPWORDS = {
     "any", "some", "please", "can", "you",
 }
 
-_ATOM_NS = "http://www.w3.org/2005/Atom"
-_DC_NS = "http://purl.org/dc/elements/1.1/"
-
-
-# ── Minimal stdlib RSS/Atom parser ───────────────────────────────────────────
-
-def _parse_date(date_str: str) -> float:
-    """RFC 2822(RSS) 또는 ISO 8601(Atom) 날짜 문자열을 UNIX timestamp로 변환."""
-    if not date_str:
-        return time.time()
-    try:
-        return parsedate_to_datetime(date_str.strip()).timestamp()
-    except Exception:
-        pass
-    try:
-        s = date_str.strip().rstrip("Z")
-        if "+" in s:
-            s = s.split("+")[0]
-        return datetime.fromisoformat(s).replace(tzinfo=timezone.utc).timestamp()
-    except Exception:
-        return time.time()
-
-
-def _text(el) -> str:
-    return (el.text or "").strip() if el is not None else ""
 
+# ── RSS/Atom 피드 수집 ────────────────────────────────────────────────────────
 
-def _parse_feed(url: str) -> list:
-    """URL에서 RSS/Atom 피드를 가져와 entry dict 목록으로 반환."""
+def _parse_feed(url: str, timeout: float = _FEED_TIMEOUT_SEC, limit: int = _FEED_FETCH_LIMIT) -> list:
+    """
+    URL에서 RSS/Atom 피드를 가져와 최대 limit개(None이면 전체) entry dict 목록으로 반환.
+    lib.feed_cache의 조건부 GET을 사용하므로 피드가 바뀌지 않았으면 파싱을 생략합니다.
+    """
     try:
-        req = urllib.request.Request(url, headers={"User-Agent": "Mozilla/5.0"})
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            content = resp.read()
-        root = ET.fromstring(content)
+        return fetch_feed(
+            url,
+            lambda resp: parse_feed_stream(resp, limit=limit),
+            headers={"User-Agent": "Mozilla/5.0"},
+            timeout=timeout,
+            namespace=f"news_fetcher:{limit}",
+        )
     except Exception as e:
         print(f"[news_fetcher] 피드 파싱 실패 ({url}): {e}")
         return []
 
-    entries = []
-
-    # Atom feed
-    if root.tag == f"{{{_ATOM_NS}}}feed" or root.tag.endswith("}feed"):
-        ns = _ATOM_NS if root.tag == f"{{{_ATOM_NS}}}feed" else root.tag[1:root.tag.index("}")]
-        for item in root.findall(f"{{{ns}}}entry"):
-            link_el = item.find(f"{{{ns}}}link")
-            link = link_el.get("href", "").strip() if link_el is not None else ""
-            date_el = item.find(f"{{{ns}}}updated") or item.find(f"{{{ns}}}published")
-            summary_el = item.find(f"{{{ns}}}summary") or item.find(f"{{{ns}}}content")
-            entries.append({
-                "title": _text(item.find(f"{{{ns}}}title")),
-                "link": link,
-                "summary": _text(summary_el),
-                "pub_ts": _parse_date(_text(date_el)),
-            })
-
-    # RSS 2.0 / RSS 1.0
-    else:
-        channel = root.find("channel") or root
-        for item in (channel.findall("item") or root.findall("item")):
-            pub_el = item.find("pubDate") or item.find(f"{{{_DC_NS}}}date")
-            entries.append({
-                "title": _text(item.find("title")),
-                "link": _text(item.find("link")),
-                "summary": _text(item.find("description")),
-                "pub_ts": _parse_date(_text(pub_el)),
-            })
-
-    return entries
-
 
 # ── 내부 유틸리티 ─────────────────────────────────────────────────────────────
 
@@ -118,11 +80,6 @@ def _parse_pub_timestamp(entry: dict) -> float:
     return entry.get("pub_ts", time.time())
 
 
-def _strip_html(text: str) -> str:
-    """HTML 태그 제거."""
-    return re.sub(r"<[^>]+>", "", text).strip()
-
-
 def _extract_keywords(query: str) -> list:
     """
     사용자 질문에서 검색 키워드 추출.
@@ -132,78 +89,76 @@ def _extract_keywords(query: str) -> list:
     return [w for w in words if w.lower() not in _STOPWORDS and len(w) > 1]
 
 
-def _score_article(title: str, description: str, pub_ts: float, keywords: list) -> float:
-    """
-    기사의 relevance score를 계산합니다.
-
-    - 제목에 키워드 포함: +3.0 per keyword
-    - 설명에 키워드 포함: +1.0 per keyword
-    - 6시간 이내 기사:   +2.0 (recency bonus)
-    - 24시간 이내 기사:  +1.0 (recency bonus)
-    """
-    score = 0.0
-    title_lower = title.lower()
-    desc_lower = description.lower()
-
-    for kw in keywords:
-        kw_lower = kw.lower()
-        if kw_lower in title_lower:
-            score += _TITLE_MATCH_WEIGHT
-        if kw_lower in desc_lower:
-            score += _DESC_MATCH_WEIGHT
-
-    age_hours = (time.time() - pub_ts) / 3600
-    if age_hours < 6:
-        score += _RECENCY_6H_BONUS
-    elif age_hours < 24:
-        score += _RECENCY_24H_BONUS
-
-    return score
+# ── Public API ────────────────────────────────────────────────────────────────
 
+def strip_html(text: str) -> str:
+    """HTML 태그 제거 (lib.ingest도 같은 방식으로 description을 만듦)."""
+    return re.sub(r"<[^>]+>", "", text).strip()
 
-def _is_duplicate(article: dict, seen: list) -> bool:
-    """
-    이미 선택된 기사 목록(seen)과 비교하여 중복 여부를 판단합니다.
 
-    판단 기준:
-      1. URL 완전 일치 (query string 제거 후 비교)
-      2. 제목 substring 포함 관계
-      3. 제목 단어 겹침 비율 ≥ 60%
+def fetch_feeds(
+    sources: list,
+    deadline_sec: float = _FETCH_DEADLINE_SEC,
+    limit: int = _FEED_FETCH_LIMIT,
+) -> tuple[dict, list]:
     """
-    url = article.get("link", "").split("?")[0]
-    title = article.get("title", "").lower()
+    여러 RSS 소스를 동시에 수집합니다 (소스별 최대 limit개, None이면 전체).
 
-    for s in seen:
-        # 1. URL 중복
-        if url and url == s.get("url", ""):
-            return True
+    - 모든 소스를 스레드 풀에서 병렬로 가져오고, deadline_sec 안에 끝난 소스만 사용
+    - 시간 안에 끝나지 않은 소스는 기다리지 않고 dropped 목록에 기록
+    - 소스 수가 늘어나도 전체 수집 시간은 deadline_sec를 넘지 않음
 
-        seen_title = s.get("title", "").lower()
-        if not title or not seen_title:
-            continue
-
-        # 2. 제목 substring 포함
-        if title in seen_title or seen_title in title:
-            return True
+    반환값: ({source name: [entry, ...]}, [dropped source name, ...])
+    """
+    if not sources:
+        return {}, []
 
-        # 3. 단어 겹침 비율
-        title_words = set(title.split())
-        seen_words = set(seen_title.split())
-        if title_words and seen_words:
-            overlap = len(title_words & seen_words) / min(len(title_words), len(seen_words))
-            if overlap >= _DEDUP_WORD_OVERLAP_THRESHOLD:
-                return True
+    timeout = min(_FEED_TIMEOUT_SEC, deadline_sec)
+    executor = ThreadPoolExecutor(max_workers=min(len(sources), _FETCH_MAX_WORKERS))
+    try:
+        futures = {
+            executor.submit(_parse_feed, source["url"], timeout, limit): source["name"]
+            for source in sources
+        }
+        done, not_done = wait(futures, timeout=deadline_sec)
+    finally:
+        # 느린 소스를 기다리지 않고 바로 반환 (남은 스레드는 urlopen timeout 후 종료)
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    entries_by_source = {}
+    for future in done:
+        name = futures[future]
+        try:
+            entries_by_source[name] = future.result()
+        except Exception as e:
+            print(f"[news_fetcher] {name} 수집 실패: {e}")
 
-    return False
+    dropped = [futures[future] for future in not_done]
+    if dropped:
+        print(f"[news_fetcher] 시간 초과로 제외된 소스 ({deadline_sec}s): {', '.join(dropped)}")
 
+    return entries_by_source, dropped
 
-# ── Public API ────────────────────────────────────────────────────────────────
 
-def fetch_news(query: str, max_articles: int = 5) -> list:
+def fetch_news(
+    query: str,
+    max_articles: int = 5,
+    deadline_sec: float = _FETCH_DEADLINE_SEC,
+    ranker: str = None,
+    use_index: bool = None,
+) -> list:
     """
     RSS 피드에서 뉴스를 수집하고, 관련도 스코어링 및 중복 제거 후
     상위 max_articles개의 기사를 반환합니다.
 
+    피드는 fetch_feeds로 동시에 수집하며, deadline_sec 안에 응답하지 않은
+    소스는 결과에서 제외됩니다. 스코어링은 lib.ranking의 ranker
+    (기본값 bm25, "legacy" 선택 가능)를 사용합니다.
+
+    use_index(기본값: ARTICLE_INDEX_PATH 설정 여부)가 켜져 있고 색인이 최신이면
+    RSS를 호출하지 않고 lib.article_index 색인에서 후보를 가져옵니다.
+    색인이 없거나 오래되었으면 live 수집으로 대체합니다.
+
     반환값: [
         {
             "title": str,
@@ -221,62 +176,92 @@ def fetch_news(query: str, max_articles: int = 5) -> list:
         # fallback: 질문 전체를 단어 단위로 분리해서 처음 3개 사용
         keywords = query.split()[:3]
 
+    if use_index is None:
+        use_index = bool(article_index.index_path())
+    if use_index:
+        indexed = _fetch_from_index(keywords, max_articles, ranker)
+        if indexed is not None:
+            return indexed
+
     all_articles = []
+    entries_by_source, _ = fetch_feeds(RSS_SOURCES, deadline_sec)
 
     for source in RSS_SOURCES:
+        if source["name"] not in entries_by_source:
+            continue
         try:
-            feed_entries = _parse_feed(source["url"])
+            feed_entries = entries_by_source[source["name"]]
             for entry in feed_entries[:_FEED_FETCH_LIMIT]:
                 title = entry.get("title", "").strip()
                 link = entry.get("link", "").strip()
                 raw_desc = entry.get("summary", "")
-                description = _strip_html(raw_desc)[:400]
+                description = strip_html(raw_desc)[:400]
                 pub_ts = _parse_pub_timestamp(entry)
-                pub_date = datetime.fromtimestamp(pub_ts).strftime("%Y-%m-%d %H:%M")
-
-                score = _score_article(title, description, pub_ts, keywords)
 
                 all_articles.append(
                     {
                         "title": title,
                         "link": link,
                         "description": description,
-                        "pub_date": pub_date,
                         "source": source["name"],
-                        "score": score,
-                        "_pub_ts": pub_ts,  # 정렬용, 외부 노출 안 함
+                        "pub_ts": pub_ts,  # 스코어링용, 외부 노출 안 함
                     }
                 )
         except Exception as e:
             print(f"[news_fetcher] {source['name']} 수집 실패: {e}")
             continue
 
-    # score 내림차순 정렬
-    all_articles.sort(key=lambda x: x["score"], reverse=True)
+    return _select_articles(all_articles, keywords, max_articles, ranker)
+
+
+def _fetch_from_index(keywords: list, max_articles: int, ranker: str = None):
+    """색인 기반 검색. 색인을 쓸 수 없거나 오래되었으면 None (live 수집으로 대체)."""
+    path = article_index.index_path()
+    if not path or not os.path.exists(path):
+        return None
+
+    try:
+        conn = article_index.connect(path)
+        try:
+            if not article_index.is_fresh(conn):
+                print("[news_fetcher] 기사 색인이 오래되어 live 수집으로 대체합니다.")
+                return None
+            since_ts = time.time() - _INDEX_LOOKBACK_DAYS * 86400
+            # live 모드와 같은 소스만 (수집기는 DAILY_RSS_SOURCES도 색인함)
+            candidates = article_index.search(
+                conn, keywords, since_ts, sources=[source["name"] for source in RSS_SOURCES]
+            )
+        finally:
+            conn.close()
+    except Exception as e:
+        print(f"[news_fetcher] 기사 색인 조회 실패, live 수집으로 대체: {e}")
+        return None
+
+    if not candidates:
+        return None
+    return _select_articles(candidates, keywords, max_articles, ranker)
 
-    # 중복 제거 후 상위 max_articles개 선택
-    seen: list = []
+
+def _select_articles(all_articles: list, keywords: list, max_articles: int, ranker: str = None) -> list:
+    """스코어링 → score 내림차순(heap) → 중복 제거 → 상위 max_articles개."""
+    rank_articles(all_articles, keywords, ranker)
+
+    dedup = DedupIndex(_DEDUP_WORD_OVERLAP_THRESHOLD)
     unique_articles: list = []
 
-    for article in all_articles:
-        if not _is_duplicate(article, seen):
+    for article in iter_ranked(all_articles):
+        if len(unique_articles) >= max_articles:
+            break
+        if dedup.add_if_unique(article):
             unique_articles.append(
                 {
                     "title": article["title"],
                     "link": article["link"],
                     "description": article["description"],
-                    "pub_date": article["pub_date"],
+                    "pub_date": datetime.fromtimestamp(article["pub_ts"]).strftime("%Y-%m-%d %H:%M"),
                     "source": article["source"],
                     "score": article["score"],
                 }
             )
-            seen.append(
-                {
-                    "url": article["link"].split("?")[0],
-                    "title": article["title"].lower(),
-                }
-            )
-        if len(unique_articles) >= max_articles:
-            break
 
     return unique_articles
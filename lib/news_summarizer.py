@@ -12,19 +12,36 @@ News Summarizer — 수집된 기사를 Gemini로 요약하여 Telegram 포맷
 
   Sources
   - 기사 제목 (출처)
+
+같은 질문·같은 기사 조합의 요약은 lib.cache.TieredCache로 재사용합니다.
 """
 
+import hashlib
 import os
-
-import google.generativeai as genai
-
-_MODEL_PRIORITY = [
-    "gemini-2.5-flash",
-    "gemini-3-flash-preview",
-    "gemini-2.0-flash",
-    "gemini-2.5-pro",
-    "gemini-2.5-flash-lite",
-]
+import re
+
+from lib import llm_client
+from lib.cache import TieredCache
+from lib.llm_client import LLMUnavailableError
+
+# 요약 캐시: 질문 + 기사 조합별, 프로세스 내 LRU + (설정 시) Upstash Redis 공유
+#   SUMMARY_CACHE_REDIS=0 으로 Redis 사용을 끌 수 있습니다.
+_SUMMARY_CACHE_TTL_SEC = 10 * 60
+_SUMMARY_CACHE_MAXSIZE = 256
+_summary_cache = TieredCache(
+    "news:summary",
+    maxsize=_SUMMARY_CACHE_MAXSIZE,
+    ttl=_SUMMARY_CACHE_TTL_SEC,
+    use_redis=os.getenv("SUMMARY_CACHE_REDIS", "1") != "0",
+)
+
+NO_ARTICLES_MESSAGE = (
+    "관련 뉴스를 찾지 못했습니다.\n"
+    "다른 키워드로 다시 질문해주세요.\n\n"
+    "예시:\n• NVIDIA 실적 최신 뉴스\n• 미국 금리 동향\n• 원유 가격 동향"
+)
+NO_API_KEY_MESSAGE = "❌ API 키가 설정되지 않았습니다. 관리자에게 문의해주세요."
+UNAVAILABLE_MESSAGE = "❌ 현재 AI 서비스를 일시적으로 사용할 수 없습니다. 잠시 후 다시 시도해주세요."
 
 _SUMMARY_PROMPT_TEMPLATE = """You are a financial news analyst. A user asked: "{query}"
 
@@ -60,39 +77,64 @@ def _build_articles_text(articles: list) -> str:
     return "\n".join(lines)
 
 
+def normalize_query(query: str) -> str:
+    """캐시 key용 질문 정규화: 소문자, 문장부호 제거, 공백 정리."""
+    words = re.findall(r"[가-힣A-Za-z0-9&]+", query.lower())
+    return " ".join(words)
+
+
+def _summary_cache_key(query: str, articles: list) -> str:
+    """정규화된 질문 + 선택된 기사(링크·제목) 내용 hash."""
+    digest = hashlib.sha1()
+    digest.update(normalize_query(query).encode("utf-8"))
+    for a in articles:
+        digest.update(f"\n{a.get('link', '')}\t{a.get('title', '')}".encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _generate_summary(query: str, articles: list):
+    """Gemini 호출 (lib.llm_client). 모든 모델이 실패하면 None."""
+    articles_text = _build_articles_text(articles)
+    prompt = _SUMMARY_PROMPT_TEMPLATE.format(
+        query=query,
+        articles_text=articles_text,
+    )
+
+    try:
+        return llm_client.generate(prompt, caller="news_summarizer").strip()
+    except LLMUnavailableError as e:
+        print(f"[news_summarizer] 요약 생성 실패: {e}")
+        return None
+
+
 def summarize_news(query: str, articles: list) -> str:
     """
     수집된 기사 목록을 기반으로 LLM 요약을 생성합니다.
 
     - articles가 비어 있으면 안내 메시지 반환
-    - 모든 모델 실패 시 오류 메시지 반환
+    - 같은 질문(정규화 기준)·같은 기사 조합은 캐시된 요약 반환 (LLM 호출 없음)
+    - 모든 모델 실패 시 오류 메시지 반환 (캐시하지 않음)
     """
     if not articles:
-        return (
-            "관련 뉴스를 찾지 못했습니다.\n"
-            "다른 키워드로 다시 질문해주세요.\n\n"
-            "예시:\n• NVIDIA 실적 최신 뉴스\n• 미국 금리 동향\n• 원유 가격 동향"
-        )
+        return NO_ARTICLES_MESSAGE
 
-    api_key = os.getenv("GEMINI_API_KEY")
-    if not api_key:
-        return "❌ API 키가 설정되지 않았습니다. 관리자에게 문의해주세요."
+    if not llm_client.is_configured():
+        return NO_API_KEY_MESSAGE
 
-    genai.configure(api_key=api_key)
+    cache_key = _summary_cache_key(query, articles)
+    cached = _summary_cache.get(cache_key)
+    if cached is not None:
+        print(f"[news_summarizer] 요약 캐시 hit: {normalize_query(query)!r}")
+        return cached
 
-    articles_text = _build_articles_text(articles)
-    prompt = _SUMMARY_PROMPT_TEMPLATE.format(
-        query=query,
-        articles_text=articles_text,
-    )
+    summary = _generate_summary(query, articles)
+    if summary is None:
+        return UNAVAILABLE_MESSAGE
+
+    _summary_cache.set(cache_key, summary)
+    return summary
 
-    for model_name in _MODEL_PRIORITY:
-        try:
-            model = genai.GenerativeModel(model_name)
-            response = model.generate_content(prompt)
-            return response.text.strip()
-        except Exception as e:
-            print(f"[news_summarizer] {model_name} 예외: {e}")
-            continue
 
-    return "❌ 현재 AI 서비스를 일시적으로 사용할 수 없습니다. 잠시 후 다시 시도해주세요."
+def is_summary(text: str) -> bool:
+    """LLM이 만든 요약인지 (안내·오류 메시지가 아닌지). 다른 요청과 공유해도 되는 결과만 True."""
+    return text not in (NO_ARTICLES_MESSAGE, NO_API_KEY_MESSAGE, UNAVAILABLE_MESSAGE)
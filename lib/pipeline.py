@@ -0,0 +1,165 @@
+"""
+Pipeline — 의존성 그래프(DAG) 기반 단계 스케줄러
+
+  - Stage     : 이름, 실행 함수, 선행 단계(deps), 단계별 timeout·재시도 정책
+  - run_stages: 선행 단계가 끝난 단계부터 asyncio로 동시에 실행
+                (동기 함수는 asyncio.to_thread로 스레드에서 실행)
+
+각 단계 함수는 선행 단계 결과를 단계 이름 키워드 인자로 받습니다.
+    Stage("analysis", make_analysis, deps=("news",))  →  make_analysis(news=<news 결과>)
+
+한 단계가 재시도 후에도 실패하면 실행 중인 나머지 단계를 취소하고 StageError를 올립니다.
+optional 단계는 실패(timeout 포함)해도 결과를 None으로 두고 나머지 단계를 계속 실행합니다.
+전체 소요 시간은 가장 긴 의존 경로(critical path)에 가까워집니다.
+"""
+
+import asyncio
+import inspect
+import time
+
+
+class StageError(RuntimeError):
+    """단계 실행 실패 (timeout 포함). stage 속성에 단계 이름이 들어 있습니다."""
+
+    def __init__(self, stage: str, error: BaseException):
+        super().__init__(f"{stage} 단계 실패: {error!r}")
+        self.stage = stage
+        self.error = error
+
+
+class Stage:
+    """
+    파이프라인 한 단계.
+
+    timeout     : 시도 1회당 제한 시간(초). None이면 제한 없음.
+                  동기 함수는 스레드를 중단할 수 없으므로 결과를 기다리지 않을 뿐입니다.
+                  그래서 동기 함수가 timeout되면 재시도하지 않습니다 (이전 시도가 계속 실행 중).
+    retries     : 실패 시 추가 시도 횟수
+    retry_delay : 재시도 대기 시간(초), 시도마다 2배로 늘어남
+    optional    : True면 실패해도 StageError 대신 결과 None으로 진행 (후속 단계가 None을 처리)
+    """
+
+    def __init__(self, name: str, func, deps=(), timeout: float = None,
+                 retries: int = 0, retry_delay: float = 1.0, optional: bool = False):
+        self.name = name
+        self.func = func
+        self.deps = tuple(deps)
+        self.timeout = timeout
+        self.retries = retries
+        self.retry_delay = retry_delay
+        self.optional = optional
+
+    def __repr__(self):
+        return f"Stage({self.name!r}, deps={self.deps})"
+
+
+def _check_graph(stages: list):
+    """이름 중복, 없는 선행 단계, 순환 의존성을 실행 전에 검사합니다."""
+    by_name = {}
+    for stage in stages:
+        if stage.name in by_name:
+            raise ValueError(f"중복된 단계 이름: {stage.name}")
+        by_name[stage.name] = stage
+
+    for stage in stages:
+        for dep in stage.deps:
+            if dep not in by_name:
+                raise ValueError(f"{stage.name} 단계의 선행 단계가 없습니다: {dep}")
+
+    # Kahn 알고리즘으로 순환 검사
+    indegree = {stage.name: len(stage.deps) for stage in stages}
+    dependents = {stage.name: [] for stage in stages}
+    for stage in stages:
+        for dep in stage.deps:
+            dependents[dep].append(stage.name)
+
+    ready = [name for name, n in indegree.items() if n == 0]
+    visited = 0
+    while ready:
+        name = ready.pop()
+        visited += 1
+        for child in dependents[name]:
+            indegree[child] -= 1
+            if indegree[child] == 0:
+                ready.append(child)
+
+    if visited != len(stages):
+        cyclic = sorted(name for name, n in indegree.items() if n > 0)
+        raise ValueError(f"순환 의존성이 있습니다: {', '.join(cyclic)}")
+
+
+async def _call(stage: Stage, kwargs: dict):
+    if inspect.iscoroutinefunction(stage.func):
+        coro = stage.func(**kwargs)
+    else:
+        coro = asyncio.to_thread(stage.func, **kwargs)
+    if stage.timeout is None:
+        return await coro
+    return await asyncio.wait_for(coro, stage.timeout)
+
+
+async def _run_stage(stage: Stage, kwargs: dict):
+    delay = stage.retry_delay
+    for attempt in range(stage.retries + 1):
+        started = time.monotonic()
+        try:
+            result = await _call(stage, kwargs)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            elapsed = time.monotonic() - started
+            # 동기 함수는 timeout 후에도 스레드가 계속 실행되므로 재시도하면 같은 작업이 겹침
+            abandoned = isinstance(e, asyncio.TimeoutError) and not inspect.iscoroutinefunction(stage.func)
+            if isinstance(e, asyncio.TimeoutError):
+                e = TimeoutError(f"{stage.timeout}s 초과")
+            if attempt >= stage.retries or abandoned:
+                if stage.optional:
+                    print(f"[pipeline] ⚠️ {stage.name} 실패 ({elapsed:.1f}s), 결과 없이 진행: {e}")
+                    return None
+                print(f"[pipeline] ❌ {stage.name} 실패 ({elapsed:.1f}s): {e}")
+                raise StageError(stage.name, e) from e
+            print(f"[pipeline] ⚠️ {stage.name} 실패 ({elapsed:.1f}s), {delay:.0f}s 후 재시도 "
+                  f"({attempt + 1}/{stage.retries}): {e}")
+            await asyncio.sleep(delay)
+            delay *= 2
+            continue
+
+        print(f"[pipeline] ✅ {stage.name} 완료 ({time.monotonic() - started:.1f}s)")
+        return result
+
+
+async def run_stages(stages: list) -> dict:
+    """
+    stages를 의존성 순서에 맞춰 최대한 동시에 실행하고 {단계 이름: 결과}를 반환합니다.
+    optional이 아닌 단계가 하나라도 실패하면 나머지 단계를 취소하고 StageError를 올립니다.
+    """
+    stages = list(stages)
+    _check_graph(stages)
+
+    tasks = {}
+    pending = list(stages)
+
+    async def run(stage: Stage):
+        kwargs = {}
+        for dep in stage.deps:
+            kwargs[dep] = await tasks[dep]
+        return await _run_stage(stage, kwargs)
+
+    # 선행 단계 task가 먼저 만들어지도록 위상 순서로 생성
+    while pending:
+        for stage in list(pending):
+            if all(dep in tasks for dep in stage.deps):
+                tasks[stage.name] = asyncio.create_task(run(stage), name=f"stage:{stage.name}")
+                pending.remove(stage)
+
+    started = time.monotonic()
+    try:
+        await asyncio.gather(*tasks.values())
+    except BaseException:
+        for task in tasks.values():
+            task.cancel()
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+        raise
+
+    print(f"[pipeline] 전체 {len(tasks)}개 단계 완료 ({time.monotonic() - started:.1f}s)")
+    return {name: task.result() for name, task in tasks.items()}
@@ -0,0 +1,180 @@
+"""
+Ranking — 수집 기사 relevance 랭킹 엔진
+
+스코어러 (NEWS_RANKER 환경 변수 또는 rank_articles(ranker=...)로 선택):
+  - bm25   : 수집된 기사 전체를 corpus로 보는 BM25 term weighting (기본값)
+             · 제목/설명 field 가중치를 둔 BM25F 방식 tf
+             · 게시 시각 기준 연속 recency decay (반감기 _RECENCY_HALF_LIFE_HOURS)
+  - legacy : 기존 방식 (키워드 포함 +3/+1, 6h/24h 2단계 recency bonus)
+
+상위 기사 선택은 전체 정렬 대신 heap을 사용합니다 (iter_ranked).
+중복 제거 후 필요한 개수만큼만 꺼내므로 O(n + k log n)입니다.
+
+키워드 매칭은 lib.keyword_matcher(Aho–Corasick)로 field마다 한 번씩만 훑습니다.
+"""
+
+import heapq
+import math
+import os
+import time
+from functools import lru_cache
+
+from lib.keyword_matcher import KeywordAutomaton
+
+DEFAULT_RANKER = "bm25"
+
+# legacy 가중치
+_TITLE_MATCH_WEIGHT = 3.0
+_DESC_MATCH_WEIGHT = 1.0
+_RECENCY_6H_BONUS = 2.0
+_RECENCY_24H_BONUS = 1.0
+
+# BM25 파라미터
+_BM25_K1 = 1.2
+_BM25_B = 0.75
+_BM25_TITLE_WEIGHT = 3.0
+_BM25_DESC_WEIGHT = 1.0
+
+# 연속 recency decay: score += weight × 0.5^(age / half-life)
+_RECENCY_WEIGHT = 2.0
+_RECENCY_HALF_LIFE_HOURS = 12.0
+
+
+@lru_cache(maxsize=128)
+def _query_matcher(keywords: tuple) -> KeywordAutomaton:
+    """질문 키워드 오토마톤. 같은 질문의 기사 스코어링에서 재사용됩니다."""
+    return KeywordAutomaton(keywords)
+
+
+# ── legacy scorer ────────────────────────────────────────────────────────────
+
+def score_legacy(title: str, description: str, pub_ts: float, keywords: list, now: float = None) -> float:
+    """
+    기존 relevance score.
+
+    - 제목에 키워드 포함: +3.0 per keyword
+    - 설명에 키워드 포함: +1.0 per keyword
+    - 6시간 이내 기사:   +2.0 (recency bonus)
+    - 24시간 이내 기사:  +1.0 (recency bonus)
+    """
+    score = 0.0
+    matcher = _query_matcher(tuple(keywords))
+    title_hits = matcher.matched(title)
+    desc_hits = matcher.matched(description)
+
+    for kw in keywords:
+        kw_lower = kw.lower()
+        if kw_lower in title_hits:
+            score += _TITLE_MATCH_WEIGHT
+        if kw_lower in desc_hits:
+            score += _DESC_MATCH_WEIGHT
+
+    age_hours = ((now or time.time()) - pub_ts) / 3600
+    if age_hours < 6:
+        score += _RECENCY_6H_BONUS
+    elif age_hours < 24:
+        score += _RECENCY_24H_BONUS
+
+    return score
+
+
+def _legacy_scores(articles: list, keywords: list, now: float) -> list:
+    return [
+        score_legacy(a["title"], a["description"], a["pub_ts"], keywords, now)
+        for a in articles
+    ]
+
+
+# ── BM25 scorer ──────────────────────────────────────────────────────────────
+
+def _recency(pub_ts: float, now: float) -> float:
+    age_hours = max(0.0, (now - pub_ts) / 3600)
+    return _RECENCY_WEIGHT * 0.5 ** (age_hours / _RECENCY_HALF_LIFE_HOURS)
+
+
+def _bm25_scores(articles: list, keywords: list, now: float) -> list:
+    """
+    BM25F 방식 점수.
+
+    - tf: 제목 등장 횟수 × 3 + 설명 등장 횟수 × 1 (부분 문자열 매칭이라 한국어 조사에도 강함)
+    - 문서 길이: 같은 field 가중치를 적용한 단어 수, corpus 평균으로 정규화
+    - idf: 이번에 수집한 기사 전체 기준
+    """
+    matcher = _query_matcher(tuple(keywords))
+    terms = matcher.keywords
+    n_docs = len(articles)
+
+    doc_tfs = []
+    doc_lens = []
+    df = dict.fromkeys(terms, 0)
+
+    for a in articles:
+        tf = {}
+        for term in matcher.iter_keywords(a["title"]):
+            tf[term] = tf.get(term, 0.0) + _BM25_TITLE_WEIGHT
+        for term in matcher.iter_keywords(a["description"]):
+            tf[term] = tf.get(term, 0.0) + _BM25_DESC_WEIGHT
+        for term in tf:
+            df[term] += 1
+        doc_tfs.append(tf)
+        # 문서 길이는 공백 기준 단어 수로 근사 (정규식 토큰화보다 훨씬 저렴)
+        doc_lens.append(
+            _BM25_TITLE_WEIGHT * len(a["title"].split())
+            + _BM25_DESC_WEIGHT * len(a["description"].split())
+        )
+
+    avg_len = (sum(doc_lens) / n_docs) if n_docs else 0.0
+    idf = {
+        term: math.log(1 + (n_docs - df[term] + 0.5) / (df[term] + 0.5))
+        for term in terms
+    }
+
+    scores = []
+    for a, tf, doc_len in zip(articles, doc_tfs, doc_lens):
+        norm = _BM25_K1 * (1 - _BM25_B + _BM25_B * (doc_len / avg_len if avg_len else 0.0))
+        relevance = sum(
+            idf[term] * freq * (_BM25_K1 + 1) / (freq + norm)
+            for term, freq in tf.items()
+        )
+        scores.append(round(relevance + _recency(a["pub_ts"], now), 3))
+
+    return scores
+
+
+RANKERS = {
+    "bm25": _bm25_scores,
+    "legacy": _legacy_scores,
+}
+
+
+# ── Public API ────────────────────────────────────────────────────────────────
+
+def rank_articles(articles: list, keywords: list, ranker: str = None, now: float = None) -> list:
+    """
+    articles 각각에 "score"를 기록하고 점수 목록을 반환합니다.
+
+    - articles: {"title", "description", "pub_ts", ...} dict 목록
+    - ranker: RANKERS 키. None이면 NEWS_RANKER 환경 변수, 없으면 DEFAULT_RANKER
+    """
+    name = (ranker or os.getenv("NEWS_RANKER") or DEFAULT_RANKER).strip().lower()
+    scorer = RANKERS.get(name)
+    if scorer is None:
+        print(f"[ranking] 알 수 없는 ranker {name!r}, {DEFAULT_RANKER}로 대체합니다.")
+        scorer = RANKERS[DEFAULT_RANKER]
+
+    scores = scorer(articles, keywords, now or time.time())
+    for article, score in zip(articles, scores):
+        article["score"] = score
+    return scores
+
+
+def iter_ranked(articles: list):
+    """
+    score 내림차순으로 기사를 하나씩 꺼냅니다 (동점은 입력 순서 유지).
+    heapify O(n) 후 필요한 만큼만 pop 하므로 전체 정렬이 필요 없습니다.
+    """
+    heap = [(-a["score"], i) for i, a in enumerate(articles)]
+    heapq.heapify(heap)
+    while heap:
+        _, i = heapq.heappop(heap)
+        yield articles[i]
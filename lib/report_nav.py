@@ -0,0 +1,78 @@
+"""
+Report Nav — docs/reports의 일일 리포트로 연도 → 월 → 일 nav를 자동 생성합니다.
+
+mkdocs.yml의 `hooks`로 등록되어 빌드 때마다 "Daily Reports" 항목을 채우므로,
+새 리포트를 추가해도 mkdocs.yml을 다시 쓰지 않습니다.
+theme.features의 navigation.prune과 함께 쓰면 각 페이지에는 현재 연도·월의 항목만
+렌더링되어, 리포트가 늘어나도 페이지별 nav HTML 크기가 일정하게 유지됩니다.
+
+  - ReportIndex : 날짜 → 파일 경로 (존재 여부 O(1) 조회), 최신순 정렬
+  - build_nav   : [{"2026년": [{"8월": [{"2026-08-22": "reports/2026-08-22.md"}, ...]}]}, ...]
+  - on_config   : MkDocs hook
+"""
+
+import os
+import re
+
+REPORTS_DIR = os.path.join("docs", "reports")
+NAV_SECTION = "Daily Reports"
+
+_REPORT_FILE_RE = re.compile(r"^(\d{4})-(\d{2})-(\d{2})\.md$")
+
+
+class ReportIndex:
+    """reports 디렉터리의 날짜별 리포트 목록."""
+
+    def __init__(self, reports_dir: str = REPORTS_DIR):
+        self.reports_dir = reports_dir
+        self._dates = set()
+        if os.path.isdir(reports_dir):
+            with os.scandir(reports_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and _REPORT_FILE_RE.match(entry.name):
+                        self._dates.add(entry.name[:-3])
+
+    def __contains__(self, report_date: str) -> bool:
+        return report_date in self._dates
+
+    def __len__(self) -> int:
+        return len(self._dates)
+
+    def add(self, report_date: str) -> None:
+        self._dates.add(report_date)
+
+    def dates(self) -> list:
+        """최신순 날짜 목록 ("YYYY-MM-DD")."""
+        return sorted(self._dates, reverse=True)
+
+
+def build_nav(index: ReportIndex, docs_prefix: str = "reports") -> list:
+    """최신순 연도 → 월 → 일 nav 목록 (mkdocs.yml nav 형식)."""
+    years = []
+    current_year = current_month = None
+    for report_date in index.dates():
+        year, month, _ = report_date.split("-")
+        if year != current_year:
+            current_year, current_month = year, None
+            months = []
+            years.append({f"{year}년": months})
+        if month != current_month:
+            current_month = month
+            days = []
+            months.append({f"{int(month)}월": days})
+        days.append({report_date: f"{docs_prefix}/{report_date}.md"})
+    return years
+
+
+# ── MkDocs hook ──────────────────────────────────────────────────────────────
+
+def on_config(config):
+    """nav의 "Daily Reports" 항목을 docs/reports 기준 연도·월 트리로 바꿉니다."""
+    if not config.nav:
+        return config
+
+    index = ReportIndex(os.path.join(config.docs_dir, "reports"))
+    for item in config.nav:
+        if isinstance(item, dict) and NAV_SECTION in item:
+            item[NAV_SECTION] = build_nav(index)
+    return config
@@ -18,3 +18,19 @@ RSS_SOURCES = [
         "lang": "en",
     },
 ]
+
+# 일일 브리핑(main.py) 및 기사 색인(lib.ingest)용 한국경제 RSS
+DAILY_RSS_SOURCES = [
+    {
+        "name": "한국경제 경제",
+        "url": "https://www.hankyung.com/feed/economy",
+        "lang": "ko",
+        "category": "경제",
+    },
+    {
+        "name": "한국경제 증권",
+        "url": "https://www.hankyung.com/feed/finance",
+        "lang": "ko",
+        "category": "증권",
+    },
+]
@@ -0,0 +1,175 @@
+"""
+Search Shards — 리포트 사이트용 월별 분할 검색 index (MkDocs hook).
+
+material search plugin은 모든 페이지가 들어간 search_index.json 하나를 매 빌드마다 새로 만들고,
+방문자는 첫 검색 전에 이 파일 전체(+ lunr, 토크나이저)를 내려받아야 합니다.
+여기서는 리포트를 월별 shard로 나누고 manifest로 목록을 제공해,
+브라우저(docs/javascripts/report_search.js)가 최신 월부터 필요한 shard만 불러오게 합니다.
+
+  site/search/shards/manifest.json     : shard 목록 (최신 월 → 과거, 일반 페이지는 마지막)
+  site/search/shards/<key>.idx.<h>.json : 토큰 → 문서 번호 목록 (한글 2-gram + 영문·숫자 단어)
+  site/search/shards/<key>.<h>.json     : 문서 (location, title, 본문 텍스트) — 후보 확인·미리보기용
+
+shard 파일 이름에 내용 hash(<h>)를 넣어 오래 캐시할 수 있고,
+증분 빌드(lib.site_publisher)에서는 다시 렌더링한 페이지가 속한 shard만 새로 씁니다.
+토크나이저는 report_search.js의 tokenize()와 같아야 합니다.
+"""
+
+import hashlib
+import html
+import json
+import os
+import re
+import unicodedata
+
+SHARDS_DIR = os.path.join("search", "shards")
+MANIFEST_NAME = "manifest.json"
+PAGES_SHARD = "pages"
+_MANIFEST_VERSION = 1
+TOKENIZER = "hangul-bigram"
+
+_REPORT_URL_RE = re.compile(r"^reports/(\d{4}-\d{2})-\d{2}/$")
+_TOKEN_RE = re.compile(r"[가-힣]+|[a-z0-9]+")
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+
+# ── 토큰화 ────────────────────────────────────────────────────────────────────
+
+def tokenize(text: str) -> set:
+    """한글은 붙어 있는 글자 2-gram(한 글자 단어는 그대로), 영문·숫자는 단어 단위 (소문자)."""
+    tokens = set()
+    for run in _TOKEN_RE.findall(unicodedata.normalize("NFKC", text).lower()):
+        if len(run) > 1 and "가" <= run[0] <= "힣":
+            tokens.update(run[i:i + 2] for i in range(len(run) - 1))
+        else:
+            tokens.add(run)
+    return tokens
+
+
+def html_to_text(content: str) -> str:
+    return _SPACE_RE.sub(" ", html.unescape(_TAG_RE.sub(" ", content))).strip()
+
+
+def shard_key(url: str) -> str:
+    match = _REPORT_URL_RE.match(url)
+    return match.group(1) if match else PAGES_SHARD
+
+
+# ── shard 파일 ────────────────────────────────────────────────────────────────
+
+def _dumps(data) -> str:
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+
+
+def _build_index(docs: list) -> dict:
+    postings = {}
+    for number, doc in enumerate(docs):
+        for token in tokenize(f"{doc['title']} {doc['text']}"):
+            postings.setdefault(token, []).append(number)
+    return {"tokens": postings}
+
+
+def _write_shard(shards_dir: str, key: str, docs: list) -> dict:
+    docs = sorted(docs, key=lambda doc: doc["location"], reverse=True)
+    payloads = {"text": _dumps({"docs": docs}), "index": _dumps(_build_index(docs))}
+    entry = {"key": key, "docs": len(docs)}
+    for kind, payload in payloads.items():
+        digest = hashlib.sha1(payload.encode("utf-8")).hexdigest()[:10]
+        name = f"{key}.idx.{digest}.json" if kind == "index" else f"{key}.{digest}.json"
+        with open(os.path.join(shards_dir, name), "w", encoding="utf-8") as f:
+            f.write(payload)
+        entry[kind] = name
+    return entry
+
+
+def _load_json(path: str):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def load_manifest(site_dir: str):
+    manifest = _load_json(os.path.join(site_dir, SHARDS_DIR, MANIFEST_NAME))
+    if manifest is None or manifest.get("version") != _MANIFEST_VERSION:
+        return None
+    return manifest
+
+
+def update(site_dir: str, urls, fresh: dict) -> dict:
+    """
+    shard를 갱신하고 manifest를 반환합니다.
+      urls  : 사이트의 모든 페이지 url
+      fresh : 이번 빌드에서 렌더링한 페이지 {url: (제목, 본문 텍스트)}
+    렌더링하지 않은 페이지는 이전 shard의 문서를 그대로 씁니다.
+    """
+    shards_dir = os.path.join(site_dir, SHARDS_DIR)
+    os.makedirs(shards_dir, exist_ok=True)
+    previous = load_manifest(site_dir) or {"shards": []}
+    previous_entries = {entry["key"]: entry for entry in previous["shards"]}
+
+    members = {}
+    for url in sorted(urls):
+        members.setdefault(shard_key(url), []).append(url)
+    dirty = {shard_key(url) for url in fresh}
+
+    entries = []
+    order = sorted((key for key in members if key != PAGES_SHARD), reverse=True)
+    if PAGES_SHARD in members:
+        order.append(PAGES_SHARD)
+    for key in order:
+        old = previous_entries.get(key)
+        if key not in dirty and old is not None and old["docs"] == len(members[key]):
+            entries.append(old)
+            continue
+
+        old_docs = {}
+        if old is not None:
+            data = _load_json(os.path.join(shards_dir, old["text"])) or {"docs": []}
+            old_docs = {doc["location"]: doc for doc in data["docs"]}
+        docs = []
+        for url in members[key]:
+            if url in fresh:
+                title, text = fresh[url]
+                docs.append({"location": url, "title": title, "text": text})
+            elif url in old_docs:
+                docs.append(old_docs[url])
+        entries.append(_write_shard(shards_dir, key, docs))
+
+    manifest = {"version": _MANIFEST_VERSION, "tokenizer": TOKENIZER, "shards": entries}
+    with open(os.path.join(shards_dir, MANIFEST_NAME), "w", encoding="utf-8") as f:
+        f.write(_dumps(manifest))
+
+    # 더 이상 manifest에 없는 이전 shard 파일 정리
+    keep = {MANIFEST_NAME} | {entry[kind] for entry in entries for kind in ("index", "text")}
+    for name in os.listdir(shards_dir):
+        if name not in keep:
+            os.remove(os.path.join(shards_dir, name))
+    return manifest
+
+
+# ── MkDocs hook ──────────────────────────────────────────────────────────────
+
+_urls = set()
+_fresh = {}
+
+
+def on_files(files, config):
+    _urls.clear()
+    _fresh.clear()
+    _urls.update(file.url for file in files.documentation_pages())
+    return files
+
+
+def on_page_content(content, page, config, files):
+    _fresh[page.file.url] = (page.title, html_to_text(content))
+    return content
+
+
+def on_post_build(config):
+    manifest = update(config.site_dir, _urls, _fresh)
+    docs = sum(entry["docs"] for entry in manifest["shards"])
+    print(f"[search_shards] shard {len(manifest['shards'])}개, 문서 {docs}건 "
+          f"(이번 빌드 {len(_fresh)}건 갱신)")
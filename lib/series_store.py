@@ -0,0 +1,110 @@
+"""
+Series Store — 지표 시계열 SQLite 로컬 저장소
+
+indicators.get_indicators_data가 매번 30일치를 다시 받지 않도록 관측값을 심볼별로 누적합니다.
+  - 처음 실행 : 출처에서 가능한 전체 기간을 한 번 받아 저장
+  - 이후      : 마지막 저장 날짜부터만 받아 upsert (마지막 값은 잠정치일 수 있어 다시 받음)
+
+테이블:
+  - observations : (symbol, date "YYYY-MM-DD") → value
+
+저장소 파일 경로는 SERIES_STORE_PATH 환경 변수로 지정합니다 (기본값 .cache/series.sqlite3).
+GitHub Actions에서는 actions/cache로 실행 간에 유지합니다.
+"""
+
+import os
+import sqlite3
+
+import pandas as pd
+
+_DEFAULT_PATH = os.path.join(".cache", "series.sqlite3")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS observations (
+    symbol TEXT NOT NULL,
+    date   TEXT NOT NULL,
+    value  REAL NOT NULL,
+    PRIMARY KEY (symbol, date)
+) WITHOUT ROWID;
+"""
+
+_UPSERT_SQL = """
+INSERT INTO observations (symbol, date, value) VALUES (?, ?, ?)
+ON CONFLICT(symbol, date) DO UPDATE SET value = excluded.value
+WHERE observations.value != excluded.value
+"""
+
+
+def store_path() -> str:
+    return os.getenv("SERIES_STORE_PATH", "").strip() or _DEFAULT_PATH
+
+
+def connect(path: str = None) -> sqlite3.Connection:
+    path = path or store_path()
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    conn = sqlite3.connect(path, timeout=10)
+    conn.executescript(_SCHEMA)
+    return conn
+
+
+def last_date(conn: sqlite3.Connection, symbol: str):
+    """마지막 저장 날짜 ("YYYY-MM-DD"), 없으면 None."""
+    row = conn.execute("SELECT MAX(date) FROM observations WHERE symbol = ?", (symbol,)).fetchone()
+    return row[0]
+
+
+def upsert(conn: sqlite3.Connection, symbol: str, series: pd.Series) -> int:
+    """날짜 index의 Series를 저장하고 새로 추가·변경된 행 수를 반환합니다 (NaN 제외)."""
+    series = series.dropna()
+    rows = [
+        (symbol, pd.Timestamp(day).strftime("%Y-%m-%d"), float(value))
+        for day, value in series.items()
+    ]
+    with conn:
+        cursor = conn.executemany(_UPSERT_SQL, rows)
+    return cursor.rowcount
+
+
+def load(conn: sqlite3.Connection, symbol: str, start: str = None, limit: int = None) -> pd.Series:
+    """
+    저장된 시계열 (날짜 오름차순 DatetimeIndex).
+    start("YYYY-MM-DD") 이후만, limit이 있으면 최근 limit개만 반환합니다.
+    """
+    query = "SELECT date, value FROM observations WHERE symbol = ?"
+    params = [symbol]
+    if start:
+        query += " AND date >= ?"
+        params.append(start)
+    query += " ORDER BY date DESC"
+    if limit:
+        query += " LIMIT ?"
+        params.append(limit)
+
+    rows = conn.execute(query, params).fetchall()[::-1]
+    return pd.Series(
+        [value for _, value in rows],
+        index=pd.DatetimeIndex([day for day, _ in rows]),
+        name=symbol,
+        dtype="float64",
+    )
+
+
+def load_frame(conn: sqlite3.Connection, symbols: list, start: str = None) -> pd.DataFrame:
+    """
+    여러 심볼을 날짜 × 심볼 DataFrame으로 읽습니다 (lib.analytics 입력 형식).
+    심볼마다 관측일이 달라 관측이 없는 칸은 NaN입니다.
+    """
+    placeholders = ", ".join("?" for _ in symbols)
+    query = f"SELECT date, symbol, value FROM observations WHERE symbol IN ({placeholders})"
+    params = list(symbols)
+    if start:
+        query += " AND date >= ?"
+        params.append(start)
+
+    rows = pd.DataFrame(conn.execute(query, params).fetchall(), columns=["date", "symbol", "value"])
+    frame = rows.pivot(index="date", columns="symbol", values="value").reindex(columns=list(symbols))
+    frame.index = pd.DatetimeIndex(frame.index)
+    frame.columns.name = None
+    return frame.sort_index().astype("float64")
@@ -0,0 +1,145 @@
+"""
+Single-flight — 같은 key의 작업이 이미 실행 중이면 새로 실행하지 않고 그 결과를 기다려 재사용합니다.
+
+  - 프로세스 내 : key별 진행 중 호출(Event)을 공유. 먼저 온 스레드(leader)만 실행
+  - 인스턴스 간 : Upstash Redis 짧은 lock(SET NX EX) + 결과 key
+                  lock을 못 잡은 인스턴스는 결과 key가 생길 때까지 polling
+
+결과는 JSON 직렬화 가능해야 합니다 (인스턴스 간 공유용).
+share(result)가 False인 결과(일시적 실패 안내 등)는 Redis에 저장하지 않습니다.
+다른 인스턴스의 leader가 실패하거나 lock이 만료되었는데 결과가 없으면 직접 실행합니다.
+대기 시간(wait_timeout) + 직접 실행 시간이 함수 실행 제한(Vercel maxDuration 30s) 안에
+들어오도록 wait_timeout은 짧게 둡니다.
+"""
+
+import json
+import threading
+import time
+import uuid
+
+from lib import upstash
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    namespace별 single-flight 그룹.
+
+        flight = SingleFlight("news:query")
+        summary = flight.do(normalized_query, lambda: expensive(query), share=is_success)
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        lock_ttl: int = 30,
+        result_ttl: int = 60,
+        wait_timeout: float = 8.0,
+        poll_interval: float = 0.25,
+        use_redis: bool = True,
+    ):
+        self.namespace = namespace
+        self.lock_ttl = lock_ttl
+        self.result_ttl = result_ttl
+        self.wait_timeout = wait_timeout
+        self.poll_interval = poll_interval
+        self._use_redis = use_redis
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, func, share=None):
+        """
+        key에 대해 func()를 최대 한 번만 실행하고 그 결과를 반환합니다.
+        share가 있으면 share(result)가 True인 결과만 다른 인스턴스와 공유합니다.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = self._do_shared(key, func, share)
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+        return call.result
+
+    # ── 인스턴스 간 공유 (Redis) ──────────────────────────────────────────────
+
+    def _redis_enabled(self) -> bool:
+        return self._use_redis and upstash.is_configured()
+
+    def _keys(self, key: str) -> tuple[str, str]:
+        base = f"sf:{self.namespace}:{key}"
+        return f"{base}:lock", f"{base}:result"
+
+    def _do_shared(self, key: str, func, share=None):
+        if not self._redis_enabled():
+            return func()
+
+        lock_key, result_key = self._keys(key)
+        token = uuid.uuid4().hex
+        deadline = time.monotonic() + self.wait_timeout
+
+        while True:
+            # 최근 결과가 있으면 재사용
+            results = upstash.pipeline([["GET", result_key]])
+            if results is None:
+                return func()  # Redis 실패: 인스턴스 간 공유 없이 실행
+
+            cached = results[0]
+            if cached is not None:
+                try:
+                    return json.loads(cached)["value"]
+                except (ValueError, KeyError, TypeError):
+                    pass
+
+            # 결과가 없을 때만 lock 시도 (hit와 함께 잡은 lock은 아무도 풀지 않아
+            # 결과 만료 후 호출이 lock_ttl 동안 대기하게 됨)
+            results = upstash.pipeline([["SET", lock_key, token, "NX", "EX", self.lock_ttl]])
+            if results is None:
+                return func()
+            if results[0] == "OK":
+                break
+
+            # 다른 인스턴스가 실행 중 → 결과를 기다림
+            if time.monotonic() >= deadline:
+                print(f"[singleflight] {self.namespace}:{key} 대기 시간 초과, 직접 실행합니다.")
+                return func()
+            time.sleep(self.poll_interval)
+
+        try:
+            value = func()
+        except Exception:
+            upstash.request("DEL", lock_key)
+            raise
+
+        if share is not None and not share(value):
+            # 실패 결과는 공유하지 않음: 기다리던 인스턴스는 lock 해제 후 직접 실행
+            upstash.request("DEL", lock_key)
+            return value
+
+        upstash.pipeline([
+            ["SET", result_key, json.dumps({"value": value}, ensure_ascii=False), "EX", self.result_ttl],
+            ["DEL", lock_key],
+        ])
+        return value
@@ -0,0 +1,534 @@
+"""
+Site Publisher — MkDocs 사이트 증분 빌드 및 GitHub Pages 배포
+
+`mkdocs gh-deploy --force`는 매일 모든 리포트 페이지를 다시 렌더링합니다.
+증분 모드는 이전 빌드 정보(.site-build.json)와 비교해 필요한 것만 다시 만듭니다.
+
+  - 렌더링 : 새로 추가·수정된 페이지 + nav에서 새 페이지의 이전/다음 페이지 (prev/next 링크)
+  - 패치   : 나머지 페이지는 HTML의 nav 목록에 새 항목 <li>만 끼워 넣음
+             (같은 목록의 기존 항목을 복제해 href·제목만 바꿈)
+             navigation.prune으로 접힌 section 링크는 새 첫 페이지로 href만 교체
+  - 재생성 : sitemap.xml(.gz), 404.html (nav 전체에서 바로 만들 수 있어 비용이 작음)
+  - 병합   : search_index.json은 이전 index에서 다시 렌더링한 페이지 항목만 교체
+             월별 검색 shard(lib/search_shards.py hook)는 다시 렌더링한 페이지가 속한 월만 새로 씀
+
+결과물은 전체 빌드와 같아야 합니다 (--verify로 전체 빌드와 비교 가능).
+다음 경우에는 전체 빌드로 대체합니다.
+  - 이전 빌드 정보가 없거나 mkdocs/material 버전, mkdocs.yml(nav 제외)이 바뀐 경우
+  - nav 변경이 "기존 항목 앞에 새 페이지 삽입"이 아닌 경우 (삭제, 순서·제목 변경 등)
+  - 이전 빌드 결과물(HTML, search index)이 없거나 패치할 위치를 찾지 못한 경우
+  - mkdocs 버전이 SUPPORTED_MKDOCS가 아닌 경우 (mkdocs.commands.build의 내부 함수를 직접 호출하므로)
+  - 증분 빌드 도중 예외가 난 경우 (site_dir을 비우고 다시 빌드)
+
+실행:
+  python -m lib.site_publisher                 # 증분 빌드 (site/)
+  python -m lib.site_publisher --deploy        # 빌드 후 gh-pages 배포 (mkdocs gh-deploy --force와 동일)
+  python -m lib.site_publisher --full          # 항상 전체 빌드
+  python -m lib.site_publisher --verify        # 증분 빌드 결과를 전체 빌드와 비교 (다르면 전체 빌드로 교체)
+"""
+
+import argparse
+import gzip
+import hashlib
+import html
+import json
+import os
+import re
+import shutil
+import tempfile
+import time
+from importlib import metadata
+
+import mkdocs
+import yaml
+from mkdocs.commands import build as mkdocs_build
+from mkdocs.commands import gh_deploy
+from mkdocs.config import load_config
+from mkdocs.structure.files import get_files, set_exclusions
+from mkdocs.structure.nav import get_navigation
+from mkdocs.structure.pages import Page
+from mkdocs.utils import normalize_url
+
+from lib import search_shards
+
+MANIFEST_PATH = ".site-build.json"
+# _populate_page·_build_page·_build_theme_template·_build_extra_template 시그니처를 확인한 버전
+SUPPORTED_MKDOCS = "1.6."
+_MANIFEST_VERSION = 1
+_SEARCH_INDEX_PATH = os.path.join("search", "search_index.json")
+
+
+class IncrementalBuildError(RuntimeError):
+    """증분 빌드를 할 수 없는 상태 (호출 측에서 전체 빌드로 대체)."""
+
+
+# ── 빌드 정보 (manifest) ──────────────────────────────────────────────────────
+
+def _sha1_file(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(65536), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _generator_versions() -> dict:
+    versions = {"mkdocs": mkdocs.__version__}
+    try:
+        versions["material"] = metadata.version("mkdocs-material")
+    except metadata.PackageNotFoundError:
+        versions["material"] = None
+    return versions
+
+
+def _config_digest(config_file: str) -> str:
+    """mkdocs.yml에서 nav를 뺀 설정의 hash (nav 변경은 따로 비교)."""
+    with open(config_file, "rb") as f:
+        raw = f.read()
+    try:
+        data = yaml.safe_load(raw) or {}
+        data.pop("nav", None)
+        raw = json.dumps(data, sort_keys=True, ensure_ascii=False, default=str).encode("utf-8")
+    except yaml.YAMLError:
+        pass  # !!python 태그 등: 파일 전체 hash (nav가 바뀌면 전체 빌드)
+    return hashlib.sha1(raw).hexdigest()
+
+
+def _nav_entries(items, section: str = "") -> list:
+    """nav를 [section 경로, 제목, url] 목록으로 펼칩니다 (nav 순서 유지)."""
+    entries = []
+    for item in items:
+        if item.is_section:
+            entries.extend(_nav_entries(item.children, f"{section}/{item.title}"))
+        else:
+            entries.append([section, item.title, item.url])
+    return entries
+
+
+def _snapshot(config, files, nav) -> dict:
+    return {
+        "version": _MANIFEST_VERSION,
+        "generator": _generator_versions(),
+        "config": _config_digest(config.config_file_path),
+        "nav": _nav_entries(nav.items),
+        "files": {
+            file.src_uri: _sha1_file(file.abs_src_path)
+            for file in files
+            if file.abs_src_path and file.abs_src_path.startswith(os.path.abspath(config.docs_dir))
+        },
+    }
+
+
+def _manifest_path(config) -> str:
+    return os.path.join(os.path.dirname(config.config_file_path), MANIFEST_PATH)
+
+
+def _load_manifest(config):
+    try:
+        with open(_manifest_path(config), "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _discard_manifest(config) -> None:
+    try:
+        os.remove(_manifest_path(config))
+    except FileNotFoundError:
+        pass
+
+
+def _save_manifest(config, manifest: dict) -> None:
+    with open(_manifest_path(config), "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=1, sort_keys=True)
+        f.write("\n")
+
+
+# ── 빌드 준비 (mkdocs.commands.build.build의 앞부분과 동일) ─────────────────
+
+def _load(config_file: str, site_dir: str = None):
+    kwargs = {"config_file": config_file}
+    if site_dir:
+        kwargs["site_dir"] = site_dir
+    config = load_config(**kwargs)
+    config.plugins.on_startup(command="build", dirty=False)
+    return config
+
+
+def _gather(config):
+    config = config.plugins.on_config(config)
+    config.plugins.on_pre_build(config=config)
+
+    files = get_files(config)
+    env = config.theme.get_env()
+    files.add_files_from_theme(env, config)
+    files = config.plugins.on_files(files, config=config)
+    set_exclusions(files, config)
+
+    nav = get_navigation(files, config)
+    nav = config.plugins.on_nav(nav, config=config, files=files)
+
+    for file in files.documentation_pages():
+        if file.page is None and file.inclusion.is_not_in_nav():
+            Page(None, file, config)
+    return config, files, nav, env
+
+
+# ── 증분 계획 ─────────────────────────────────────────────────────────────────
+
+def _plan(config, files, nav, previous: dict, current: dict) -> dict:
+    """
+    다시 렌더링할 페이지와 nav 삽입 정보를 계산합니다.
+    증분 빌드를 할 수 없으면 IncrementalBuildError.
+    """
+    if not mkdocs.__version__.startswith(SUPPORTED_MKDOCS):
+        raise IncrementalBuildError(f"지원하지 않는 mkdocs 버전: {mkdocs.__version__}")
+    if previous is None:
+        raise IncrementalBuildError("이전 빌드 정보가 없습니다")
+    for key in ("version", "generator", "config"):
+        if previous.get(key) != current[key]:
+            raise IncrementalBuildError(f"{key} 변경")
+
+    removed = set(previous["files"]) - set(current["files"])
+    if removed:
+        raise IncrementalBuildError(f"삭제된 파일: {', '.join(sorted(removed)[:5])}")
+    changed = {
+        src_uri for src_uri, digest in current["files"].items()
+        if previous["files"].get(src_uri) != digest
+    }
+
+    # nav 변경은 한 곳에 새 항목이 연속으로 삽입된 경우만 허용
+    prev_nav, cur_nav = previous["nav"], current["nav"]
+    head = 0
+    while head < min(len(prev_nav), len(cur_nav)) and prev_nav[head] == cur_nav[head]:
+        head += 1
+    tail = 0
+    while (tail < min(len(prev_nav), len(cur_nav)) - head
+           and prev_nav[-1 - tail] == cur_nav[-1 - tail]):
+        tail += 1
+    if len(prev_nav) - head - tail != 0:
+        raise IncrementalBuildError("nav 항목 삭제·변경")
+
+    inserted = cur_nav[head:len(cur_nav) - tail]
+    pages_by_url = {page.url: page for page in nav.pages}
+    insertion = None
+    render = set(changed) & {file.src_uri for file in files.documentation_pages()}
+
+    if inserted:
+        if not tail:
+            raise IncrementalBuildError("목록 끝에 추가된 항목 (복제할 다음 항목 없음)")
+        before = cur_nav[len(cur_nav) - tail]
+        new_pages = []
+        for section, _, url in inserted:
+            page = pages_by_url.get(url)
+            if section != before[0] or page is None or page.file.src_uri not in changed:
+                raise IncrementalBuildError(f"새 페이지가 아닌 nav 항목: {url}")
+            new_pages.append(page)
+        before_page = pages_by_url.get(before[2])
+        if before_page is None:
+            raise IncrementalBuildError("삽입 위치 다음 항목이 페이지가 아닙니다")
+
+        siblings = before_page.parent.children if before_page.parent else nav.items
+        insertion = {
+            "before": before_page,
+            "pages": new_pages,
+            "siblings": [item for item in siblings if item.is_page],
+        }
+        # prev/next 링크가 바뀌는 이웃 페이지
+        for neighbour in (new_pages[0].previous_page, new_pages[-1].next_page):
+            if neighbour is not None:
+                render.add(neighbour.file.src_uri)
+
+    for file in files.documentation_pages():
+        if file.src_uri not in render and not os.path.isfile(file.abs_dest_path):
+            raise IncrementalBuildError(f"이전 빌드 결과 없음: {file.dest_uri}")
+
+    return {"render": render, "insertion": insertion, "changed": changed}
+
+
+# ── nav 패치 ──────────────────────────────────────────────────────────────────
+
+_PLAIN_ITEM = '<li class="md-nav__item">'
+# 일반 nav 항목 두 개가 연속된 부분 (TOC 항목 "#..." 제외): 그룹 1 = 앞 항목 href, 그룹 2 = 항목 사이 공백
+_ITEM_GAP_RE = re.compile(
+    r'<li class="md-nav__item">\s*<a href="((?!#)[^"]*)" class="md-nav__link">(?:(?!<li).)*?</li>'
+    r'(\s*?)(?=<li class="md-nav__item">\s*<a href="(?!#))',
+    re.DOTALL,
+)
+
+
+def _nav_link(target, page) -> str:
+    return f'<a href="{normalize_url(target.url, page)}" class="md-nav__link">'
+
+
+def _find_item_gap(pages, siblings) -> str:
+    """
+    nav 항목 사이 공백 문자열 (템플릿에서 오므로 목록 깊이가 같으면 모든 페이지에서 같음).
+    현재 페이지(active) 항목 앞뒤는 공백이 다르므로, 삽입할 목록(siblings)의 일반 항목끼리
+    붙어 있는 곳에서 읽습니다.
+    """
+    for page in pages:
+        hrefs = {normalize_url(sibling.url, page) for sibling in siblings}
+        with open(page.file.abs_dest_path, "r", encoding="utf-8") as f:
+            content = f.read()
+        for match in _ITEM_GAP_RE.finditer(content):
+            if match.group(1) in hrefs:
+                return match.group(2)
+    raise IncrementalBuildError("nav 항목 사이 구분을 알 수 없습니다")
+
+
+def _patch_nav(page, insertion: dict) -> None:
+    """
+    page의 HTML nav를 새 항목 삽입 후 상태로 고칩니다.
+      - before 항목이 일반 항목이면: 그 앞에 새 항목 <li>를 복제해 끼워 넣음
+      - before로 가는 링크가 접힌(pruned) section이면: section의 첫 페이지가 바뀌었으므로 href만 교체
+    """
+    path = page.file.abs_dest_path
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    before = insertion["before"]
+    anchor = _nav_link(before, page)
+    positions = [m.start() for m in re.finditer(re.escape(anchor), content)]
+    if not positions:
+        raise IncrementalBuildError(f"nav 항목을 찾지 못했습니다: {page.file.dest_uri}")
+
+    # 뒤에서부터 고쳐야 앞쪽 위치가 바뀌지 않음
+    for pos in reversed(positions):
+        start = content.rfind("<li", 0, pos)
+        tag = content[start:content.find(">", start) + 1]
+
+        if tag == _PLAIN_ITEM:
+            end = content.find("</li>", pos) + len("</li>")
+            item = content[start:end]
+            title_fragment = f"\n    {html.escape(before.title)}\n"
+            if item.count(anchor) != 1 or item.count(title_fragment) != 1:
+                raise IncrementalBuildError(f"nav 항목 형식이 예상과 다릅니다: {page.file.dest_uri}")
+            items = "".join(
+                item
+                .replace(anchor, _nav_link(new_page, page))
+                .replace(title_fragment, f"\n    {html.escape(new_page.title)}\n")
+                + insertion["gap"]
+                for new_page in insertion["pages"]
+            )
+            content = content[:start] + items + content[start:]
+        elif "md-nav__item--pruned" in tag:
+            first_page = insertion["pages"][0]
+            content = content[:pos] + _nav_link(first_page, page) + content[pos + len(anchor):]
+        else:
+            raise IncrementalBuildError(f"nav 항목 형식이 예상과 다릅니다: {page.file.dest_uri}")
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+
+# ── search index 병합 ─────────────────────────────────────────────────────────
+
+def _group_by_page(docs: list) -> dict:
+    grouped = {}
+    for entry in docs:
+        grouped.setdefault(entry["location"].split("#", 1)[0], []).append(entry)
+    return grouped
+
+
+def _load_search_docs(site_dir: str):
+    path = os.path.join(site_dir, _SEARCH_INDEX_PATH)
+    if not os.path.exists(path):
+        return None
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)["docs"]
+
+
+def _merge_search_index(site_dir: str, previous_docs: list, doc_files, render: set) -> None:
+    """다시 렌더링한 페이지는 새 항목, 나머지는 이전 항목으로 전체 빌드와 같은 순서의 index를 만듭니다."""
+    path = os.path.join(site_dir, _SEARCH_INDEX_PATH)
+    if not os.path.exists(path):
+        return
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    fresh = _group_by_page(data["docs"])
+    previous = _group_by_page(previous_docs)
+    docs = []
+    for file in doc_files:
+        source = fresh if file.src_uri in render else previous
+        docs.extend(source.get(file.page.url, []))
+    data["docs"] = docs
+
+    # material search plugin과 같은 직렬화 형식
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(data, separators=(",", ":"), default=str))
+
+
+# ── 빌드 ──────────────────────────────────────────────────────────────────────
+
+def _build_incremental(config, files, nav, env, plan: dict, previous_docs) -> None:
+    """mkdocs.commands.build.build의 뒷부분을 plan["render"] 페이지로 한정해 실행합니다."""
+    render = plan["render"]
+    for file in files.documentation_pages():
+        if file.src_uri in render:
+            mkdocs_build._populate_page(file.page, config, files)
+
+    env = config.plugins.on_env(env, config=config, files=files)
+
+    # 테마 asset은 mtime 기준, docs의 정적 파일은 내용이 바뀐 것만 복사
+    files.copy_static_files(dirty=True)
+    for file in files.static_pages():
+        if file.src_uri in plan["changed"]:
+            file.copy_file()
+
+    for template in config.theme.static_templates:
+        mkdocs_build._build_theme_template(template, env, files, config, nav)
+    for template in config.extra_templates:
+        mkdocs_build._build_extra_template(template, files, config, nav)
+
+    doc_files = files.documentation_pages()
+    for file in doc_files:
+        if file.src_uri in render:
+            mkdocs_build._build_page(file.page, config, doc_files, nav, env)
+
+    insertion = plan["insertion"]
+    if insertion is not None:
+        insertion["gap"] = _find_item_gap(
+            [file.page for file in doc_files if file.src_uri in render]
+            + [file.page for file in doc_files if file.src_uri not in render],
+            insertion["siblings"],
+        )
+        for file in doc_files:
+            if file.src_uri not in render:
+                _patch_nav(file.page, insertion)
+
+    config.plugins.on_post_build(config=config)
+    if previous_docs is not None:
+        _merge_search_index(config.site_dir, previous_docs, doc_files, render)
+
+
+def build(config_file: str = "mkdocs.yml", full: bool = False, site_dir: str = None) -> str:
+    """
+    사이트를 빌드하고 사용한 방식("incremental" | "full")을 반환합니다.
+    증분 빌드가 불가능하거나 도중에 실패하면 전체 빌드로 대체합니다.
+    """
+    started = time.monotonic()
+    config = _load(config_file, site_dir)
+    try:
+        config, files, nav, env = _gather(config)
+        current = _snapshot(config, files, nav)
+        mode = "full"
+
+        if not full:
+            try:
+                plan = _plan(config, files, nav, _load_manifest(config), current)
+                previous_docs = _load_search_docs(config.site_dir)
+                if previous_docs is None and any(name.endswith("search") for name in config.plugins):
+                    raise IncrementalBuildError("이전 search index가 없습니다")
+                if (any(name.endswith("search_shards.py") for name in config.plugins)
+                        and search_shards.load_manifest(config.site_dir) is None):
+                    raise IncrementalBuildError("이전 search shard가 없습니다")
+                # 여기부터 site_dir을 고쳐 쓰므로, 도중에 실패하면 이전 빌드 정보도 무효
+                # (남아 있으면 다음 실행이 이미 패치된 HTML에 같은 nav 항목을 또 끼워 넣음)
+                _discard_manifest(config)
+                # 바뀐 페이지가 없어도 sitemap(lastmod=빌드 날짜)·404는 다시 만듦
+                _build_incremental(config, files, nav, env, plan, previous_docs)
+                mode = "incremental"
+                print(f"[site_publisher] 증분 빌드: 렌더링 {len(plan['render'])}페이지 "
+                      f"({', '.join(sorted(plan['render'])) or '없음'})")
+            except IncrementalBuildError as e:
+                print(f"[site_publisher] 전체 빌드로 대체합니다: {e}")
+            except Exception as e:
+                # 일부 HTML이 이미 바뀌었을 수 있음 → 전체 빌드가 site_dir을 비우고 새로 만듦
+                print(f"[site_publisher] 증분 빌드 실패, 전체 빌드로 대체합니다: {e!r}")
+    finally:
+        config.plugins.on_shutdown()
+
+    if mode == "full":
+        # 실패한 증분 시도의 plugin 상태가 남지 않도록 설정을 새로 읽음
+        config = _load(config_file, site_dir)
+        try:
+            # dirty=False(기본값): site_dir을 비운 뒤 빌드 (실패한 증분 빌드의 흔적 제거)
+            mkdocs_build.build(config)
+        finally:
+            config.plugins.on_shutdown()
+
+    _save_manifest(config, current)
+    print(f"[site_publisher] {mode} 빌드 완료 ({time.monotonic() - started:.1f}s)")
+    return mode
+
+
+# ── 검증 ──────────────────────────────────────────────────────────────────────
+
+def _read_output(path: str) -> bytes:
+    with open(path, "rb") as f:
+        data = f.read()
+    if path.endswith(".gz"):
+        return gzip.decompress(data)
+    return data
+
+
+def _tree_files(root: str) -> set:
+    found = set()
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            found.add(os.path.relpath(os.path.join(dirpath, name), root))
+    return found
+
+
+def diff_sites(site_dir: str, reference_dir: str) -> list:
+    """두 빌드 결과의 차이 나는 파일 목록 (.gz는 압축 해제한 내용으로 비교)."""
+    ours, theirs = _tree_files(site_dir), _tree_files(reference_dir)
+    differing = sorted(ours ^ theirs)
+    for relpath in sorted(ours & theirs):
+        if _read_output(os.path.join(site_dir, relpath)) != _read_output(os.path.join(reference_dir, relpath)):
+            differing.append(relpath)
+    return differing
+
+
+def verify(config_file: str = "mkdocs.yml") -> list:
+    """
+    현재 site_dir을 임시 디렉터리의 전체 빌드와 비교합니다.
+    다르면 차이를 출력하고 site_dir을 전체 빌드 결과로 교체한 뒤 차이 목록을 반환합니다.
+    """
+    config = load_config(config_file=config_file)
+    site_dir = config.site_dir
+    with tempfile.TemporaryDirectory(prefix="site-verify-") as reference_dir:
+        reference = _load(config_file, reference_dir)
+        try:
+            mkdocs_build.build(reference)
+        finally:
+            reference.plugins.on_shutdown()
+
+        differing = diff_sites(site_dir, reference_dir)
+        if differing:
+            print(f"[site_publisher] ⚠️ 전체 빌드와 다른 파일 {len(differing)}개: {', '.join(differing[:10])}")
+            shutil.rmtree(site_dir)
+            shutil.copytree(reference_dir, site_dir)
+        else:
+            print("[site_publisher] ✅ 증분 빌드 결과가 전체 빌드와 같습니다.")
+    return differing
+
+
+# ── 배포 ──────────────────────────────────────────────────────────────────────
+
+def deploy(config_file: str = "mkdocs.yml") -> None:
+    """빌드된 site_dir을 gh-pages 브랜치에 force push (mkdocs gh-deploy --force의 배포 단계)."""
+    config = load_config(config_file=config_file)
+    gh_deploy.gh_deploy(config, force=True)
+
+
+def publish(config_file: str = "mkdocs.yml", full: bool = False, verify_build: bool = False,
+            push: bool = True) -> str:
+    mode = build(config_file, full=full)
+    if verify_build and mode == "incremental":
+        verify(config_file)
+    if push:
+        deploy(config_file)
+    return mode
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="MkDocs 사이트 증분 빌드·배포")
+    parser.add_argument("-f", "--config-file", default="mkdocs.yml")
+    parser.add_argument("--full", action="store_true", help="항상 전체 빌드")
+    parser.add_argument("--verify", action="store_true", help="증분 빌드 결과를 전체 빌드와 비교")
+    parser.add_argument("--deploy", action="store_true", help="빌드 후 gh-pages에 배포")
+    args = parser.parse_args()
+    publish(args.config_file, full=args.full, verify_build=args.verify, push=args.deploy)
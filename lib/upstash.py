@@ -0,0 +1,436 @@
+"""
+Upstash Redis REST 클라이언트 — main.py, api/index.py, lib 모듈에서 공용으로 사용합니다.
+
+  - request(command, *args) : 명령 1개
+  - pipeline(commands)      : 여러 명령을 /pipeline 요청 1번으로 전송 (원자성 없음)
+  - transaction(commands)   : 여러 명령을 /multi-exec 요청 1번으로 원자적 실행
+
+HTTP 연결은 스레드별로 keep-alive 상태를 유지하므로 같은 인스턴스(warm Vercel 함수,
+GitHub Actions 실행)에서는 TLS handshake를 한 번만 합니다.
+명령은 JSON 배열 본문(["SET", "key", "value"])으로 POST 전송하므로
+값이 길어도 URL 길이 제한에 걸리지 않습니다.
+
+UPSTASH_BACKEND=local 이면 프로세스 내 메모리 저장소(LocalBackend)를 사용합니다
+(테스트·로컬 실행용, 자주 쓰는 문자열/집합/리스트 명령만 지원).
+설정이 없거나 요청이 실패하면 None을 반환합니다 (호출 측에서 캐시 miss로 처리).
+"""
+
+import fnmatch
+import http.client
+import json
+import os
+import threading
+import time
+import urllib.parse
+
+UPSTASH_REDIS_REST_URL = os.getenv("UPSTASH_REDIS_REST_URL", "").rstrip("/")
+UPSTASH_REDIS_REST_TOKEN = os.getenv("UPSTASH_REDIS_REST_TOKEN", "")
+
+_REQUEST_TIMEOUT_SEC = 10
+
+
+# ── HTTP backend (Upstash REST, keep-alive) ──────────────────────────────────
+
+class HTTPBackend:
+    """Upstash REST API. 스레드마다 HTTP(S) 연결 1개를 재사용합니다."""
+
+    def __init__(self, url: str, token: str, timeout: float = _REQUEST_TIMEOUT_SEC):
+        parts = urllib.parse.urlsplit(url)
+        self._scheme = parts.scheme or "https"
+        self._host = parts.hostname
+        self._port = parts.port
+        self._base_path = parts.path.rstrip("/")
+        self._token = token
+        self._timeout = timeout
+        self._local = threading.local()
+
+    def _connection(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn_class = http.client.HTTPSConnection if self._scheme == "https" else http.client.HTTPConnection
+            conn = conn_class(self._host, self._port, timeout=self._timeout)
+            self._local.conn = conn
+        return conn
+
+    def _reset(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+        self._local.conn = None
+
+    def post(self, path: str, body):
+        """JSON 본문을 POST하고 응답 JSON을 반환합니다. 실패 시 예외."""
+        data = json.dumps(body).encode("utf-8")
+        headers = {
+            "Authorization": f"Bearer {self._token}",
+            "Content-Type": "application/json",
+        }
+        for attempt in range(2):
+            reused = getattr(self._local, "conn", None) is not None
+            conn = self._connection()
+            try:
+                conn.request("POST", self._base_path + path, body=data, headers=headers)
+                resp = conn.getresponse()
+                raw = resp.read()
+            except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+                # 서버가 닫은 keep-alive 연결: 새 연결로 한 번만 다시 시도
+                self._reset()
+                if reused and attempt == 0:
+                    continue
+                raise
+            except Exception:
+                self._reset()
+                raise
+
+            payload = json.loads(raw.decode("utf-8"))
+            if resp.status >= 400 and not isinstance(payload, (dict, list)):
+                raise RuntimeError(f"HTTP {resp.status}")
+            return payload
+
+    def close(self):
+        self._reset()
+
+
+# ── Local backend (in-memory stand-in) ───────────────────────────────────────
+
+class LocalBackend:
+    """
+    Upstash REST 응답 형식을 흉내 내는 프로세스 내 Redis 대용.
+    값은 Redis처럼 문자열로 저장하고, 키별 만료 시각(monotonic)을 지원합니다.
+    """
+
+    def __init__(self):
+        self._data = {}
+        self._expires = {}
+        self._lock = threading.RLock()
+
+    # -- REST endpoint 흉내 --
+
+    def post(self, path: str, body):
+        with self._lock:
+            if path == "":
+                return self._reply(body)
+            if path == "/pipeline":
+                return [self._reply(command) for command in body]
+            if path == "/multi-exec":
+                # 잠금 안에서 연속 실행하므로 다른 스레드의 명령이 끼어들지 않음
+                return [self._reply(command) for command in body]
+        raise ValueError(f"지원하지 않는 경로: {path}")
+
+    def _reply(self, command) -> dict:
+        name, *args = command
+        handler = getattr(self, "_cmd_" + str(name).lower(), None)
+        if handler is None:
+            return {"error": f"ERR unknown command '{name}'"}
+        try:
+            return {"result": handler(*[str(arg) for arg in args])}
+        except (TypeError, ValueError, IndexError) as e:
+            return {"error": f"ERR {name}: {e}"}
+
+    # -- 내부 유틸 --
+
+    def _alive(self, key: str):
+        expires_at = self._expires.get(key)
+        if expires_at is not None and expires_at <= time.monotonic():
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return self._data.get(key)
+
+    def _typed(self, key: str, kind: type, create: bool = False):
+        value = self._alive(key)
+        if value is None:
+            if not create:
+                return kind()
+            value = self._data[key] = kind()
+        if not isinstance(value, kind):
+            raise TypeError("WRONGTYPE Operation against a key holding the wrong kind of value")
+        return value
+
+    def _drop_if_empty(self, key: str):
+        if not self._data.get(key):
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+
+    # -- 키/문자열 --
+
+    def _cmd_ping(self):
+        return "PONG"
+
+    def _cmd_get(self, key):
+        value = self._alive(key)
+        if value is not None and not isinstance(value, str):
+            raise TypeError("WRONGTYPE")
+        return value
+
+    def _cmd_set(self, key, value, *options):
+        flags = [option.upper() for option in options]
+        ttl = None
+        nx = "NX" in flags
+        xx = "XX" in flags
+        for unit, scale in (("EX", 1.0), ("PX", 0.001)):
+            if unit in flags:
+                ttl = float(options[flags.index(unit) + 1]) * scale
+        exists = self._alive(key) is not None
+        if (nx and exists) or (xx and not exists):
+            return None
+        self._data[key] = value
+        if ttl is not None:
+            self._expires[key] = time.monotonic() + ttl
+        else:
+            self._expires.pop(key, None)
+        return "OK"
+
+    def _cmd_del(self, *keys):
+        removed = 0
+        for key in keys:
+            if self._alive(key) is not None:
+                removed += 1
+            self._data.pop(key, None)
+            self._expires.pop(key, None)
+        return removed
+
+    def _cmd_exists(self, *keys):
+        return sum(1 for key in keys if self._alive(key) is not None)
+
+    def _cmd_expire(self, key, seconds):
+        if self._alive(key) is None:
+            return 0
+        self._expires[key] = time.monotonic() + float(seconds)
+        return 1
+
+    def _cmd_ttl(self, key):
+        if self._alive(key) is None:
+            return -2
+        expires_at = self._expires.get(key)
+        if expires_at is None:
+            return -1
+        return max(0, int(round(expires_at - time.monotonic())))
+
+    def _cmd_incr(self, key):
+        return self._cmd_incrby(key, "1")
+
+    def _cmd_incrby(self, key, amount):
+        value = int(self._cmd_get(key) or 0) + int(amount)
+        self._data[key] = str(value)
+        return value
+
+    def _cmd_keys(self, pattern):
+        return [key for key in list(self._data) if self._alive(key) is not None and fnmatch.fnmatchcase(key, pattern)]
+
+    # -- 집합 --
+
+    def _cmd_sadd(self, key, *members):
+        members_set = self._typed(key, set, create=True)
+        before = len(members_set)
+        members_set.update(members)
+        return len(members_set) - before
+
+    def _cmd_srem(self, key, *members):
+        members_set = self._typed(key, set)
+        removed = len(members_set & set(members))
+        members_set.difference_update(members)
+        self._drop_if_empty(key)
+        return removed
+
+    def _cmd_sismember(self, key, member):
+        return int(member in self._typed(key, set))
+
+    def _cmd_smismember(self, key, *members):
+        members_set = self._typed(key, set)
+        return [int(member in members_set) for member in members]
+
+    def _cmd_smembers(self, key):
+        return sorted(self._typed(key, set))
+
+    def _cmd_scard(self, key):
+        return len(self._typed(key, set))
+
+    # -- 해시 --
+
+    def _cmd_hset(self, key, *pairs):
+        if not pairs or len(pairs) % 2:
+            raise ValueError("wrong number of arguments")
+        fields = self._typed(key, dict, create=True)
+        added = 0
+        for field, value in zip(pairs[::2], pairs[1::2]):
+            added += field not in fields
+            fields[field] = value
+        return added
+
+    def _cmd_hget(self, key, field):
+        return self._typed(key, dict).get(field)
+
+    def _cmd_hgetall(self, key):
+        # Upstash REST처럼 [field, value, field, value, ...]
+        return [part for item in self._typed(key, dict).items() for part in item]
+
+    # -- 리스트 --
+
+    def _cmd_lpush(self, key, *values):
+        items = self._typed(key, list, create=True)
+        for value in values:
+            items.insert(0, value)
+        return len(items)
+
+    def _cmd_rpush(self, key, *values):
+        items = self._typed(key, list, create=True)
+        items.extend(values)
+        return len(items)
+
+    def _pop(self, key, side: str):
+        items = self._typed(key, list)
+        if not items:
+            return None
+        value = items.pop(0 if side == "LEFT" else -1)
+        self._drop_if_empty(key)
+        return value
+
+    def _cmd_lpop(self, key):
+        return self._pop(key, "LEFT")
+
+    def _cmd_rpop(self, key):
+        return self._pop(key, "RIGHT")
+
+    def _cmd_llen(self, key):
+        return len(self._typed(key, list))
+
+    def _cmd_lrange(self, key, start, stop):
+        items = self._typed(key, list)
+        start, stop = int(start), int(stop)
+        if start < 0:
+            start = max(0, start + len(items))
+        if stop < 0:
+            stop += len(items)
+        return items[start:stop + 1]
+
+    def _cmd_lrem(self, key, count, value):
+        items = self._typed(key, list)
+        count = int(count)
+        removed = 0
+        indices = range(len(items)) if count >= 0 else range(len(items) - 1, -1, -1)
+        for index in list(indices):
+            if count and removed >= abs(count):
+                break
+            if items[index] == value:
+                items[index] = None
+                removed += 1
+        items[:] = [item for item in items if item is not None]
+        self._drop_if_empty(key)
+        return removed
+
+    def _cmd_lmove(self, source, destination, where_from, where_to):
+        value = self._pop(source, where_from.upper())
+        if value is None:
+            return None
+        if where_to.upper() == "LEFT":
+            self._cmd_lpush(destination, value)
+        else:
+            self._cmd_rpush(destination, value)
+        return value
+
+    def _cmd_rpoplpush(self, source, destination):
+        return self._cmd_lmove(source, destination, "RIGHT", "LEFT")
+
+    def close(self):
+        pass
+
+
+# ── backend 선택 ──────────────────────────────────────────────────────────────
+
+_backend = None
+_backend_lock = threading.Lock()
+
+
+def get_backend():
+    """UPSTASH_BACKEND / UPSTASH_REDIS_REST_URL 설정에 맞는 backend (없으면 None)."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                if os.getenv("UPSTASH_BACKEND", "").strip().lower() == "local":
+                    _backend = LocalBackend()
+                elif UPSTASH_REDIS_REST_URL and UPSTASH_REDIS_REST_TOKEN:
+                    _backend = HTTPBackend(UPSTASH_REDIS_REST_URL, UPSTASH_REDIS_REST_TOKEN)
+    return _backend
+
+
+def set_backend(backend) -> None:
+    """backend를 직접 지정합니다 (테스트·벤치마크용, None이면 설정에서 다시 선택)."""
+    global _backend
+    with _backend_lock:
+        if _backend is not None and _backend is not backend:
+            _backend.close()
+        _backend = backend
+
+
+def is_configured() -> bool:
+    return get_backend() is not None
+
+
+# ── Public API ────────────────────────────────────────────────────────────────
+
+def _command_label(commands) -> str:
+    return ",".join(str(command[0]) for command in commands)
+
+
+def request(command: str, *args):
+    """Redis 명령 1개를 실행하고 result 값을 반환합니다. 실패 시 None."""
+    backend = get_backend()
+    if backend is None:
+        return None
+
+    try:
+        payload = backend.post("", [command, *[str(arg) for arg in args]])
+    except Exception as e:
+        print(f"[upstash] Redis 요청 실패 ({command}): {e}")
+        return None
+
+    if payload.get("error"):
+        print(f"[upstash] Redis 오류 ({command}): {payload['error']}")
+        return None
+
+    return payload.get("result")
+
+
+def _batch(path: str, commands: list, error_value=None):
+    backend = get_backend()
+    if backend is None or not commands:
+        return None
+
+    body = [[str(part) for part in command] for command in commands]
+    try:
+        payload = backend.post(path, body)
+    except Exception as e:
+        print(f"[upstash] Redis {path} 요청 실패 ({_command_label(commands)}): {e}")
+        return None
+
+    if isinstance(payload, dict):
+        # multi-exec 전체 실패 (예: 문법 오류로 트랜잭션 취소)
+        print(f"[upstash] Redis {path} 오류 ({_command_label(commands)}): {payload.get('error')}")
+        return None
+
+    results = []
+    for command, item in zip(commands, payload):
+        if item.get("error"):
+            print(f"[upstash] Redis 오류 ({command[0]}): {item['error']}")
+            results.append(error_value)
+        else:
+            results.append(item.get("result"))
+    return results
+
+
+def pipeline(commands: list, error_value=None):
+    """
+    여러 명령을 HTTP 요청 1번으로 실행합니다 (Upstash /pipeline, 원자성 없음).
+
+        pipeline([["SADD", "a", 1], ["SREM", "b", 1]])  →  [1, 1]
+
+    반환값: 명령별 result 목록 (오류 난 명령은 error_value, 기본 None). 요청 자체가 실패하면 None.
+    nil 결과와 명령 오류를 구분해야 하면 error_value에 sentinel을 넘깁니다.
+    """
+    return _batch("/pipeline", commands, error_value)
+
+
+def transaction(commands: list):
+    """여러 명령을 MULTI/EXEC로 원자적으로 실행합니다 (Upstash /multi-exec). 반환값은 pipeline과 같음."""
+    return _batch("/multi-exec", commands)
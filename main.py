@@ -1,19 +1,23 @@
 import os
+import io
 import json
 import feedparser
-import google.generativeai as genai
 import asyncio
 from telegram import Bot
 from datetime import datetime, timedelta, timezone
-import urllib.parse
-import urllib.request
-import xml.etree.ElementTree as ET
 from dotenv import load_dotenv
 from github import Github
 # 새로운 지표 모듈 임포트
-from indicators import get_indicators_data, format_to_markdown
+from indicators import get_indicators_data, format_to_markdown, format_for_prompt
+from lib import llm_client, site_publisher, upstash
+from lib.broadcaster import Broadcaster
+from lib.feed_cache import fetch_feed
+from lib.feed_parser import parse_feed_stream
+from lib.llm_client import LLMUnavailableError
+from lib.pipeline import Stage, run_stages
+from lib.report_nav import ReportIndex
+from lib.rss_config import DAILY_RSS_SOURCES
 import toml
-import yaml
 
 load_dotenv()
 
@@ -21,54 +25,37 @@ load_dotenv()
 GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 TELEGRAM_TOKEN = os.getenv("TELEGRAM_TOKEN")
 CHAT_ID = os.getenv("CHAT_ID")
-UPSTASH_REDIS_REST_URL = os.getenv("UPSTASH_REDIS_REST_URL", "").rstrip("/")
-UPSTASH_REDIS_REST_TOKEN = os.getenv("UPSTASH_REDIS_REST_TOKEN", "")
 
 SUBSCRIBERS_KEY = "tg:subscribers"
 KST = timezone(timedelta(hours=9))
+# 보고서·요약 결합 생성 (GEMINI_COMBINED_GENERATION=0 이면 두 프롬프트를 동시 실행)
+COMBINED_GENERATION = os.getenv("GEMINI_COMBINED_GENERATION", "1") != "0"
+REPORT_AND_BRIEF_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": {
+        "type": "OBJECT",
+        "properties": {
+            "analysis": {"type": "STRING"},
+            "brief": {"type": "STRING"},
+        },
+        "required": ["analysis", "brief"],
+    },
+}
 RSS_REQUEST_HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (compatible; DailyEconomicBriefing/1.0; "
         "+https://github.com/4610162/daily_news)"
     )
 }
-GEMINI_MODEL_PRIORITY = (
-    "gemini-2.5-flash",
-    "gemini-3-flash-preview",
-    "gemini-2.0-flash",
-    "gemini-2.5-pro",
-    "gemini-2.5-flash-lite",
-)
 
 
 def redis_is_configured():
-    return bool(UPSTASH_REDIS_REST_URL and UPSTASH_REDIS_REST_TOKEN)
+    return upstash.is_configured()
 
 
 def redis_request(command, *args):
-    if not redis_is_configured():
-        return None
-
-    encoded_parts = [urllib.parse.quote(str(part), safe="") for part in (command, *args)]
-    url = f"{UPSTASH_REDIS_REST_URL}/{'/'.join(encoded_parts)}"
-    req = urllib.request.Request(
-        url,
-        headers={"Authorization": f"Bearer {UPSTASH_REDIS_REST_TOKEN}"},
-        method="POST",
-    )
-
-    try:
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            payload = json.loads(resp.read().decode("utf-8"))
-    except Exception as e:
-        print(f"❌ Redis 요청 실패 ({command}): {e}")
-        return None
-
-    if payload.get("error"):
-        print(f"❌ Redis 오류 ({command}): {payload['error']}")
-        return None
-
-    return payload.get("result")
+    # keep-alive 연결·pipeline 지원은 lib.upstash 공용 클라이언트가 담당
+    return upstash.request(command, *args)
 
 
 def get_subscriber_chat_ids():
@@ -92,30 +79,30 @@ def get_subscriber_chat_ids():
     return unique_subscribers
 
 def get_news_content():
-    urls = [
-        "https://www.hankyung.com/feed/economy",
-        "https://www.hankyung.com/feed/finance"
-    ]
     news_items = []  # 상세 데이터 저장
     news_text_for_ai = ""
     
-    for url in urls:
-        feed = feedparser.parse(url, request_headers=RSS_REQUEST_HEADERS)
-        entries = feed.entries
-
-        if getattr(feed, "bozo", False):
-            print(f"⚠️ RSS 파싱 경고 ({url}): {getattr(feed, 'bozo_exception', '')}")
-
-        if not entries:
-            print(f"⚠️ feedparser 수집 0건 ({url}), XML fallback 시도")
-            entries = parse_rss_with_urllib(url)
+    for source in DAILY_RSS_SOURCES:
+        url = source["url"]
+        # 조건부 GET 캐시 사용: 피드가 바뀌지 않았으면(304) 저장된 entry 재사용
+        try:
+            entries = fetch_feed(
+                url,
+                lambda resp, url=url: parse_rss_response(url, resp),
+                headers=RSS_REQUEST_HEADERS,
+                timeout=20,
+                namespace="daily",
+            )
+        except Exception as e:
+            print(f"❌ RSS 수집 실패 ({url}): {e}")
+            entries = []
 
         print(f"📰 RSS 수집 결과 ({url}): {len(entries)}건")
-        category = "경제" if "economy" in url else "증권"
+        category = source["category"]
         for entry in entries[:5]:
-            title = entry.get('title', '제목 없음')
-            link = entry.get('link', '#')
-            summary = entry.get('summary', entry.get('description', title))
+            title = entry.get('title') or '제목 없음'
+            link = entry.get('link') or '#'
+            summary = entry.get('summary') or title
             
             news_items.append({"cat": category, "title": title, "link": link})
             news_text_for_ai += f"제목: {title}\n내용: {summary}\n\n"
@@ -126,42 +113,42 @@ def get_news_content():
     return news_items, news_text_for_ai
 
 
-def parse_rss_with_urllib(url):
-    try:
-        req = urllib.request.Request(url, headers=RSS_REQUEST_HEADERS)
-        with urllib.request.urlopen(req, timeout=20) as resp:
-            root = ET.fromstring(resp.read())
-    except Exception as e:
-        print(f"❌ RSS XML fallback 실패 ({url}): {e}")
-        return []
+def parse_rss_response(url, resp):
+    """응답 본문을 feedparser로 파싱하고, 0건이면 같은 본문으로 XML fallback을 시도합니다."""
+    content = resp.read()
+    feed = feedparser.parse(content)
+
+    if getattr(feed, "bozo", False):
+        print(f"⚠️ RSS 파싱 경고 ({url}): {getattr(feed, 'bozo_exception', '')}")
 
     entries = []
-    channel = root.find("channel") or root
-    for item in channel.findall("item"):
-        title_el = item.find("title")
-        link_el = item.find("link")
-        desc_el = item.find("description")
-        title = (title_el.text or "").strip() if title_el is not None else "제목 없음"
+    for entry in feed.entries:
+        title = entry.get('title', '제목 없음')
         entries.append(
             {
                 "title": title,
-                "link": (link_el.text or "").strip() if link_el is not None else "#",
-                "summary": (desc_el.text or "").strip() if desc_el is not None else title,
+                "link": entry.get('link', '#'),
+                "summary": entry.get('summary', entry.get('description', title)),
             }
         )
 
+    if not entries:
+        print(f"⚠️ feedparser 수집 0건 ({url}), XML fallback 시도")
+        try:
+            # 상위 5건만 사용하므로 그 이상은 파싱하지 않음
+            entries = parse_feed_stream(io.BytesIO(content), limit=5)
+        except Exception as e:
+            print(f"❌ RSS XML fallback 실패 ({url}): {e}")
+            entries = []
+
     return entries
 
-def get_gemini_summary(news_data):
-    if not GEMINI_API_KEY:
-        raise ValueError("GEMINI_API_KEY가 설정되지 않았습니다.")
-        
-    genai.configure(api_key=GEMINI_API_KEY)
 
+def build_report_prompt(news_data):
     # 💡 현재 날짜를 구해서 프롬프트에 넣어줍니다.
     today_date = datetime.now(KST).strftime("%Y년 %m월 %d일")
     
-    prompt = f"""
+    return f"""
     역할 : 경제 및 금융 전문 애널리스트
     아래 뉴스 데이터를 분석해서 마크다운 형식으로 보고서를 작성해줘.
     모든 분석의 기준 시점은 반드시 {today_date}이어야 해.
@@ -175,20 +162,19 @@ def get_gemini_summary(news_data):
     [뉴스 데이터]
     {news_data}
     """
-    for model_name in GEMINI_MODEL_PRIORITY:
-        try:
-            # 모델 인스턴스 생성 및 호출
-            model = genai.GenerativeModel(model_name)
-            response = model.generate_content(prompt)
-            
-            # 성공 시 결과 반환 후 종료
-            return response.text
-            
-        except Exception as e:
-            print(f"⚠️ {model_name} 실패: {e}. 다음 모델로 전환합니다...")
-            continue
 
-    return "❌ 모든 가용 모델의 호출에 실패했습니다."
+
+def get_gemini_summary(news_data):
+    if not GEMINI_API_KEY:
+        raise ValueError("GEMINI_API_KEY가 설정되지 않았습니다.")
+
+    prompt = build_report_prompt(news_data)
+    # 모델 우선순위·장애 모델 건너뛰기는 lib.llm_client가 처리
+    try:
+        return llm_client.generate(prompt, caller="main")
+    except LLMUnavailableError as e:
+        print(f"⚠️ 보고서 생성 실패: {e}")
+        return "❌ 모든 가용 모델의 호출에 실패했습니다."
 
 async def create_and_save_report(news_items, indicators_md, analysis):
     today_str = datetime.now(KST).strftime("%Y-%m-%d")
@@ -228,15 +214,8 @@ def build_fallback_telegram_brief(news_items):
     )
 
 
-# 텔레그램 상단에 노출할 3줄 핵심 요약 생성
-def get_telegram_brief(news_data, news_items):
-    if not GEMINI_API_KEY:
-        print("⚠️ GEMINI_API_KEY가 없어 제목 기반 요약으로 대체합니다.")
-        return build_fallback_telegram_brief(news_items)
-
-    genai.configure(api_key=GEMINI_API_KEY)
-
-    prompt = f"""
+def build_brief_prompt(news_data):
+    return f"""
     다음 뉴스 데이터를 바탕으로 오늘 가장 중요한 경제 소식 3가지를 요약해줘.
     - 각 소식을 넘버링해서 한 줄로 작성할 것.
     - 이모지를 적절히 섞어서 친근하게 작성할 것.
@@ -247,49 +226,91 @@ def get_telegram_brief(news_data, news_items):
     {news_data}
     """
 
-    for model_name in GEMINI_MODEL_PRIORITY:
-        try:
-            model = genai.GenerativeModel(model_name)
-            response = model.generate_content(prompt)
-            return response.text.strip()
-        except Exception as e:
-            print(f"⚠️ 텔레그램 요약 생성 실패 ({model_name}): {e}")
+
+# 텔레그램 상단에 노출할 3줄 핵심 요약 생성
+def get_telegram_brief(news_data, news_items):
+    if not GEMINI_API_KEY:
+        print("⚠️ GEMINI_API_KEY가 없어 제목 기반 요약으로 대체합니다.")
+        return build_fallback_telegram_brief(news_items)
+
+    prompt = build_brief_prompt(news_data)
+
+    try:
+        return llm_client.generate(prompt, caller="main").strip()
+    except LLMUnavailableError as e:
+        print(f"⚠️ 텔레그램 요약 생성 실패: {e}")
 
     print("⚠️ 텔레그램 요약을 제목 기반 요약으로 대체합니다.")
     return build_fallback_telegram_brief(news_items)
 
-def update_mkdocs_nav(report_date):
-    """MkDocs용 mkdocs.yml 내비게이션 업데이트"""
-    yaml_path = "mkdocs.yml"
-    if not os.path.exists(yaml_path):
-        print(f"⚠️ {yaml_path} 파일이 없습니다.")
-        return
+
+# 보고서 + 3줄 요약을 한 번의 구조화(JSON) 응답으로 생성
+def get_combined_report_and_brief(news_data):
+    today_date = datetime.now(KST).strftime("%Y년 %m월 %d일")
+    prompt = f"""
+    역할 : 경제 및 금융 전문 애널리스트
+    아래 뉴스 데이터를 바탕으로 두 가지 결과물을 JSON으로 작성해줘.
+    모든 분석의 기준 시점은 반드시 {today_date}이어야 해.
+
+    1. analysis : 마크다운 형식의 보고서
+       - 🎯 오늘의 경제 및 시장 핵심 키워드 (3개)
+       - 📈 종합 분석 및 투자 전략 (심도 있게)
+       - ⚠️ 주의 깊게 봐야 할 지표나 일정
+       - 전문적이고 신뢰감 있는 톤으로 작성할 것.
+    2. brief : 오늘 가장 중요한 경제 소식 3가지 요약
+       - 각 소식을 넘버링해서 한 줄로 작성할 것 (총 3줄).
+       - 이모지를 적절히 섞어서 친근하게 작성할 것.
+       - 전체 리포트를 읽고 싶게 만드는 핵심 내용 위주로 작성할 것.
+    모두 한국어로 작성할 것.
+
+    [뉴스 데이터]
+    {news_data}
+    """
 
     try:
-        with open(yaml_path, "r", encoding="utf-8") as f:
-            config = yaml.safe_load(f)
-
-        new_entry = {report_date: f"reports/{report_date}.md"}
-        nav_updated = False
-        
-        # nav 리스트에서 'Daily Reports' 섹션 찾기
-        if 'nav' in config:
-            for item in config['nav']:
-                if isinstance(item, dict) and "Daily Reports" in item:
-                    reports_list = item["Daily Reports"]
-                    # 중복 체크 후 최신순 삽입
-                    if not any(report_date in r for r in reports_list):
-                        reports_list.insert(0, new_entry)
-                        nav_updated = True
-                    break
-        
-        if nav_updated:
-            with open(yaml_path, "w", encoding="utf-8") as f:
-                # allow_unicode=True를 해야 한글이 깨지지 않습니다.
-                yaml.dump(config, f, allow_unicode=True, sort_keys=False)
-            print(f"✅ mkdocs.yml 내비게이션 업데이트 완료")
-    except Exception as e:
-        print(f"❌ YAML 수정 실패: {e}")
+        raw = llm_client.generate(prompt, generation_config=REPORT_AND_BRIEF_CONFIG, caller="main")
+        payload = json.loads(raw)
+        analysis = str(payload.get("analysis", "")).strip()
+        brief = str(payload.get("brief", "")).strip()
+    except (LLMUnavailableError, ValueError, AttributeError) as e:
+        print(f"⚠️ 구조화 응답 생성/파싱 실패: {e}")
+        return None
+
+    if not analysis or not brief:
+        print("⚠️ 구조화 응답에 analysis/brief 항목이 비어 있습니다.")
+        return None
+
+    return analysis, brief
+
+
+async def generate_report_and_brief(news_data, news_items):
+    """
+    (보고서, 텔레그램 요약)을 반환합니다.
+    구조화 응답 1회로 둘 다 만들고, 실패하면 기존 두 프롬프트를 동시에 실행합니다.
+    """
+    if GEMINI_API_KEY and COMBINED_GENERATION:
+        combined = await asyncio.to_thread(get_combined_report_and_brief, news_data)
+        if combined:
+            return combined
+        print("⚠️ 보고서·요약 개별 생성으로 전환합니다 (동시 실행).")
+
+    full_analysis, telegram_brief = await asyncio.gather(
+        asyncio.to_thread(get_gemini_summary, news_data),
+        asyncio.to_thread(get_telegram_brief, news_data, news_items),
+    )
+    return full_analysis, telegram_brief
+
+def update_mkdocs_nav(report_date):
+    """
+    MkDocs 내비게이션 확인.
+    Daily Reports nav는 빌드 때 lib/report_nav.py hook이 docs/reports에서 연도 → 월 → 일로
+    자동 생성하므로 mkdocs.yml을 다시 쓰지 않고, 새 리포트가 색인되는지만 확인합니다.
+    """
+    index = ReportIndex()
+    if report_date in index:
+        print(f"✅ 내비게이션 자동 생성 대상 확인 ({report_date}, 전체 {len(index)}건)")
+    else:
+        print(f"⚠️ {index.reports_dir}/{report_date}.md 파일이 없어 내비게이션에 표시되지 않습니다.")
 
 # 텔레그램 전송 부분 수정
 async def send_telegram_summary(summary_text, site_url):
@@ -303,12 +324,7 @@ async def send_telegram_summary(summary_text, site_url):
         f"🔗 <a href='{site_url}'>상세 분석 보고서 보기</a>"
     )
 
-    for chat_id in subscriber_chat_ids:
-        await bot.send_message(
-            chat_id=chat_id,
-            text=message,
-            parse_mode='HTML'
-        )
+    return await Broadcaster(bot).broadcast(subscriber_chat_ids, message, parse_mode='HTML')
 
 # def post_to_github_issues(title, content):
 #     gh_token = os.getenv("GH_TOKEN")
@@ -328,54 +344,113 @@ async def send_telegram_summary(summary_text, site_url):
 #     # 생성된 이슈의 웹 주소(html_url)를 반환합니다.
 #     return new_issue.html_url
 
-async def main():
+# ── 일일 파이프라인 단계 ─────────────────────────────────────────────────────
+# 뉴스·지표·구독자 조회는 서로 독립이라 동시에 실행되고,
+# 나머지는 선행 단계 결과(키워드 인자)가 준비되는 대로 실행됩니다.
+
+def collect_indicators():
+    """(리포트용 지표 표, 프롬프트용 지표 요약)"""
+    data = get_indicators_data()
+    return format_to_markdown(data), format_for_prompt(data)
+
+
+def _indicators_or_empty(indicators):
+    """indicators 단계가 실패(None)했으면 지표 없이 진행 (지표 없음 안내 + 빈 프롬프트)."""
+    return indicators or (format_to_markdown(None), format_for_prompt(None))
+
+
+async def analysis_stage(news, indicators):
+    news_items, news_text_for_ai = news
+    _, indicators_for_ai = _indicators_or_empty(indicators)
+    if indicators_for_ai:
+        # 변화율·z-score·백분위·임계값 통과를 함께 주어 지표 해석의 근거로 사용
+        news_text_for_ai += f"\n\n[시장 주요 지표 (통계)]\n{indicators_for_ai}"
+    return await generate_report_and_brief(news_text_for_ai, news_items)
+
+
+async def report_stage(news, indicators, analysis):
+    news_items, _ = news
+    indicators_md, _ = _indicators_or_empty(indicators)
+    full_analysis, _ = analysis
+    return await create_and_save_report(news_items, indicators_md, full_analysis)
+
+
+def nav_stage(report):
+    update_mkdocs_nav(datetime.now(KST).strftime("%Y-%m-%d"))
+
+
+def deploy_stage(nav):
+    # 증분 빌드 (새 리포트 페이지만 렌더링, 나머지는 nav 패치) 후 gh-pages 배포
+    # SITE_FULL_BUILD=1 이면 전체 빌드, SITE_VERIFY_BUILD=1 이면 전체 빌드와 비교
+    print("🌐 MkDocs 웹사이트 배포 중...")
     try:
-        print("🚀 데이터 수집 및 분석 시작...")
-        news_items, news_text_for_ai = get_news_content()
-        indicators_raw = get_indicators_data()
-        indicators_md = format_to_markdown(indicators_raw)
-        full_analysis = get_gemini_summary(news_text_for_ai)
-        telegram_brief = get_telegram_brief(news_text_for_ai, news_items)
-
-        today_str = datetime.now(KST).strftime("%Y-%m-%d")
-        site_url = await create_and_save_report(news_items, indicators_md, full_analysis)
-        
-        # 1. 내비게이션 업데이트
-        update_mkdocs_nav(today_str)
-
-        # 2. 웹사이트 배포
-        print("🌐 MkDocs 웹사이트 배포 중...")
-        exit_code = os.system("mkdocs gh-deploy --force")
-        
-        if exit_code == 0:
-            print("✅ 웹사이트 배포 성공!")
-        else:
-            print("⚠️ 배포 중 오류가 발생했지만 메시지 전송을 시도합니다.")
-
-        # 3. 텔레그램 메시지 구성 (들여쓰기 수정됨: 배포 결과와 상관없이 실행)
-        print("📱 텔레그램 메시지 구성 중...")
-        bot = Bot(token=TELEGRAM_TOKEN)
-        safe_brief = telegram_brief.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
-        
-        final_message = (
-            f"🚀 <b>오늘의 경제 브리핑 ({today_str})</b>\n\n"
-            f"{safe_brief}\n\n"
-            f"🔗 <a href='{site_url}'>상세 분석 보고서 보기</a>"
+        site_publisher.publish(
+            full=os.getenv("SITE_FULL_BUILD") == "1",
+            verify_build=os.getenv("SITE_VERIFY_BUILD") == "1",
         )
+        exit_code = 0
+    except (Exception, SystemExit) as e:
+        print(f"❌ 웹사이트 빌드/배포 실패: {e}")
+        exit_code = 1
 
-        subscriber_chat_ids = get_subscriber_chat_ids()
-        if not subscriber_chat_ids:
-            raise ValueError("구독자 또는 CHAT_ID가 설정되지 않았습니다.")
+    if exit_code == 0:
+        print("✅ 웹사이트 배포 성공!")
+    else:
+        print("⚠️ 배포 중 오류가 발생했지만 메시지 전송을 시도합니다.")
+    return exit_code
 
-        sent_count = 0
-        for chat_id in subscriber_chat_ids:
-            try:
-                await bot.send_message(chat_id=chat_id, text=final_message, parse_mode='HTML')
-                sent_count += 1
-            except Exception as send_error:
-                print(f"⚠️ chat_id={chat_id} 전송 실패: {send_error}")
 
-        print(f"✅ 텔레그램 전송 완료: {sent_count}/{len(subscriber_chat_ids)}명")
+async def telegram_stage(analysis, report, subscribers, deploy):
+    # 배포 결과와 상관없이 실행
+    print("📱 텔레그램 메시지 구성 중...")
+    today_str = datetime.now(KST).strftime("%Y-%m-%d")
+    _, telegram_brief = analysis
+    site_url = report
+
+    bot = Bot(token=TELEGRAM_TOKEN)
+    safe_brief = telegram_brief.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+    final_message = (
+        f"🚀 <b>오늘의 경제 브리핑 ({today_str})</b>\n\n"
+        f"{safe_brief}\n\n"
+        f"🔗 <a href='{site_url}'>상세 분석 보고서 보기</a>"
+    )
+
+    if not subscribers:
+        raise ValueError("구독자 또는 CHAT_ID가 설정되지 않았습니다.")
+
+    result = await Broadcaster(bot).broadcast(subscribers, final_message, parse_mode='HTML')
+
+    print(
+        f"✅ 텔레그램 전송 완료: {result['delivered']}/{len(subscribers)}명 "
+        f"(실패 {result['failed']}, 차단 {result['blocked']})"
+    )
+    return result
+
+
+def build_daily_stages():
+    """단계 정의: (이름, 함수, 선행 단계, 시도당 timeout, 재시도 횟수)"""
+    return [
+        # 피드별 요청 timeout(20s)이 있으므로 단계 timeout은 두지 않음 (뉴스가 없을 때만 실패)
+        Stage("news", get_news_content, retries=1),
+        # 지표는 없어도 리포트·전송을 계속함 (실패·timeout 시 None → 지표 없음 안내)
+        Stage("indicators", collect_indicators, timeout=120, retries=1, optional=True),
+        Stage("subscribers", get_subscriber_chat_ids, timeout=30, retries=1),
+        Stage("analysis", analysis_stage, deps=("news", "indicators"), timeout=300),
+        Stage("report", report_stage, deps=("news", "indicators", "analysis"), timeout=60),
+        Stage("nav", nav_stage, deps=("report",), timeout=30),
+        # deploy_stage는 오류를 직접 처리하고 exit code를 반환하므로 timeout 없음
+        # (배포가 느려도 실패로 끝나도 텔레그램 전송은 진행)
+        Stage("deploy", deploy_stage, deps=("nav",)),
+        # 전송 시간은 구독자 수 / 전송 속도 제한(30/s)에 비례 (1만 명 ≈ 333s)하므로 timeout 없음
+        Stage("telegram", telegram_stage, deps=("analysis", "report", "subscribers", "deploy")),
+    ]
+
+
+async def main():
+    try:
+        print("🚀 데이터 수집 및 분석 시작...")
+        await run_stages(build_daily_stages())
         print("✅ 모든 작업 완료!")
 
     except Exception as e:
@@ -0,0 +1,80 @@
+"""
+Webhook Queue Worker — WEBHOOK_MODE=queue 로 쌓인 Telegram update를 처리합니다.
+
+api/index.py가 Redis 큐(tg:updates)에 넣은 update를 꺼내 handle_update로 처리하고,
+끝난 작업은 ack합니다. 최대 concurrency건을 동시에 처리합니다.
+
+실행:
+  python worker.py                        # 계속 실행 (큐가 비면 poll-interval마다 확인)
+  python worker.py --once                 # 큐를 비우고 종료
+  python worker.py --concurrency 8
+  python worker.py --recover              # 이전 worker가 처리하다 남긴 작업을 큐로 되돌림
+                                          # (다른 worker가 실행 중이지 않을 때만)
+"""
+
+import argparse
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+from api.index import UPDATE_QUEUE_NAME, handle_update  # noqa: E402
+from lib.job_queue import JobQueue  # noqa: E402
+
+DEFAULT_CONCURRENCY = int(os.getenv("WORKER_CONCURRENCY", "4"))
+DEFAULT_POLL_INTERVAL_SEC = 1.0
+
+
+def _process(queue: JobQueue, raw: str, update: dict, slots: threading.Semaphore) -> None:
+    try:
+        handle_update(update)
+    finally:
+        queue.ack(raw)
+        slots.release()
+
+
+def run(concurrency: int = DEFAULT_CONCURRENCY, poll_interval: float = DEFAULT_POLL_INTERVAL_SEC,
+        once: bool = False, recover: bool = False) -> int:
+    """큐를 처리하고, 처리한 update 수를 반환합니다 (once가 아니면 반환하지 않음)."""
+    queue = JobQueue(UPDATE_QUEUE_NAME)
+    if not queue.is_available():
+        raise SystemExit("Upstash Redis가 설정되지 않아 큐를 사용할 수 없습니다.")
+
+    if recover:
+        print(f"[worker] 처리 중이던 작업 {queue.requeue_processing()}건을 큐로 되돌렸습니다.")
+
+    print(f"[worker] 시작 (concurrency={concurrency}, 대기 {len(queue)}건)")
+    slots = threading.Semaphore(concurrency)
+    processed = 0
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        while True:
+            slots.acquire()
+            claimed = queue.claim()
+            if claimed is None:
+                slots.release()
+                if once:
+                    break
+                time.sleep(poll_interval)
+                continue
+
+            raw, update = claimed
+            processed += 1
+            executor.submit(_process, queue, raw, update, slots)
+
+    print(f"[worker] 종료: {processed}건 처리")
+    return processed
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Telegram webhook 큐 worker")
+    parser.add_argument("--concurrency", type=int, default=DEFAULT_CONCURRENCY, help="동시 처리 수")
+    parser.add_argument("--poll-interval", type=float, default=DEFAULT_POLL_INTERVAL_SEC, help="큐가 비었을 때 확인 주기(초)")
+    parser.add_argument("--once", action="store_true", help="큐를 비우고 종료")
+    parser.add_argument("--recover", action="store_true", help="처리 중 목록의 작업을 큐로 되돌린 뒤 시작")
+    args = parser.parse_args()
+    run(args.concurrency, args.poll_interval, args.once, args.recover)